@@ -1,17 +1,28 @@
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtGui import QPainter, QBrush, QColor
 from PyQt6.QtCore import Qt
-from utils import *
 
 
 class ColoredDisk(QWidget):
+    """
+    Répartition de l'espace d'un disque. Les partitions sont fournies par
+    la fenêtre principale, qui les charge pour tous les disques à la fois.
+    """
+
     def __init__(self, disk, parent=None):
         super().__init__(parent)
         self.disk = disk
         self.capacity = disk.get("capacity_gb", "0")
-        self.free_space = self.calculate_spaces()[0]
-        self.lost_space = self.calculate_spaces()[1]
-        self.used_space = self.calculate_spaces()[2]
+        self.free_space = 0.0
+        self.lost_space = 0.0
+        self.used_space = 0.0
+
+    def set_partitions(self, partitions):
+        self.set_spaces(self.calculate_spaces(partitions or []))
+
+    def set_spaces(self, spaces):
+        self.free_space, self.lost_space, self.used_space = spaces
+        self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -38,9 +49,7 @@ class ColoredDisk(QWidget):
         painter.setBrush(QBrush(QColor("#0c0c23")))
         painter.drawEllipse(center_x, center_y, 200, 200)
 
-    def calculate_spaces(self):
-        partitions = get_partitions_from_disk(self.disk.get("name"))
-
+    def calculate_spaces(self, partitions):
         free_space = 0.0
         lost_space = 0.0
         used_space = 0.0
@@ -13,6 +13,9 @@ import sys
 
 from ColoredDisk import *
 from DiskService import *
+from RequestExecutor import get_executor
+from Instrumentation import install_from_args
+from utils import get_partitions_of_disks
 from file_service.FileTableWidget import FileTableWidget
 
 from partition.PartitionPanel import PartitionPanel
@@ -81,34 +84,55 @@ class DiskAnalysisUI(QWidget):
         """
         )
 
-        disks, error_msg = fetch_disks()
+        self.add_message_tab("Chargement des disques...", "Chargement")
+        get_executor().submit(
+            fetch_disks,
+            key="disks",
+            on_result=self.on_disks_loaded,
+            on_error=lambda message: self.on_disks_loaded((None, message)),
+        )
+
+        return self.tab_widget
+
+    def add_message_tab(self, message, tab_name, color="white"):
+        message_tab = QWidget()
+        layout = QVBoxLayout(message_tab)
+        label = QLabel(message)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet(f"color: {color}; font-size: 14px;")
+        layout.addWidget(label)
+        self.tab_widget.addTab(message_tab, tab_name)
+
+    def on_disks_loaded(self, response):
+        disks, error_msg = response
         self.disks = disks or []
 
+        self.tab_widget.blockSignals(True)
+        while self.tab_widget.count():
+            widget = self.tab_widget.widget(0)
+            self.tab_widget.removeTab(0)
+            widget.deleteLater()
+        self.tab_widget.blockSignals(False)
+
         if error_msg:
-            error_tab = QWidget()
-            layout = QVBoxLayout(error_tab)
-            label = QLabel(f"Erreur lors de la récupération des disques:\n{error_msg}")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setStyleSheet("color: red; font-size: 14px;")
-            layout.addWidget(label)
-            self.tab_widget.addTab(error_tab, "Erreur API")
-            return self.tab_widget
+            self.add_message_tab(
+                f"Erreur lors de la récupération des disques:\n{error_msg}",
+                "Erreur API",
+                "red",
+            )
+            return
 
         if not self.disks:
-            empty_tab = QWidget()
-            layout = QVBoxLayout(empty_tab)
-            label = QLabel("Aucun disque détecté")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setStyleSheet("color: white; font-size: 14px;")
-            layout.addWidget(label)
-            self.tab_widget.addTab(empty_tab, "Aucun disque")
-            return self.tab_widget
+            self.add_message_tab("Aucun disque détecté", "Aucun disque")
+            return
 
+        self.colored_disks = {}
         for disk in self.disks:
             tab = QWidget()
             layout = QVBoxLayout(tab)
 
             colored_disk = ColoredDisk(disk)
+            self.colored_disks[disk.get("name")] = colored_disk
             colored_disk.setFixedSize(260, 260)
             layout.addWidget(colored_disk, alignment=Qt.AlignmentFlag.AlignCenter)
 
@@ -149,6 +173,11 @@ class DiskAnalysisUI(QWidget):
                 }
             """
             )
+            load_button.clicked.connect(
+                lambda checked, name=disk.get("name", "unknown"): (
+                    self.on_load_partitions_clicked(name)
+                )
+            )
             layout.addWidget(load_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
             tab_name = disk.get("name", "Disque ?")
@@ -157,7 +186,18 @@ class DiskAnalysisUI(QWidget):
 
             self.tab_widget.addTab(tab, tab_name)
 
-        return self.tab_widget
+        get_executor().submit(
+            get_partitions_of_disks,
+            list(self.colored_disks),
+            key="disk_spaces",
+            on_result=self.on_disks_partitions,
+        )
+
+    def on_disks_partitions(self, partitions_by_disk):
+        for disk_name, partitions in partitions_by_disk.items():
+            colored_disk = self.colored_disks.get(disk_name)
+            if colored_disk is not None:
+                colored_disk.set_partitions(partitions)
 
     def create_file_table(self):
         panel_table_container = QFrame()
@@ -191,17 +231,6 @@ class DiskAnalysisUI(QWidget):
 
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
 
-        for i in range(self.tab_widget.count()):
-            tab = self.tab_widget.widget(i)
-            for child in tab.findChildren(QPushButton):
-                if child.objectName().startswith("load_button_"):
-                    disk_name = child.objectName().replace("load_button_", "")
-                    child.clicked.connect(
-                        lambda checked, name=disk_name: self.on_load_partitions_clicked(
-                            name
-                        )
-                    )
-
         if hasattr(self, "partition_panel"):
             self.partition_panel.partition_selected.connect(self.on_partition_selected)
 
@@ -245,7 +274,20 @@ class DiskAnalysisUI(QWidget):
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = DiskAnalysisUI()
+    # --trace trace.json et --profile files,partitions (ou DISK_GUI_TRACE
+    # et DISK_GUI_PROFILE) activent l'instrumentation.
+    tracer, argv = install_from_args(sys.argv)
+    app = QApplication(argv)
+
+    if tracer is None:
+        window = DiskAnalysisUI()
+    else:
+        startup = tracer.begin_action("startup")
+        window = tracer.run(startup, "render", DiskAnalysisUI)
+        startup.end()
     window.show()
-    sys.exit(app.exec())
+
+    status = app.exec()
+    if tracer is not None:
+        tracer.finish()
+    sys.exit(status)
@@ -1,13 +1,11 @@
 import requests
 
-API_URL_DISK = "http://localhost:8080/disks"
+from api import get_client, DISKS_ENDPOINT
 
 
 def fetch_disks():
     try:
-        response = requests.get(API_URL_DISK, timeout=5)
-        response.raise_for_status()
-        disks = response.json()
+        disks = get_client().get_json(DISKS_ENDPOINT, timeout=5)
 
         if not isinstance(disks, list):
             return None, "Format de réponse invalide"
@@ -0,0 +1,289 @@
+import argparse
+import cProfile
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+TRACE_ENV = "DISK_GUI_TRACE"
+PROFILE_ENV = "DISK_GUI_PROFILE"
+
+# Au-delà, les événements ne sont plus gardés pour la trace (les totaux
+# restent à jour) : une longue session ne doit pas épuiser la mémoire.
+MAX_EVENTS = 500_000
+
+# Ordre des colonnes du résumé. "queue" est l'attente d'un thread du pool,
+# "work" l'exécution complète de la fonction soumise (requêtes, décodage
+# et construction des objets compris), "render" les callbacks exécutés
+# dans le thread de l'interface, "total" la durée de bout en bout.
+PHASES = ("queue", "work", "request", "decode", "render", "total")
+
+
+class Action:
+    """
+    Une requête soumise à l'exécuteur, de sa soumission à son dernier
+    callback. Son nom est la clé de la requête ("files", "partitions"...)
+    ou, à défaut, le nom de la fonction exécutée.
+    """
+
+    def __init__(self, tracer, name, action_id):
+        self.tracer = tracer
+        self.name = name
+        self.id = action_id
+        self.submitted = time.perf_counter()
+        self.profiles = {}
+
+    def end(self, cancelled=False):
+        self.tracer.async_event("e", self, {"cancelled": cancelled})
+        self.tracer.add_total(self.name, "total", time.perf_counter() - self.submitted)
+        for phase, profile in self.profiles.items():
+            self.tracer.dump_profile(self, phase, profile)
+        self.profiles.clear()
+
+
+class Tracer:
+    """
+    Enregistre la durée des actions de l'interface, découpées en phases,
+    au format Chrome trace (chrome://tracing, https://ui.perfetto.dev).
+
+    Chaque phase est un intervalle sur le thread qui l'exécute ; l'action
+    entière est un intervalle asynchrone qui relie ses phases. Les actions
+    dont le nom figure dans profile (ou toutes si profile contient "all")
+    sont aussi passées sous cProfile, un fichier .prof par phase.
+    """
+
+    def __init__(self, trace_path=None, profile=(), profile_dir=None):
+        self.trace_path = trace_path
+        self.profile = set(profile)
+        self.profile_dir = profile_dir or os.path.dirname(trace_path or "") or "."
+
+        self.origin = time.perf_counter()
+        self.events = []
+        self.dropped = 0
+        self.threads = {}
+        self.totals = {}
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.local = threading.local()
+
+    def timestamp(self, moment):
+        """Horodatage d'une trace : microsecondes depuis le démarrage."""
+        return (moment - self.origin) * 1e6
+
+    def add_event(self, event):
+        thread = threading.current_thread()
+        event["pid"] = os.getpid()
+        event["tid"] = thread.ident
+        with self.lock:
+            self.threads.setdefault(thread.ident, thread.name)
+            if len(self.events) < MAX_EVENTS:
+                self.events.append(event)
+            else:
+                self.dropped += 1
+
+    def add_total(self, action_name, phase, seconds):
+        with self.lock:
+            total = self.totals.setdefault((action_name, phase), [0, 0.0])
+            total[0] += 1
+            total[1] += seconds
+
+    def async_event(self, kind, action, args=None):
+        self.add_event(
+            {
+                "name": action.name,
+                "cat": "action",
+                "ph": kind,
+                "id": action.id,
+                "ts": self.timestamp(time.perf_counter()),
+                "args": args or {},
+            }
+        )
+
+    def begin_action(self, name):
+        action = Action(self, name, next(self.ids))
+        self.async_event("b", action)
+        return action
+
+    @contextmanager
+    def span(self, phase, **args):
+        """
+        Mesure une phase de l'action en cours dans ce thread. Le
+        dictionnaire produit peut être complété (statut, taille...) : il
+        devient les arguments de l'événement.
+        """
+        action = getattr(self.local, "action", None)
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter()
+            name = action.name if action else "-"
+            if action:
+                args = {"action": action.name, "action_id": action.id, **args}
+            self.add_event(
+                {
+                    "name": phase,
+                    "cat": phase,
+                    "ph": "X",
+                    "ts": self.timestamp(start),
+                    "dur": (end - start) * 1e6,
+                    "args": args,
+                }
+            )
+            self.add_total(name, phase, end - start)
+
+    def run(self, action, phase, fn, *args, **kwargs):
+        """Exécute fn comme phase de action, dans le thread courant."""
+        previous = getattr(self.local, "action", None)
+        self.local.action = action
+        try:
+            if phase == "work":
+                self.add_total(action.name, "queue", time.perf_counter() - action.submitted)
+            with self.span(phase):
+                with self.profiled(action, phase):
+                    return fn(*args, **kwargs)
+        finally:
+            self.local.action = previous
+
+    def wrap(self, action, phase, fn):
+        if fn is None:
+            return None
+        return lambda *args, **kwargs: self.run(action, phase, fn, *args, **kwargs)
+
+    def is_profiled(self, action_name):
+        return "all" in self.profile or action_name in self.profile
+
+    @contextmanager
+    def profiled(self, action, phase):
+        """
+        Passe la phase sous cProfile si l'action est profilée. Les
+        callbacks successifs d'une même action (progression d'une
+        recherche...) s'ajoutent au même profil.
+        """
+        if not self.is_profiled(action.name):
+            yield
+            return
+
+        profile = action.profiles.setdefault(phase, cProfile.Profile())
+        try:
+            profile.enable()
+        except ValueError:
+            # Un autre profileur est déjà actif dans ce thread.
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+
+    def dump_profile(self, action, phase, profile):
+        name = re.sub(r"[^\w.-]", "_", action.name)
+        path = os.path.join(self.profile_dir, f"{name}-{action.id}-{phase}.prof")
+        try:
+            profile.dump_stats(path)
+        except OSError as e:
+            print(f"Profil non écrit ({path}) : {e}", file=sys.stderr)
+
+    def summary(self):
+        """Retourne {action: {phase: (nombre, secondes)}}."""
+        with self.lock:
+            totals = dict(self.totals)
+        summary = {}
+        for (action_name, phase), (count, seconds) in totals.items():
+            summary.setdefault(action_name, {})[phase] = (count, seconds)
+        return summary
+
+    def format_summary(self):
+        lines = [
+            f"{'action':<24}{'n':>6}"
+            + "".join(f"{phase + ' ms':>14}" for phase in PHASES)
+        ]
+        for action_name, phases in sorted(self.summary().items()):
+            # Une action encore en cours n'a pas de total.
+            count = phases.get("total", phases.get("work", (1, 0.0)))[0] or 1
+            cells = []
+            for phase in PHASES:
+                _, seconds = phases.get(phase, (0, 0.0))
+                cells.append(f"{seconds * 1000 / count:>14.1f}")
+            lines.append(f"{action_name:<24}{count:>6}" + "".join(cells))
+        lines.append("(durées moyennes par action)")
+        return "\n".join(lines)
+
+    def trace(self):
+        """Document JSON au format Chrome trace."""
+        with self.lock:
+            events = list(self.events)
+            threads = dict(self.threads)
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": ident,
+                "args": {"name": name},
+            }
+            for ident, name in threads.items()
+        ]
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": self.dropped},
+        }
+
+    def write(self, path=None):
+        path = path or self.trace_path
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f)
+        return path
+
+    def finish(self):
+        """Écrit la trace (si un fichier est demandé) et affiche le résumé."""
+        if self.trace_path:
+            try:
+                print(f"Trace écrite dans {self.write()}", file=sys.stderr)
+            except OSError as e:
+                print(f"Trace non écrite : {e}", file=sys.stderr)
+        print(self.format_summary(), file=sys.stderr)
+
+
+_tracer = None
+
+
+def get_tracer():
+    """Retourne le tracer actif, ou None si l'instrumentation est désactivée."""
+    return _tracer
+
+
+def install(trace_path=None, profile=()):
+    """
+    Active l'instrumentation : l'exécuteur de requêtes et le client API
+    partagé enregistrent alors leurs phases.
+    """
+    global _tracer
+    from api import get_client
+
+    _tracer = Tracer(trace_path, profile)
+    get_client().tracer = _tracer
+    return _tracer
+
+
+def install_from_args(argv):
+    """
+    Lit --trace FICHIER et --profile ACTIONS dans argv, ou à défaut les
+    variables DISK_GUI_TRACE et DISK_GUI_PROFILE, et active
+    l'instrumentation si l'une est donnée. Retourne le tracer (ou None) et
+    les arguments restants, destinés à QApplication.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--trace", default=os.environ.get(TRACE_ENV))
+    parser.add_argument("--profile", default=os.environ.get(PROFILE_ENV))
+    args, remaining = parser.parse_known_args(argv[1:])
+
+    profile = [name.strip() for name in (args.profile or "").split(",") if name.strip()]
+    if not args.trace and not profile:
+        return None, argv
+    return install(args.trace, profile), argv[:1] + remaining
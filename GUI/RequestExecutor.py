@@ -0,0 +1,198 @@
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+from Instrumentation import get_tracer
+
+
+class WorkerSignals(QObject):
+    """
+    Signaux émis par un Worker depuis le thread du pool.
+    """
+
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(object)
+    finished = pyqtSignal()
+
+
+class Worker(QRunnable):
+    """
+    Exécute une fonction bloquante (appel API) dans le QThreadPool.
+    """
+
+    def __init__(self, fn, args, kwargs, with_progress=False):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.signals = WorkerSignals()
+        self.setAutoDelete(False)
+
+        if with_progress:
+            self.kwargs["progress_callback"] = self.signals.progress.emit
+            self.kwargs["is_cancelled"] = self.is_cancelled
+
+    def cancel(self):
+        self.cancelled = True
+
+    def is_cancelled(self):
+        return self.cancelled
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+class _Dispatcher(QObject):
+    """
+    Reçoit les signaux d'un Worker dans le thread de l'interface et appelle
+    les callbacks, sauf si la requête a été annulée entre-temps.
+    """
+
+    def __init__(self, worker, on_result, on_error, on_progress, on_finished, done):
+        super().__init__()
+        self.worker = worker
+        self.on_result = on_result
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_finished = on_finished
+        self.done = done
+
+        worker.signals.result.connect(self.handle_result)
+        worker.signals.error.connect(self.handle_error)
+        worker.signals.progress.connect(self.handle_progress)
+        worker.signals.finished.connect(self.handle_finished)
+
+    @pyqtSlot(object)
+    def handle_result(self, result):
+        if not self.worker.cancelled and self.on_result:
+            self.on_result(result)
+
+    @pyqtSlot(str)
+    def handle_error(self, message):
+        if not self.worker.cancelled and self.on_error:
+            self.on_error(message)
+
+    @pyqtSlot(object)
+    def handle_progress(self, value):
+        if not self.worker.cancelled and self.on_progress:
+            self.on_progress(value)
+
+    @pyqtSlot()
+    def handle_finished(self):
+        self.done(self)
+        if not self.worker.cancelled and self.on_finished:
+            self.on_finished()
+
+
+class RequestExecutor(QObject):
+    """
+    Exécute les appels API hors du thread principal de Qt.
+
+    Chaque requête peut être associée à une clé : soumettre une nouvelle
+    requête avec la même clé annule la précédente, dont le résultat est alors
+    ignoré (par exemple un double-clic sur un autre dossier avant la fin du
+    listing en cours).
+    """
+
+    def __init__(self, max_threads=None, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool()
+        if max_threads:
+            self.pool.setMaxThreadCount(max_threads)
+
+        self._current = {}
+        self._pending = set()
+
+    def submit(
+        self,
+        fn,
+        *args,
+        key=None,
+        on_result=None,
+        on_error=None,
+        on_progress=None,
+        on_finished=None,
+        detached=False,
+        **kwargs,
+    ):
+        """
+        Lance fn(*args, **kwargs) dans le pool et retourne le Worker.
+        Si on_progress est fourni, fn reçoit aussi les arguments nommés
+        progress_callback et is_cancelled. detached=True l'exécute dans
+        un thread démon à part : une connexion qui reste ouverte n'occupe
+        pas le pool et ne retarde pas la fermeture de l'application.
+
+        Si l'instrumentation est active, la requête est tracée comme une
+        action : fn en phase "work", les callbacks en phase "render".
+        """
+        if key is not None:
+            self.cancel(key)
+
+        done = lambda d: self._on_finished(key, d)
+        tracer = get_tracer()
+        if tracer is not None:
+            action = tracer.begin_action(key or getattr(fn, "__qualname__", "requête"))
+            fn = tracer.wrap(action, "work", fn)
+            on_result, on_error, on_progress, on_finished = (
+                tracer.wrap(action, "render", callback)
+                for callback in (on_result, on_error, on_progress, on_finished)
+            )
+            done = lambda d: (self._on_finished(key, d), action.end(d.worker.cancelled))
+
+        worker = Worker(fn, args, kwargs, with_progress=on_progress is not None)
+        dispatcher = _Dispatcher(
+            worker,
+            on_result,
+            on_error,
+            on_progress,
+            on_finished,
+            done,
+        )
+
+        self._pending.add(dispatcher)
+        if key is not None:
+            self._current[key] = worker
+
+        if detached:
+            threading.Thread(target=worker.run, daemon=True).start()
+        else:
+            self.pool.start(worker)
+        return worker
+
+    def cancel(self, key):
+        worker = self._current.pop(key, None)
+        if worker is not None:
+            worker.cancel()
+
+    def cancel_all(self):
+        for key in list(self._current):
+            self.cancel(key)
+
+    def is_running(self, key):
+        return key in self._current
+
+    def _on_finished(self, key, dispatcher):
+        self._pending.discard(dispatcher)
+        if key is not None and self._current.get(key) is dispatcher.worker:
+            del self._current[key]
+
+
+_executor = None
+
+
+def get_executor():
+    """Retourne l'exécuteur partagé par l'interface."""
+    global _executor
+    if _executor is None:
+        _executor = RequestExecutor()
+    return _executor
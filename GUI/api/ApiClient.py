@@ -0,0 +1,249 @@
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .ResponseCache import ResponseCache
+
+SERVER_IP = os.environ.get("DISK_API_HOST", "localhost")
+SERVER_PORT = int(os.environ.get("DISK_API_PORT", "8080"))
+PROTOCOL = os.environ.get("DISK_API_PROTOCOL", "http")
+
+DISKS_ENDPOINT = "/disks"
+PARTITIONS_ENDPOINT = "/partitions"
+FILES_ENDPOINT = "/files"
+FILE_INFO_ENDPOINT = "/files/info"
+BLOCKS_ENDPOINT = "/blocks"
+SEARCH_ENDPOINT = "/search"
+INDEX_ENDPOINT = "/index"
+INDEX_QUERY_ENDPOINT = "/index/query"
+BATCH_ENDPOINT = "/batch"
+DU_ENDPOINT = "/du"
+WATCH_ENDPOINT = "/watch"
+SECTORS_ENDPOINT = "/sectors"
+
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 30
+RETRIES = 3
+BACKOFF_FACTOR = 0.3
+POOL_SIZE = 10
+
+
+class LatencyStats:
+    """
+    Compteurs de latence pour un endpoint de l'API.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, elapsed, failed=False):
+        self.count += 1
+        if failed:
+            self.errors += 1
+        self.total += elapsed
+        self.last = elapsed
+        self.max = max(self.max, elapsed)
+        self.min = elapsed if self.min is None else min(self.min, elapsed)
+
+    @property
+    def average(self):
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_s": self.total,
+            "avg_s": self.average,
+            "min_s": self.min or 0.0,
+            "max_s": self.max,
+            "last_s": self.last,
+        }
+
+
+class ApiClient:
+    """
+    Client HTTP partagé par tous les services de l'interface.
+    Garde les connexions ouvertes (keep-alive) dans un pool, applique les
+    timeouts et les tentatives avec backoff, et mesure la latence de chaque
+    requête par endpoint.
+
+    Si tracer est fourni (voir Instrumentation), chaque requête et chaque
+    décodage JSON y sont enregistrés comme phases "request" et "decode".
+    """
+
+    def __init__(
+        self,
+        host=SERVER_IP,
+        port=SERVER_PORT,
+        protocol=PROTOCOL,
+        connect_timeout=CONNECT_TIMEOUT,
+        read_timeout=READ_TIMEOUT,
+        retries=RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        pool_size=POOL_SIZE,
+        cache_responses=True,
+        tracer=None,
+    ):
+        self.base_url = f"{protocol}://{host}:{port}"
+        self.timeout = (connect_timeout, read_timeout)
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Un parcours en masse ne revient pas sur ses pas : garder les
+        # réponses ne ferait qu'occuper de la mémoire.
+        self.cache = ResponseCache() if cache_responses else None
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        self.tracer = tracer
+
+    def span(self, phase, **args):
+        """Phase mesurée par le tracer ; ne fait rien sans tracer."""
+        if self.tracer is None:
+            return nullcontext(args)
+        return self.tracer.span(phase, **args)
+
+    def url(self, endpoint):
+        return f"{self.base_url}{endpoint}"
+
+    def get(self, endpoint, params=None, timeout=None, **kwargs):
+        """Envoie un GET et lève une exception requests en cas d'échec."""
+        return self.request("GET", endpoint, params, timeout, **kwargs)
+
+    def post(self, endpoint, params=None, timeout=None, **kwargs):
+        """Envoie un POST (jamais retenté automatiquement)."""
+        return self.request("POST", endpoint, params, timeout, **kwargs)
+
+    def request(self, method, endpoint, params=None, timeout=None, **kwargs):
+        """
+        Les GET non streamés sont conditionnels : si une réponse avec ETag
+        est en cache, If-None-Match est envoyé et un 304 la renvoie.
+        """
+        cache_key = cached = None
+        if self.cache is not None and method == "GET" and not kwargs.get("stream"):
+            cache_key = ResponseCache.key(endpoint, params)
+            cached = self.cache.lookup(cache_key)
+            if cached:
+                kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
+
+        start = time.perf_counter()
+        failed = True
+        try:
+            with self.span("request", endpoint=endpoint, method=method) as span:
+                response = self.session.request(
+                    method,
+                    self.url(endpoint),
+                    params=params,
+                    timeout=timeout or self.timeout,
+                    **kwargs,
+                )
+                span["status"] = response.status_code
+                if not kwargs.get("stream"):
+                    span["bytes"] = len(response.content)
+            if cached and response.status_code == 304:
+                failed = False
+                return self.cache.revalidated(cache_key, cached)
+
+            response.raise_for_status()
+            if cache_key is not None:
+                self.cache.store(cache_key, response)
+            failed = False
+            return response
+        finally:
+            self._record(endpoint, time.perf_counter() - start, failed)
+
+    def get_json(self, endpoint, params=None, timeout=None):
+        response = self.get(endpoint, params=params, timeout=timeout)
+        with self.span("decode", endpoint=endpoint):
+            return response.json()
+
+    def batch(self, calls, timeout=None):
+        """
+        Envoie plusieurs GET en un seul aller-retour via /batch ; le
+        serveur les exécute en parallèle. calls est une liste de couples
+        (endpoint, params). Retourne, dans le même ordre, des couples
+        (statut HTTP, corps JSON) : l'échec d'un appel n'interrompt pas
+        les autres.
+        """
+        requests_body = [
+            {
+                "path": endpoint,
+                "params": {name: str(value) for name, value in (params or {}).items()},
+            }
+            for endpoint, params in calls
+        ]
+        response = self.post(BATCH_ENDPOINT, json={"requests": requests_body}, timeout=timeout)
+        with self.span("decode", endpoint=BATCH_ENDPOINT):
+            results = response.json().get("responses", [])
+        return [(result.get("status", 0), result.get("body")) for result in results]
+
+    def _record(self, endpoint, elapsed, failed):
+        with self._stats_lock:
+            stats = self._stats.get(endpoint)
+            if stats is None:
+                stats = self._stats[endpoint] = LatencyStats()
+            stats.record(elapsed, failed)
+
+    def stats(self):
+        with self._stats_lock:
+            return {endpoint: s.as_dict() for endpoint, s in self._stats.items()}
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats.clear()
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Retourne le client partagé, créé à la première utilisation."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ApiClient()
+        return _client
+
+
+def batch(calls, timeout=None):
+    """Raccourci vers get_client().batch(calls)."""
+    return get_client().batch(calls, timeout=timeout)
+
+
+def configure(**kwargs):
+    """Remplace le client partagé (hôte, port, protocole, timeouts...)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = ApiClient(**kwargs)
+        return _client
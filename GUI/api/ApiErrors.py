@@ -0,0 +1,65 @@
+import requests
+
+
+class ApiError(Exception):
+    """
+    Erreur d'un appel à l'API. endpoint est la route appelée et status le
+    code HTTP de la réponse, s'il y en a eu une.
+    """
+
+    def __init__(self, message, endpoint=None, status=None):
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.status = status
+
+
+class ApiConnectionError(ApiError):
+    """Le serveur est injoignable ou la connexion a été coupée."""
+
+
+class ApiTimeoutError(ApiConnectionError):
+    """Le serveur n'a pas répondu à temps."""
+
+
+class ApiStatusError(ApiError):
+    """Le serveur a répondu par une erreur ; le message est celui du serveur."""
+
+
+class BadRequestError(ApiStatusError):
+    """Paramètres refusés (400) : partition non montée, filtre invalide..."""
+
+
+class NotFoundError(ApiStatusError):
+    """Fichier ou dossier introuvable (404)."""
+
+
+class ServerError(ApiStatusError):
+    """Erreur interne du serveur (5xx)."""
+
+
+def status_error(endpoint, status, body):
+    """Construit l'ApiStatusError correspondant à un code HTTP et à son corps."""
+    message = body.get("error") if isinstance(body, dict) else None
+    message = message or f"Erreur HTTP {status}"
+    if status == 400:
+        return BadRequestError(message, endpoint, status)
+    if status == 404:
+        return NotFoundError(message, endpoint, status)
+    if status >= 500:
+        return ServerError(message, endpoint, status)
+    return ApiStatusError(message, endpoint, status)
+
+
+def api_error(error, endpoint=None):
+    """Convertit une exception requests en ApiError."""
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        try:
+            body = error.response.json()
+        except ValueError:
+            body = None
+        return status_error(endpoint, error.response.status_code, body)
+    if isinstance(error, requests.exceptions.Timeout):
+        return ApiTimeoutError(f"Délai dépassé : {error}", endpoint)
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return ApiConnectionError(f"Serveur injoignable : {error}", endpoint)
+    return ApiError(str(error), endpoint)
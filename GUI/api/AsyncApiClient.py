@@ -0,0 +1,299 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .ApiClient import (
+    ApiClient,
+    DISKS_ENDPOINT,
+    PARTITIONS_ENDPOINT,
+    FILES_ENDPOINT,
+    FILE_INFO_ENDPOINT,
+    BLOCKS_ENDPOINT,
+    SEARCH_ENDPOINT,
+    SECTORS_ENDPOINT,
+)
+from .ApiErrors import ApiError, api_error, status_error
+from .BlockBuffer import BlockBuffer
+from .Models import Disk, Partition, FileInfo
+
+DEFAULT_CONCURRENCY = 16
+LISTING_PAGE_SIZE = 1000
+# Champs suffisant à parcourir une arborescence : aucun stat côté serveur.
+WALK_FIELDS = "name,type"
+STREAM_QUEUE_SIZE = 1024
+
+_DONE = object()
+
+
+def join_path(directory, name):
+    return f"{directory}/{name}" if directory else name
+
+
+def fields_param(fields):
+    if fields is None or isinstance(fields, str):
+        return fields
+    return ",".join(fields)
+
+
+class AsyncApiClient:
+    """
+    Client asyncio de l'API, sans dépendance à PyQt, pour les scripts qui
+    analysent de nombreuses partitions.
+
+    Les requêtes passent par un ApiClient (connexions keep-alive,
+    tentatives) exécuté dans un pool de threads. Au plus `concurrency`
+    requêtes sont en cours à la fois : assez pour occuper le serveur, qui
+    lit les dossiers en parallèle, sans le submerger. Les échecs sont
+    levés en ApiError (voir ApiErrors).
+
+        async with AsyncApiClient(concurrency=32) as api:
+            for disk in await api.disks():
+                ...
+            async for directory, files in api.walk("/dev/sda1"):
+                ...
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, client=None, **client_kwargs):
+        self.concurrency = concurrency
+        self.client = client or ApiClient(
+            pool_size=concurrency, cache_responses=False, **client_kwargs
+        )
+        self._owns_client = client is None
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="async-api"
+        )
+        self._limiter = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._owns_client:
+            self.client.close()
+
+    async def _run(self, endpoint, fn, *args):
+        async with self._limiter:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(self._executor, fn, *args)
+            except requests.exceptions.RequestException as e:
+                raise api_error(e, endpoint) from e
+
+    async def get_json(self, endpoint, params=None):
+        """GET brut sur n'importe quelle route ; retourne le JSON décodé."""
+        return await self._run(endpoint, self.client.get_json, endpoint, params)
+
+    async def disks(self):
+        return [Disk.from_json(disk) for disk in await self.get_json(DISKS_ENDPOINT) or []]
+
+    async def partitions(self, disk):
+        partitions = await self.get_json(PARTITIONS_ENDPOINT, {"disk": disk})
+        return [Partition.from_json(partition) for partition in partitions or []]
+
+    async def partitions_of(self, disks):
+        """
+        Partitions de plusieurs disques en une seule requête /batch.
+        Retourne {disque: [Partition]}.
+        """
+        disks = list(disks)
+        calls = [(PARTITIONS_ENDPOINT, {"disk": disk}) for disk in disks]
+        results = await self._run(PARTITIONS_ENDPOINT, self.client.batch, calls)
+
+        partitions = {}
+        for disk, (status, body) in zip(disks, results):
+            if status != 200:
+                raise status_error(PARTITIONS_ENDPOINT, status, body)
+            partitions[disk] = [Partition.from_json(partition) for partition in body or []]
+        return partitions
+
+    async def files(self, partition, path="", fields=None, page_size=LISTING_PAGE_SIZE, **filters):
+        """
+        Itère sur les entrées du dossier, triées par nom, page par page ;
+        la page suivante est demandée pendant que la courante est lue.
+        filters accepte les paramètres de /files (filter, ext, glob...).
+        """
+        params = {"partition": partition, "path": path, "limit": page_size, **filters}
+        if fields:
+            params["fields"] = fields_param(fields)
+
+        page = await self.get_json(FILES_ENDPOINT, params)
+        while True:
+            cursor = page.get("next_cursor")
+            following = None
+            if cursor:
+                following = asyncio.ensure_future(
+                    self.get_json(FILES_ENDPOINT, {**params, "cursor": cursor})
+                )
+            try:
+                for entry in page.get("files") or []:
+                    yield FileInfo.from_json(entry)
+            except BaseException:
+                # Le consommateur s'arrête avant la fin : la page suivante
+                # n'est plus attendue.
+                if following is not None:
+                    following.cancel()
+                raise
+            if following is None:
+                return
+            page = await following
+
+    async def list_files(self, partition, path="", fields=None, **filters):
+        """Toutes les entrées du dossier, dans une liste."""
+        return [file async for file in self.files(partition, path, fields, **filters)]
+
+    async def file_info(self, partition, path):
+        info = await self.get_json(FILE_INFO_ENDPOINT, {"partition": partition, "path": path})
+        return FileInfo.from_json(info)
+
+    async def blocks(self, partition, path, offset=0, count=None):
+        """Blocs [offset, offset + count) du fichier, en binaire."""
+        params = {"partition": partition, "path": path, "offset": offset, "format": "raw"}
+        if count:
+            params["count"] = count
+
+        def fetch():
+            return BlockBuffer.from_response(self.client.get(BLOCKS_ENDPOINT, params=params))
+
+        return await self._run(BLOCKS_ENDPOINT, fetch)
+
+    async def sectors(self, device=None, image=None, offset=0, count=1, sector_size=None):
+        """
+        Secteurs bruts [offset, offset + count) d'un disque, d'une
+        partition ou d'une image disque, lus sans rien monter. Retourne
+        (octets, taille de secteur).
+        """
+        params = {"offset": offset, "count": count, "format": "raw"}
+        if device:
+            params["device"] = device
+        if image:
+            params["image"] = image
+        if sector_size:
+            params["sector_size"] = sector_size
+
+        def fetch():
+            response = self.client.get(SECTORS_ENDPOINT, params=params)
+            return response.content, int(response.headers.get("X-Sector-Size", 512))
+
+        return await self._run(SECTORS_ENDPOINT, fetch)
+
+    async def search(self, partition, path="", **filters):
+        """
+        Recherche récursive via /search : les résultats sont produits au fil
+        du parcours. filters accepte les paramètres de /search (glob,
+        min_size, type, limit...).
+        """
+        params = {"partition": partition, "path": path, **filters}
+        async for entry in self._stream_lines(SEARCH_ENDPOINT, params):
+            if entry.get("done"):
+                return
+            yield FileInfo.from_json(entry)
+
+    async def walk(self, partition, path="", fields=WALK_FIELDS, max_depth=None, on_error=None):
+        """
+        Parcourt l'arborescence depuis path en listant les dossiers en
+        parallèle, dans la limite de concurrency. Produit des couples
+        (chemin du dossier, [FileInfo]) dans l'ordre où les listings
+        arrivent. Les liens symboliques ne sont pas suivis.
+
+        Un dossier illisible lève son ApiError, sauf si on_error est
+        fourni : il est alors appelé avec (chemin, erreur) et le parcours
+        continue.
+        """
+        results = asyncio.Queue()
+        tasks = set()
+
+        async def list_dir(directory, depth):
+            try:
+                files = await self.list_files(partition, directory, fields)
+            except ApiError as e:
+                await results.put((directory, depth, None, e))
+            else:
+                await results.put((directory, depth, files, None))
+
+        def spawn(directory, depth):
+            task = asyncio.ensure_future(list_dir(directory, depth))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        spawn(path, 0)
+        outstanding = 1
+        try:
+            while outstanding:
+                directory, depth, files, error = await results.get()
+                outstanding -= 1
+                if error is not None:
+                    if on_error is None:
+                        raise error
+                    on_error(directory, error)
+                    continue
+
+                if max_depth is None or depth < max_depth:
+                    for file in files:
+                        if file.is_dir:
+                            spawn(join_path(directory, file.name), depth + 1)
+                            outstanding += 1
+                yield directory, files
+        finally:
+            for task in list(tasks):
+                task.cancel()
+
+    async def _stream_lines(self, endpoint, params):
+        """
+        Lit une réponse NDJSON dans un thread du pool et transmet les lignes
+        par une file bornée : un consommateur lent ralentit la lecture au
+        lieu d'accumuler les résultats en mémoire.
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+
+        def put(item):
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def produce():
+            try:
+                response = self.client.get(
+                    endpoint,
+                    params=params,
+                    timeout=(self.client.timeout[0], None),
+                    stream=True,
+                )
+                with response:
+                    for line in response.iter_lines():
+                        if stop.is_set():
+                            return
+                        if line:
+                            put(json.loads(line))
+            except requests.exceptions.RequestException as e:
+                put(api_error(e, endpoint))
+            except ValueError as e:
+                put(ApiError(f"Réponse invalide : {e}", endpoint))
+            except Exception as e:
+                put(e)
+            finally:
+                if not stop.is_set():
+                    put(_DONE)
+
+        async with self._limiter:
+            loop.run_in_executor(self._executor, produce)
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is _DONE:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                # Libère un producteur bloqué sur la file pleine ; il
+                # s'arrête à la ligne suivante.
+                stop.set()
+                while not queue.empty():
+                    queue.get_nowait()
@@ -0,0 +1,51 @@
+BLOCK_SIZE = 512
+
+
+class BlockBuffer:
+    """
+    Fenêtre de blocs reçue en binaire depuis /blocks?format=raw.
+
+    Les octets ne sont jamais recopiés : chaque bloc est une tranche
+    (memoryview) du tampon reçu, et seul ce qui est affiché est converti en
+    hexadécimal.
+    """
+
+    def __init__(
+        self, data, offset=0, total_blocks=None, block_size=BLOCK_SIZE, file_size=None
+    ):
+        self.data = data
+        self.view = memoryview(data)
+        self.offset = offset
+        self.block_size = block_size
+        self.count = (len(data) + block_size - 1) // block_size
+        self.total_blocks = offset + self.count if total_blocks is None else total_blocks
+        self.file_size = (
+            self.total_blocks * block_size if file_size is None else file_size
+        )
+
+    @classmethod
+    def from_response(cls, response):
+        headers = response.headers
+        return cls(
+            response.content,
+            offset=int(headers.get("X-Block-Offset", 0)),
+            total_blocks=int(headers.get("X-Total-Blocks", 0)),
+            block_size=int(headers.get("X-Block-Size", BLOCK_SIZE)),
+            file_size=int(headers.get("X-File-Size", 0)),
+        )
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, block_id):
+        return self.offset <= block_id < self.offset + self.count
+
+    def block(self, block_id):
+        """Retourne le bloc block_id (numéro absolu) sous forme de memoryview."""
+        if block_id not in self:
+            raise IndexError(f"Bloc {block_id} hors de la fenêtre chargée")
+        start = (block_id - self.offset) * self.block_size
+        return self.view[start : start + self.block_size]
+
+    def hex(self, block_id):
+        return self.block(block_id).hex()
@@ -0,0 +1,105 @@
+from datetime import datetime
+
+from .ApiClient import get_client, INDEX_ENDPOINT, INDEX_QUERY_ENDPOINT
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class MetadataIndex:
+    """
+    Accès à l'index des métadonnées d'une partition (/index).
+
+    L'index est construit par le serveur en arrière-plan puis rafraîchi de
+    façon incrémentale ; les requêtes y répondent sans parcourir le disque.
+    """
+
+    def __init__(self, client=None):
+        self.client = client
+
+    def _client(self):
+        return self.client or get_client()
+
+    def refresh(self, partition):
+        """Lance (ou relance) l'indexation et retourne l'état de l'index."""
+        return self._client().post(INDEX_ENDPOINT, params={"partition": partition}).json()
+
+    def status(self, partition):
+        return self._client().get_json(INDEX_ENDPOINT, params={"partition": partition})
+
+    def query(
+        self,
+        partition,
+        path=None,
+        filter=None,
+        ext=None,
+        glob=None,
+        regex=None,
+        case_sensitive=False,
+        type=None,
+        min_size=None,
+        max_size=None,
+        min_mtime=None,
+        max_mtime=None,
+        sort=None,
+        descending=False,
+        limit=None,
+    ):
+        """
+        Interroge l'index. ext accepte une liste ou "png,jpg" ; les dates
+        acceptent un datetime ou une chaîne "AAAA-MM-JJ[ HH:MM:SS]".
+        Retourne {"partition", "updated_at", "total_matches", "files"}.
+        """
+        if isinstance(ext, (list, tuple, set)):
+            ext = ",".join(ext)
+
+        params = {
+            "partition": partition,
+            "path": path,
+            "filter": filter,
+            "ext": ext,
+            "glob": glob,
+            "regex": regex,
+            "case": "sensitive" if case_sensitive else None,
+            "type": type,
+            "min_size": min_size,
+            "max_size": max_size,
+            "min_mtime": _format_date(min_mtime),
+            "max_mtime": _format_date(max_mtime),
+            "sort": sort,
+            "order": "desc" if descending else None,
+            "limit": limit,
+        }
+        params = {key: value for key, value in params.items() if value is not None}
+        return self._client().get_json(INDEX_QUERY_ENDPOINT, params=params)
+
+    def largest_files(self, partition, count=20, min_size=None):
+        return self.query(
+            partition,
+            type="file",
+            min_size=min_size,
+            sort="size",
+            descending=True,
+            limit=count,
+        )["files"]
+
+    def modified_since(self, partition, since, limit=None):
+        return self.query(
+            partition, min_mtime=since, sort="mtime", descending=True, limit=limit
+        )["files"]
+
+
+def _format_date(value):
+    if isinstance(value, datetime):
+        return value.strftime(DATE_FORMAT)
+    return value
+
+
+_index = None
+
+
+def get_metadata_index():
+    """Retourne l'accès partagé à l'index des métadonnées."""
+    global _index
+    if _index is None:
+        _index = MetadataIndex()
+    return _index
@@ -0,0 +1,71 @@
+from dataclasses import dataclass, fields
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def field_names(cls):
+    return frozenset(field.name for field in fields(cls))
+
+
+class Model:
+    """
+    Base des modèles renvoyés par AsyncApiClient : from_json ignore les
+    clés inconnues, un serveur plus récent reste donc lisible.
+    """
+
+    @classmethod
+    def from_json(cls, data):
+        names = field_names(cls)
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+
+@dataclass(frozen=True)
+class Disk(Model):
+    name: str
+    capacity_gb: float = 0.0
+
+
+@dataclass(frozen=True)
+class Partition(Model):
+    name: str
+    fs_type: str = ""
+    mount_point: str = ""
+    size: str = ""
+    fs_size: str = ""
+    fs_used: str = ""
+    uuid: str = ""
+    part_type_name: str = ""
+    part_number: object = None
+    physical_sector_size: object = None
+    logical_sector_size: object = None
+
+    @property
+    def mounted(self):
+        return bool(self.mount_point)
+
+
+@dataclass(frozen=True)
+class FileInfo(Model):
+    """
+    Entrée de /files ou de /search. Les champs non demandés (paramètre
+    fields) restent à None ; path n'est renseigné que par une recherche.
+    """
+
+    name: str
+    type: str = None
+    is_symlink: bool = None
+    size_bytes: int = None
+    permissions: str = None
+    hard_links: int = None
+    inode: int = None
+    owner_uid: int = None
+    owner_gid: int = None
+    block_size: int = None
+    blocks_allocated: int = None
+    last_modified: str = None
+    last_access: str = None
+    path: str = None
+
+    @property
+    def is_dir(self):
+        return self.type == "directory"
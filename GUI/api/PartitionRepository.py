@@ -0,0 +1,137 @@
+import threading
+import time
+
+import requests
+
+from .ApiClient import get_client, PARTITIONS_ENDPOINT
+
+PARTITIONS_TTL = 60
+
+
+class PartitionRepository:
+    """
+    Cache client des partitions de chaque disque.
+
+    La route /partitions monte les partitions et lance lsblk côté serveur :
+    ColoredDisk, PartitionService et PartitionPresenter partagent donc ce
+    dépôt pour n'émettre qu'une requête par disque tant que l'entrée est
+    valide (TTL) ou jusqu'à une invalidation explicite. Les appels
+    concurrents pour un même disque attendent la même requête.
+    """
+
+    def __init__(self, client=None, ttl=PARTITIONS_TTL):
+        self.client = client
+        self.ttl = ttl
+        self._entries = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get(self, disk_name, max_age=None):
+        """
+        Retourne la liste des partitions (dicts) du disque.
+        Lève une exception requests si l'API est injoignable.
+        """
+        max_age = self.ttl if max_age is None else max_age
+
+        while True:
+            with self._lock:
+                entry = self._entries.get(disk_name)
+                if entry and time.monotonic() - entry[0] < max_age:
+                    return self._copy(entry[1])
+
+                event = self._inflight.get(disk_name)
+                if event is None:
+                    event = self._inflight[disk_name] = threading.Event()
+                    break
+
+            event.wait()
+            with self._lock:
+                entry = self._entries.get(disk_name)
+                if entry:
+                    return self._copy(entry[1])
+            # La requête attendue a échoué : on réessaie nous-mêmes.
+
+        try:
+            client = self.client or get_client()
+            partitions = client.get_json(PARTITIONS_ENDPOINT, params={"disk": disk_name})
+            self.put(disk_name, partitions)
+            return self._copy(partitions)
+        finally:
+            with self._lock:
+                del self._inflight[disk_name]
+            event.set()
+
+    def get_many(self, disk_names, max_age=None):
+        """
+        Retourne {disque: partitions} pour plusieurs disques. Ceux qui ne
+        sont pas en cache sont demandés ensemble, en un seul appel /batch ;
+        les disques dont la requête a échoué sont absents du résultat. Lève
+        une exception requests si l'appel /batch lui-même échoue.
+        """
+        max_age = self.ttl if max_age is None else max_age
+
+        results = {}
+        missing = []
+        with self._lock:
+            for disk_name in disk_names:
+                entry = self._entries.get(disk_name)
+                if entry and time.monotonic() - entry[0] < max_age:
+                    results[disk_name] = self._copy(entry[1])
+                elif disk_name not in self._inflight:
+                    self._inflight[disk_name] = threading.Event()
+                    missing.append(disk_name)
+
+        try:
+            if missing:
+                client = self.client or get_client()
+                responses = client.batch(
+                    [(PARTITIONS_ENDPOINT, {"disk": disk_name}) for disk_name in missing]
+                )
+                for disk_name, (status, partitions) in zip(missing, responses):
+                    if status == 200:
+                        self.put(disk_name, partitions)
+                        results[disk_name] = self._copy(partitions)
+        finally:
+            with self._lock:
+                events = [self._inflight.pop(disk_name) for disk_name in missing]
+            for event in events:
+                event.set()
+
+        # Disques déjà demandés par un autre appel : on attend sa réponse.
+        for disk_name in disk_names:
+            if disk_name not in results and disk_name not in missing:
+                try:
+                    results[disk_name] = self.get(disk_name, max_age)
+                except requests.exceptions.RequestException:
+                    pass
+        return results
+
+    def put(self, disk_name, partitions):
+        with self._lock:
+            self._entries[disk_name] = (time.monotonic(), partitions)
+
+    def invalidate(self, disk_name=None):
+        with self._lock:
+            if disk_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(disk_name, None)
+
+    @staticmethod
+    def _copy(partitions):
+        if not isinstance(partitions, list):
+            return partitions
+        return [dict(partition) for partition in partitions]
+
+
+_repository = None
+_repository_lock = threading.Lock()
+
+
+def get_partition_repository():
+    """Retourne le dépôt de partitions partagé."""
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = PartitionRepository()
+        return _repository
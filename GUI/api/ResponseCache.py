@@ -0,0 +1,79 @@
+import threading
+from collections import OrderedDict
+
+MAX_CACHED_RESPONSES = 256
+MAX_CACHED_BYTES = 64 * 1024**2
+
+
+class ResponseCache:
+    """
+    Cache des réponses GET portant un ETag, pour les requêtes
+    conditionnelles : la requête suivante envoie If-None-Match, et une
+    réponse 304 (sans corps) est remplacée par la réponse gardée.
+
+    Le cache est borné en nombre de réponses et en octets (LRU).
+    """
+
+    def __init__(self, max_entries=MAX_CACHED_RESPONSES, max_bytes=MAX_CACHED_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint, params):
+        return endpoint, tuple(sorted((name, str(value)) for name, value in (params or {}).items()))
+
+    def lookup(self, key):
+        """Retourne (etag, réponse) si une réponse est gardée pour key."""
+        with self._lock:
+            return self.entries.get(key)
+
+    def revalidated(self, key, entry):
+        """Le serveur a répondu 304 : la réponse gardée reste valable."""
+        with self._lock:
+            self.hits += 1
+            if key not in self.entries:
+                self._insert(key, entry)
+            self.entries.move_to_end(key)
+        return entry[1]
+
+    def store(self, key, response):
+        etag = response.headers.get("ETag")
+        with self._lock:
+            self._remove(key)
+            if not etag:
+                return
+            self.misses += 1
+            if len(response.content) <= self.max_bytes:
+                self._insert(key, (etag, response))
+
+    def _insert(self, key, entry):
+        self.entries[key] = entry
+        self.size += len(entry[1].content)
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self.entries)))
+
+    def _remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1].content)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
@@ -0,0 +1,75 @@
+# Ce fichier permet de transformer le répertoire en package Python
+# Il regroupe l'accès à l'API Go, sans dépendance à PyQt
+
+# Exposer les classes publiques pour faciliter l'import
+from .ApiClient import (
+    ApiClient,
+    LatencyStats,
+    get_client,
+    configure,
+    batch,
+    DISKS_ENDPOINT,
+    PARTITIONS_ENDPOINT,
+    FILES_ENDPOINT,
+    FILE_INFO_ENDPOINT,
+    BLOCKS_ENDPOINT,
+    SEARCH_ENDPOINT,
+    INDEX_ENDPOINT,
+    INDEX_QUERY_ENDPOINT,
+    BATCH_ENDPOINT,
+    DU_ENDPOINT,
+    WATCH_ENDPOINT,
+    SECTORS_ENDPOINT,
+)
+from .ApiErrors import (
+    ApiError,
+    ApiConnectionError,
+    ApiTimeoutError,
+    ApiStatusError,
+    BadRequestError,
+    NotFoundError,
+    ServerError,
+)
+from .Models import Disk, Partition, FileInfo
+from .AsyncApiClient import AsyncApiClient
+from .PartitionRepository import PartitionRepository, get_partition_repository
+from .BlockBuffer import BlockBuffer
+from .ResponseCache import ResponseCache
+from .MetadataIndex import MetadataIndex, get_metadata_index
+
+__all__ = [
+    "ApiClient",
+    "LatencyStats",
+    "get_client",
+    "configure",
+    "batch",
+    "DISKS_ENDPOINT",
+    "PARTITIONS_ENDPOINT",
+    "FILES_ENDPOINT",
+    "FILE_INFO_ENDPOINT",
+    "BLOCKS_ENDPOINT",
+    "SEARCH_ENDPOINT",
+    "INDEX_ENDPOINT",
+    "INDEX_QUERY_ENDPOINT",
+    "BATCH_ENDPOINT",
+    "DU_ENDPOINT",
+    "WATCH_ENDPOINT",
+    "SECTORS_ENDPOINT",
+    "ApiError",
+    "ApiConnectionError",
+    "ApiTimeoutError",
+    "ApiStatusError",
+    "BadRequestError",
+    "NotFoundError",
+    "ServerError",
+    "Disk",
+    "Partition",
+    "FileInfo",
+    "AsyncApiClient",
+    "PartitionRepository",
+    "get_partition_repository",
+    "BlockBuffer",
+    "ResponseCache",
+    "MetadataIndex",
+    "get_metadata_index",
+]
@@ -0,0 +1,2 @@
+# Benchmarks du client Python et du serveur Go, avec une sortie JSON
+# comparable d'un commit à l'autre (voir compare.py).
@@ -0,0 +1,191 @@
+"""
+Benchmarks du client Python contre le serveur factice (stub_server) :
+décodage des réponses, construction des modèles et remplissage du
+tableau de fichiers. Les résultats sont écrits en JSON (voir results.py).
+
+    cd GUI && python3 -m bench.client_bench --files 10000 --output client.json
+
+Les mesures du tableau demandent PyQt6 ; sans lui, elles sont listées
+dans "skipped".
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+from api import AsyncApiClient, configure, get_client, FILES_ENDPOINT
+from api.Models import FileInfo, Partition
+from file_service.FileService import FileService, FILES_PAGE_SIZE, TABLE_FIELDS
+
+from .results import document, measure, write
+
+GUI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_stub(files, partitions):
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "bench.stub_server",
+            "--files",
+            str(files),
+            "--partitions",
+            str(partitions),
+        ],
+        cwd=GUI_DIR,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    return process, int(process.stdout.readline())
+
+
+def decoding_benchmarks(files, partitions):
+    listing = get_client().get(FILES_ENDPOINT, params={"partition": "stub"}).content
+    page = FileService.fetch_files("stub")
+
+    return [
+        measure(
+            "decode/fetch_files_page",
+            lambda: FileService.fetch_files("stub"),
+            items=len(page["files"]),
+            limit=FILES_PAGE_SIZE,
+            fields=TABLE_FIELDS,
+        ),
+        measure(
+            "decode/fetch_files_full",
+            lambda: FileService.fetch_files("stub", limit=None, fields=None),
+            items=files,
+        ),
+        measure("decode/json_loads_listing", lambda: json.loads(listing), items=files),
+        measure(
+            "decode/partitions",
+            lambda: get_client().get_json("/partitions", params={"disk": "/dev/sda"}),
+            items=partitions,
+        ),
+    ]
+
+
+def model_benchmarks(files, partitions):
+    entries = FileService.fetch_files("stub", limit=None, fields=None)["files"]
+    partition_data = get_client().get_json("/partitions", params={"disk": "/dev/sda"})
+
+    results = [
+        measure(
+            "models/FileInfo",
+            lambda: [FileInfo.from_json(entry) for entry in entries],
+            items=files,
+        ),
+        measure(
+            "models/Partition",
+            lambda: [Partition.from_json(data) for data in partition_data],
+            items=partitions,
+        ),
+    ]
+
+    # Modèle de partition de l'interface : son paquet importe PyQt.
+    from partition.PartitionModel import Partition as GuiPartition
+
+    results.append(
+        measure(
+            "models/gui_Partition",
+            lambda: [GuiPartition(data) for data in partition_data],
+            items=partitions,
+        )
+    )
+    return results
+
+
+def table_benchmarks(files):
+    from PyQt6.QtCore import Qt
+    from file_service.FileTableModel import FileTableModel, SIZE_COLUMN
+
+    entries = FileService.fetch_files("stub", limit=None, fields=TABLE_FIELDS)["files"]
+    pages = [
+        entries[start : start + FILES_PAGE_SIZE]
+        for start in range(0, len(entries), FILES_PAGE_SIZE)
+    ]
+    model = FileTableModel()
+
+    def append_pages():
+        model.set_files(pages[0], "next")
+        for page in pages[1:]:
+            model.append_files(page, "next")
+
+    return [
+        measure("table/set_files", lambda: model.set_files(entries), items=files),
+        measure(
+            "table/sort_by_size",
+            lambda: model.sort(SIZE_COLUMN, Qt.SortOrder.DescendingOrder),
+            items=files,
+        ),
+        measure("table/append_pages", append_pages, items=files, page_size=FILES_PAGE_SIZE),
+    ]
+
+
+def async_benchmarks(port, files, concurrency):
+    loop = asyncio.new_event_loop()
+    api = AsyncApiClient(concurrency=concurrency, host="127.0.0.1", port=port)
+
+    def list_files():
+        return loop.run_until_complete(api.list_files("stub", fields=TABLE_FIELDS))
+
+    try:
+        return [
+            measure(
+                "async/list_files",
+                list_files,
+                items=files,
+                concurrency=concurrency,
+                fields=TABLE_FIELDS,
+            )
+        ]
+    finally:
+        api.close()
+        loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks du client Python")
+    parser.add_argument("--files", type=int, default=10000, help="entrées du dossier factice")
+    parser.add_argument("--partitions", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4, help="pour AsyncApiClient")
+    parser.add_argument("--output", help="fichier JSON (sortie standard par défaut)")
+    args = parser.parse_args()
+
+    process, port = start_stub(args.files, args.partitions)
+    configure(host="127.0.0.1", port=port)
+
+    results = []
+    skipped = []
+    groups = [
+        ("decode", lambda: decoding_benchmarks(args.files, args.partitions)),
+        ("models", lambda: model_benchmarks(args.files, args.partitions)),
+        ("table", lambda: table_benchmarks(args.files)),
+        ("async", lambda: async_benchmarks(port, args.files, args.concurrency)),
+    ]
+    try:
+        for group, run in groups:
+            try:
+                results.extend(run())
+            except ImportError as e:
+                skipped.append({"group": group, "reason": str(e)})
+            print(f"{group} : ok", file=sys.stderr)
+    finally:
+        process.terminate()
+        process.wait()
+
+    doc = document(
+        "python-client",
+        results,
+        {"files": args.files, "partitions": args.partitions, "concurrency": args.concurrency},
+    )
+    doc["skipped"] = skipped
+    write(doc, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Compare deux fichiers de résultats (client_bench ou go_bench) benchmark
+par benchmark, par exemple entre deux commits :
+
+    python3 -m bench.compare avant.json apres.json --threshold 10 --fail
+
+Avec --fail, le code de retour vaut 1 si un benchmark a ralenti de plus de
+--threshold pour cent.
+"""
+import argparse
+import json
+import sys
+
+DEFAULT_THRESHOLD = 10.0
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    return doc, {result["name"]: result for result in doc["results"]}
+
+
+def compare(old, new):
+    """Retourne [(nom, ns avant, ns après, variation en %)] des benchmarks communs."""
+    rows = []
+    for name, result in new.items():
+        if name not in old:
+            continue
+        before, after = old[name]["ns_per_op"], result["ns_per_op"]
+        change = (after - before) / before * 100 if before else 0.0
+        rows.append((name, before, after, change))
+    return rows
+
+
+def format_ns(ns):
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare deux exécutions de benchmarks")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="en pour cent")
+    parser.add_argument("--fail", action="store_true", help="échoue en cas de régression")
+    args = parser.parse_args()
+
+    old_doc, old = load(args.old)
+    new_doc, new = load(args.new)
+    print(f"{(old_doc.get('commit') or '?')[:10]} -> {(new_doc.get('commit') or '?')[:10]}")
+
+    rows = compare(old, new)
+    width = max((len(name) for name, *_ in rows), default=0)
+    regressions = []
+    for name, before, after, change in rows:
+        mark = ""
+        if change > args.threshold:
+            mark = "  RÉGRESSION"
+            regressions.append(name)
+        elif change < -args.threshold:
+            mark = "  amélioration"
+        print(f"{name:{width}}  {format_ns(before):>10}  {format_ns(after):>10}  {change:+7.1f} %{mark}")
+
+    for name in sorted(new.keys() - old.keys()):
+        print(f"{name:{width}}  nouveau")
+    for name in sorted(old.keys() - new.keys()):
+        print(f"{name:{width}}  disparu")
+
+    if args.fail and regressions:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
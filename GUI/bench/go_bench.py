@@ -0,0 +1,93 @@
+"""
+Lance les benchmarks Go du serveur (src/test/bench_test.go) et convertit
+leur sortie en JSON (voir results.py).
+
+    cd GUI && python3 -m bench.go_bench --files 10000 --output go.json
+
+Avec --input, lit une sortie de "go test -bench" déjà produite au lieu de
+lancer go.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+from .results import REPO_DIR, document, write
+
+SRC_DIR = os.path.join(REPO_DIR, "src")
+# BenchmarkNom/sous-cas-8   1234   5678 ns/op   12.3 MB/s   456 B/op   7 allocs/op
+LINE_RE = re.compile(r"^(Benchmark\S+?)(?:-(\d+))?\s+(\d+)\s+(.*)$")
+
+
+def parse(output):
+    results = []
+    for line in output.splitlines():
+        match = LINE_RE.match(line.strip())
+        if not match:
+            continue
+        name, procs, iterations, measures = match.groups()
+
+        values = measures.split()
+        metrics = {unit: float(value) for value, unit in zip(values[::2], values[1::2])}
+        ns_per_op = metrics.pop("ns/op", None)
+        if ns_per_op is None:
+            continue
+        results.append(
+            {
+                "name": name,
+                "iterations": int(iterations),
+                "ns_per_op": ns_per_op,
+                "metrics": metrics,
+                "params": {"procs": int(procs)} if procs else {},
+            }
+        )
+    return results
+
+
+def run(pattern, benchtime, env):
+    process = subprocess.run(
+        ["go", "test", "-run", "^$", "-bench", pattern, "-benchmem", "-benchtime", benchtime, "./test/"],
+        cwd=SRC_DIR,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(process.stdout + process.stderr)
+    return process.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks Go du serveur")
+    parser.add_argument("--bench", default=".", help="motif passé à -bench")
+    parser.add_argument("--benchtime", default="1s")
+    parser.add_argument("--files", type=int, default=10000, help="BENCH_FILES")
+    parser.add_argument("--file-size", type=int, default=1 << 20, help="BENCH_FILE_SIZE")
+    parser.add_argument("--input", help="sortie de go test -bench déjà produite")
+    parser.add_argument("--output", help="fichier JSON (sortie standard par défaut)")
+    args = parser.parse_args()
+
+    settings = {"bench": args.bench, "benchtime": args.benchtime}
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            output = f.read()
+    else:
+        env = {"BENCH_FILES": str(args.files), "BENCH_FILE_SIZE": str(args.file_size)}
+        settings.update(files=args.files, file_size=args.file_size)
+        try:
+            output = run(args.bench, args.benchtime, env)
+        except (OSError, RuntimeError) as e:
+            print(f"Échec des benchmarks Go : {e}", file=sys.stderr)
+            return 1
+
+    results = parse(output)
+    if not results:
+        print("Aucun résultat de benchmark dans la sortie", file=sys.stderr)
+        return 1
+    write(document("go", results, settings), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
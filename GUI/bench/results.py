@@ -0,0 +1,89 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def git_revision():
+    """Commit courant et présence de modifications non commitées."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=REPO_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    return commit, bool(status.strip())
+
+
+def document(suite, results, settings=None):
+    """
+    Document JSON d'une exécution. Chaque résultat porte au moins "name",
+    "iterations" et "ns_per_op" ; "metrics" contient les mesures propres au
+    benchmark (octets/s, entrées/s, allocations...).
+    """
+    commit, dirty = git_revision()
+    return {
+        "suite": suite,
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        },
+        "settings": settings or {},
+        "results": results,
+    }
+
+
+def write(doc, path=None):
+    text = json.dumps(doc, indent=2)
+    if path:
+        with open(path, "w") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+def measure(name, fn, repeat=5, items=None, **params):
+    """
+    Mesure fn comme timeit : le nombre d'appels par échantillon est choisi
+    pour durer au moins 0,2 s, puis repeat échantillons sont pris. ns_per_op
+    est la médiane ; items (entrées traitées par appel) ajoute un débit.
+    """
+    timer = timeit.Timer(fn, timer=time.perf_counter)
+    number, _ = timer.autorange()
+    samples = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+
+    median = statistics.median(samples)
+    metrics = {
+        "min_ns": min(samples) * 1e9,
+        "stdev_ns": statistics.stdev(samples) * 1e9 if len(samples) > 1 else 0.0,
+    }
+    if items:
+        metrics["items/s"] = items / median
+
+    result = {
+        "name": name,
+        "iterations": number * repeat,
+        "ns_per_op": median * 1e9,
+        "metrics": metrics,
+    }
+    if params:
+        result["params"] = params
+    return result
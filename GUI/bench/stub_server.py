@@ -0,0 +1,140 @@
+"""
+Serveur factice qui imite les réponses de l'API Go (/disks, /partitions,
+/files, /files/info) à partir de données générées, pour mesurer le client
+sans disque ni serveur réel. Les corps sont encodés une seule fois puis
+servis depuis un cache : le temps mesuré est celui du client.
+
+    python3 -m bench.stub_server --files 10000 --port 8099
+"""
+import argparse
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_FILES = 10000
+DEFAULT_PARTITIONS = 8
+MAX_PAGE_SIZE = 10000
+EXTENSIONS = ["txt", "log", "png", "bin"]
+
+
+def make_file(i):
+    return {
+        "name": f"file{i:06d}.{EXTENSIONS[i % 4]}",
+        "type": "directory" if i % 100 == 0 else "file",
+        "is_symlink": False,
+        "size_bytes": i * 37 % 1048576,
+        "permissions": "-rw-r--r--",
+        "hard_links": 1,
+        "inode": 1000 + i,
+        "owner_uid": 1000,
+        "owner_gid": 1000,
+        "block_size": 4096,
+        "blocks_allocated": 8,
+        "last_modified": f"2025-01-{i % 28 + 1:02d} 12:00:00",
+        "last_access": "2025-02-01 08:00:00",
+    }
+
+
+def make_partition(disk, i):
+    return {
+        "name": f"{disk}{i + 1}",
+        "fs_type": "ext4",
+        "mount_point": f"/media{disk}{i + 1}",
+        "size": "100G",
+        "fs_size": "98G",
+        "fs_used": f"{i * 10 + 5}G",
+        "uuid": f"00000000-0000-0000-0000-{i:012d}",
+        "part_type_name": "Linux filesystem",
+        "part_number": i + 1,
+        "physical_sector_size": 4096,
+        "logical_sector_size": 512,
+    }
+
+
+class StubData:
+    def __init__(self, files=DEFAULT_FILES, partitions=DEFAULT_PARTITIONS):
+        self.files = [make_file(i) for i in range(files)]
+        self.partitions = partitions
+        self.bodies = {}
+
+    def response(self, url):
+        body = self.bodies.get(url)
+        if body is None:
+            status, payload = self.route(url)
+            body = self.bodies[url] = (status, json.dumps(payload).encode())
+        return body
+
+    def route(self, url):
+        parts = urlsplit(url)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+
+        if parts.path == "/disks":
+            return 200, [{"name": "/dev/sda", "capacity_gb": 512}, {"name": "/dev/sdb", "capacity_gb": 2000}]
+        if parts.path == "/partitions":
+            disk = query.get("disk", "/dev/sda")
+            return 200, [make_partition(disk, i) for i in range(self.partitions)]
+        if parts.path == "/files/info":
+            return 200, self.files[0]
+        if parts.path == "/files":
+            return 200, self.files_page(query)
+        return 404, {"error": "Not found"}
+
+    def files_page(self, query):
+        start = int(query.get("cursor", 0))
+        limit = min(int(query.get("limit", MAX_PAGE_SIZE)), MAX_PAGE_SIZE)
+        page = self.files[start : start + limit]
+
+        fields = query.get("fields")
+        if fields:
+            keep = ["name"] + [name for name in fields.split(",") if name != "name"]
+            page = [{name: file[name] for name in keep} for file in page]
+
+        content = {"mount_path": "/media/stub", "files": page, "total": len(self.files)}
+        if start + limit < len(self.files):
+            content["next_cursor"] = str(start + limit)
+        return content
+
+
+def make_handler(data):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # En-têtes et corps partent en deux écritures : sans TCP_NODELAY,
+        # l'ACK retardé ajoute ~40 ms à chaque réponse.
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            status, body = data.response(self.path)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=0, help="0 : port libre choisi par le système")
+    parser.add_argument("--files", type=int, default=DEFAULT_FILES)
+    parser.add_argument("--partitions", type=int, default=DEFAULT_PARTITIONS)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", args.port), make_handler(StubData(args.files, args.partitions))
+    )
+    # Le port est annoncé sur la sortie standard une fois le serveur prêt.
+    print(server.server_address[1], flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
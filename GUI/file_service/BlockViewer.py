@@ -0,0 +1,128 @@
+from PyQt6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QLabel,
+    QListView,
+)
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize
+
+from .HexViewer import HexViewerDialog
+
+BLOCKS_PAGE_SIZE = 256
+
+
+class BlockListModel(QAbstractListModel):
+    """
+    Modèle de la grille des blocs d'un fichier. Les lignes sont ajoutées
+    page par page au fur et à mesure du défilement ; le contenu des blocs
+    est lu à la demande par la vue hexadécimale.
+    """
+
+    def __init__(self, partition, path, first_page, parent=None):
+        super().__init__(parent)
+        self.partition = partition
+        self.path = path
+        self.first_page = first_page
+        self.total_blocks = first_page.total_blocks
+        self.loaded_blocks = min(len(first_page), self.total_blocks)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.loaded_blocks
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"Block {index.row()}"
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.SizeHintRole:
+            return QSize(80, 80)
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self.loaded_blocks < self.total_blocks
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+
+        count = min(BLOCKS_PAGE_SIZE, self.total_blocks - self.loaded_blocks)
+        start = self.loaded_blocks
+        self.beginInsertRows(QModelIndex(), start, start + count - 1)
+        self.loaded_blocks += count
+        self.endInsertRows()
+
+
+class BlockViewerDialog(QDialog):
+    """
+    Affiche la grille des blocs d'un fichier sans créer un widget par bloc.
+    """
+
+    def __init__(self, file_name, partition, path, first_page, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Blocks Viewer")
+        self.setMinimumSize(600, 400)
+        self.setStyleSheet("background-color: #1e1e2e; color: white;")
+
+        self.file_name = file_name
+        self.model = BlockListModel(partition, path, first_page, self)
+
+        main_layout = QVBoxLayout(self)
+
+        title_label = QLabel(
+            f"Blocks of the File {file_name} ({self.model.total_blocks} blocks) :"
+        )
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_label.setStyleSheet(
+            "font-size: 16px; font-weight: bold; margin-bottom: 10px;"
+        )
+        main_layout.addWidget(title_label)
+
+        self.view = QListView()
+        self.view.setViewMode(QListView.ViewMode.IconMode)
+        self.view.setMovement(QListView.Movement.Static)
+        self.view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.view.setUniformItemSizes(True)
+        self.view.setGridSize(QSize(90, 90))
+        self.view.setSpacing(5)
+        self.view.setStyleSheet(
+            """
+            QListView {
+                border: none;
+            }
+            QListView::item {
+                background-color: #444;
+                color: white;
+                border: 1px solid #888;
+                border-radius: 10px;
+                font-size: 12px;
+            }
+            QListView::item:hover {
+                background-color: #666;
+            }
+        """
+        )
+        self.view.setModel(self.model)
+        self.view.clicked.connect(
+            lambda index: self.show_block_content(index.row())
+        )
+        main_layout.addWidget(self.view)
+
+        self.setLayout(main_layout)
+
+    def show_block_content(self, block_id):
+        first_page = self.model.first_page
+        dialog = HexViewerDialog(
+            self.file_name,
+            self.model.partition,
+            self.model.path,
+            first_page,
+            block_id * first_page.block_size,
+            self,
+        )
+        dialog.exec()
@@ -0,0 +1,218 @@
+import operator
+import re
+from datetime import datetime, timedelta
+from fnmatch import fnmatchcase
+
+SIZE_UNITS = {
+    "": 1,
+    "B": 1,
+    "K": 1024,
+    "KB": 1024,
+    "M": 1024**2,
+    "MB": 1024**2,
+    "G": 1024**3,
+    "GB": 1024**3,
+    "T": 1024**4,
+    "TB": 1024**4,
+}
+
+OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "=": operator.eq,
+}
+
+TYPE_RE = re.compile(r"^type[=:](file|dir|directory|link|symlink)$", re.IGNORECASE)
+TYPE_ALIASES = {"dir": "directory", "link": "symlink"}
+
+PREDICATE_RE = re.compile(
+    r"^(size|taille|mtime|modified|modifie)(>=|<=|>|<|=)(.+)$", re.IGNORECASE
+)
+SIZE_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*([a-zA-Z]*)$")
+
+# Une heure écrite après une date ("mtime<2024-06-01 12:00") fait partie
+# du même terme.
+DATE_TERM_RE = re.compile(
+    r"^(mtime|modified|modifie)(>=|<=|>|<|=)\d{4}-\d{2}-\d{2}$", re.IGNORECASE
+)
+TIME_RE = re.compile(r"^\d{1,2}:\d{2}(:\d{2})?$")
+
+# Format de "last_modified" renvoyé par /files : les dates se comparent
+# alors comme des chaînes.
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def parse_size(text):
+    match = SIZE_RE.match(text.strip())
+    if not match or match.group(2).upper() not in SIZE_UNITS:
+        raise ValueError(f"Taille invalide : {text}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def parse_date(text):
+    try:
+        return datetime.fromisoformat(text.strip()).strftime(DATE_FORMAT)
+    except ValueError:
+        raise ValueError(f"Date invalide : {text}") from None
+
+
+def attribute_matcher(field, op, value):
+    compare = OPERATORS[op]
+    if field.lower() in ("size", "taille"):
+        size = parse_size(value)
+        return lambda file: compare(file.get("size_bytes", 0), size)
+
+    date = parse_date(value)
+    return lambda file: compare(file.get("last_modified", ""), date)
+
+
+def is_extension(token):
+    return token.startswith(".") and "." not in token[1:]
+
+
+def name_matcher(token):
+    """
+    Construit le test sur le nom d'une entrée :
+    - "re:motif" : expression régulière
+    - motif contenant *, ? ou [ : glob
+    - sinon : sous-chaîne
+    Les extensions (".ext") sont traitées ensemble par parse_filter.
+    La casse est toujours ignorée, comme par /search sans case=sensitive.
+    """
+    if token.startswith("re:"):
+        try:
+            regex = re.compile(token[3:], re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"Expression régulière invalide : {e}") from None
+        return lambda file: regex.search(file.get("name", "")) is not None
+
+    lowered = token.lower()
+    if any(char in token for char in "*?["):
+        return lambda file: fnmatchcase(file.get("name", "").lower(), lowered)
+
+    return lambda file: lowered in file.get("name", "").lower()
+
+
+def split_terms(text):
+    """
+    Découpe le filtre en termes séparés par des espaces, en gardant
+    ensemble une date et l'heure qui la suit.
+
+    >>> split_terms("*.log mtime<2024-06-01 12:00 size>1M")
+    ['*.log', 'mtime<2024-06-01 12:00', 'size>1M']
+    """
+    terms = []
+    for token in text.split():
+        if terms and TIME_RE.match(token) and DATE_TERM_RE.match(terms[-1]):
+            terms[-1] += " " + token
+        else:
+            terms.append(token)
+    return terms
+
+
+def parse_type(token):
+    match = TYPE_RE.match(token)
+    if not match:
+        return None
+    file_type = match.group(1).lower()
+    return TYPE_ALIASES.get(file_type, file_type)
+
+
+def parse_filter(text):
+    """
+    Transforme le texte du champ de filtre en prédicat sur une entrée de
+    /files. Les termes séparés par des espaces doivent tous être vérifiés,
+    par exemple : "*.log size>10M mtime>=2024-01-01 type:file". Une date
+    peut être suivie d'une heure : "mtime<2024-06-01 12:00". Plusieurs
+    extensions forment un seul terme : ".jpg .png" accepte l'une ou l'autre,
+    comme le paramètre ext de /search.
+    Retourne None si le filtre est vide ; lève ValueError s'il est invalide.
+
+    >>> matches = parse_filter("mtime<2024-06-01 12:00")
+    >>> matches({"name": "a.txt", "last_modified": "2024-05-01 10:00:00"})
+    True
+    >>> matches({"name": "b.txt", "last_modified": "2024-06-01 12:30:00"})
+    False
+    >>> matches = parse_filter(".JPG .png re:^img")
+    >>> matches({"name": "IMG_1.jpg"}), matches({"name": "img_2.PNG"})
+    (True, True)
+    >>> matches({"name": "img_3.gif"})
+    False
+    """
+    matchers = []
+    extensions = []
+    for token in split_terms(text):
+        match = PREDICATE_RE.match(token)
+        file_type = parse_type(token)
+        if file_type:
+            matchers.append(lambda file, file_type=file_type: file.get("type") == file_type)
+        elif match:
+            matchers.append(attribute_matcher(*match.groups()))
+        elif is_extension(token):
+            extensions.append(token.lower())
+        else:
+            matchers.append(name_matcher(token))
+
+    if extensions:
+        suffixes = tuple(extensions)
+        matchers.append(lambda file: file.get("name", "").lower().endswith(suffixes))
+
+    if not matchers:
+        return None
+    if len(matchers) == 1:
+        return matchers[0]
+    return lambda file: all(matcher(file) for matcher in matchers)
+
+
+def search_params(text):
+    """
+    Traduit le texte du filtre en paramètres de /search, pour la recherche
+    récursive côté serveur. Les bornes strictes sont converties en bornes
+    inclusives. Lève ValueError si le filtre ne peut pas être envoyé.
+
+    >>> search_params("mtime<2024-06-01 12:00")
+    {'max_mtime': '2024-06-01 11:59:59'}
+    """
+    params = {}
+    extensions = []
+
+    def set_once(key, value):
+        if key in params:
+            raise ValueError("Un seul motif de chaque sorte en mode récursif")
+        params[key] = value
+
+    for token in split_terms(text):
+        file_type = parse_type(token)
+        match = PREDICATE_RE.match(token)
+        if file_type:
+            set_once("type", file_type)
+        elif match:
+            field, op, value = match.groups()
+            if field.lower() in ("size", "taille"):
+                size = parse_size(value)
+                if op in (">", ">=", "="):
+                    set_once("min_size", size + 1 if op == ">" else size)
+                if op in ("<", "<=", "="):
+                    set_once("max_size", size - 1 if op == "<" else size)
+            else:
+                date = datetime.strptime(parse_date(value), DATE_FORMAT)
+                if op in (">", ">=", "="):
+                    bound = date + timedelta(seconds=1) if op == ">" else date
+                    set_once("min_mtime", bound.strftime(DATE_FORMAT))
+                if op in ("<", "<=", "="):
+                    bound = date - timedelta(seconds=1) if op == "<" else date
+                    set_once("max_mtime", bound.strftime(DATE_FORMAT))
+        elif token.startswith("re:"):
+            set_once("regex", token[3:])
+        elif any(char in token for char in "*?["):
+            set_once("glob", token)
+        elif is_extension(token):
+            extensions.append(token)
+        else:
+            set_once("filter", token)
+
+    if extensions:
+        params["ext"] = ",".join(extensions)
+    return params
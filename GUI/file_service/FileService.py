@@ -1,18 +1,193 @@
+import json
+import time
+
 import requests
 
+from api import (
+    get_client,
+    FILES_ENDPOINT,
+    FILE_INFO_ENDPOINT,
+    SEARCH_ENDPOINT,
+    DU_ENDPOINT,
+    WATCH_ENDPOINT,
+)
+
+FILES_PAGE_SIZE = 500
+# Champs affichés par le tableau ; la fiche complète est chargée à la
+# demande par la fenêtre de détails.
+TABLE_FIELDS = "name,type,size_bytes,last_modified,inode"
+SEARCH_BATCH_SIZE = 200
+SEARCH_BATCH_DELAY = 0.1
+# Le serveur envoie un battement toutes les 5 s sur /watch : sans rien
+# recevoir pendant WATCH_READ_TIMEOUT, la connexion est considérée coupée.
+WATCH_READ_TIMEOUT = 15
+WATCH_RETRY_DELAY = 2
+
+
 class FileService:
     """Service pour communiquer avec l'API de fichiers."""
     
-    BASE_URL = "http://localhost:8080"
-    
     @staticmethod
-    def fetch_files(partition_id, path=""):
+    def fetch_files(
+        partition_id, path="", cursor=None, limit=FILES_PAGE_SIZE, fields=TABLE_FIELDS
+    ):
+        """
+        Charge une page du dossier, triée par nom. La réponse contient
+        "total" et, s'il reste des entrées, "next_cursor" à renvoyer pour
+        obtenir la page suivante. limit=None charge tout le dossier et
+        fields=None tous les champs ("name,type" évite tout stat).
+        """
         try:
-            url = f"{FileService.BASE_URL}/files?partition={partition_id}&path={path}"
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            files = response.json()
+            params = {"partition": partition_id, "path": path}
+            if limit:
+                params["limit"] = limit
+            if cursor:
+                params["cursor"] = cursor
+            if fields:
+                params["fields"] = fields
+            files = get_client().get_json(FILES_ENDPOINT, params=params, timeout=5)
                         
             return files
         except requests.exceptions.RequestException as e:
-            return str(e)
\ No newline at end of file
+            return str(e)
+
+    @staticmethod
+    def fetch_file_info(partition_id, path):
+        """Fiche complète d'une seule entrée, pour la fenêtre de détails."""
+        params = {"partition": partition_id, "path": path}
+        return get_client().get_json(FILE_INFO_ENDPOINT, params=params, timeout=5)
+
+    @staticmethod
+    def stream_lines(endpoint, params, is_cancelled=None):
+        """
+        Lit une réponse NDJSON ligne par ligne. Fermer la réponse coupe la
+        connexion : le serveur arrête alors son parcours.
+        """
+        client = get_client()
+        response = client.get(
+            endpoint,
+            params=params,
+            timeout=(client.timeout[0], None),
+            stream=True,
+        )
+        with response:
+            for line in response.iter_lines():
+                if is_cancelled and is_cancelled():
+                    return
+                if line:
+                    yield json.loads(line)
+
+    @staticmethod
+    def search_files(
+        partition_id, path="", filters=None, progress_callback=None, is_cancelled=None
+    ):
+        """
+        Recherche récursive via /search. Les résultats arrivent en NDJSON au
+        fil du parcours et sont transmis par lots à progress_callback.
+        Retourne la dernière ligne du flux ({"done", "matches", "truncated"}).
+        """
+        params = {"partition": partition_id, "path": path, **(filters or {})}
+
+        summary = {"done": False, "matches": 0, "truncated": False}
+        batch = []
+        last_flush = time.monotonic()
+        for entry in FileService.stream_lines(SEARCH_ENDPOINT, params, is_cancelled):
+            if entry.get("done"):
+                summary = entry
+                break
+
+            batch.append(entry)
+            now = time.monotonic()
+            if len(batch) >= SEARCH_BATCH_SIZE or now - last_flush >= SEARCH_BATCH_DELAY:
+                if progress_callback:
+                    progress_callback(batch)
+                batch = []
+                last_flush = now
+
+        if is_cancelled and is_cancelled():
+            return summary
+        if batch and progress_callback:
+            progress_callback(batch)
+        return summary
+
+    @staticmethod
+    def disk_usage(partition_id, path="", progress_callback=None, is_cancelled=None):
+        """
+        Taille récursive du dossier et de chacun de ses sous-dossiers via
+        /du. La progression ({"dirs", "files", "size_bytes"}) est transmise
+        à progress_callback. Retourne {"total", "dirs"}, ou None si le
+        calcul a été annulé.
+        """
+        params = {"partition": partition_id, "path": path}
+        for entry in FileService.stream_lines(DU_ENDPOINT, params, is_cancelled):
+            if entry.get("done"):
+                return entry
+            if progress_callback and "progress" in entry:
+                progress_callback(entry["progress"])
+        return None
+
+    @staticmethod
+    def stream_events(endpoint, params, is_cancelled=None, read_timeout=None):
+        """
+        Lit un flux server-sent events et produit des couples (événement,
+        données JSON). Les commentaires (battements) servent seulement à
+        vérifier l'annulation.
+        """
+        client = get_client()
+        response = client.get(
+            endpoint,
+            params=params,
+            timeout=(client.timeout[0], read_timeout),
+            stream=True,
+        )
+        with response:
+            event, data = "message", []
+            for line in response.iter_lines(decode_unicode=True):
+                if is_cancelled and is_cancelled():
+                    return
+                if line:
+                    field, _, value = line.partition(":")
+                    if field == "event":
+                        event = value.strip()
+                    elif field == "data":
+                        data.append(value.strip())
+                    continue
+                if data:
+                    yield event, json.loads("\n".join(data))
+                event, data = "message", []
+
+    @staticmethod
+    def watch_directory(partition_id, path="", progress_callback=None, is_cancelled=None):
+        """
+        Suit les changements du dossier via /watch jusqu'à l'annulation ou
+        la disparition du dossier. Chaque événement est transmis à
+        progress_callback : ("deltas", liste de {"op", "name", "file"}) ou
+        ("reset", None) quand le dossier doit être relu. Une connexion
+        coupée est rétablie, suivie d'un "reset" puisque des changements
+        ont pu être manqués. Retourne "gone" si le dossier a disparu.
+        """
+        params = {"partition": partition_id, "path": path}
+        connected = False
+        while not (is_cancelled and is_cancelled()):
+            try:
+                for event, data in FileService.stream_events(
+                    WATCH_ENDPOINT, params, is_cancelled, WATCH_READ_TIMEOUT
+                ):
+                    if event == "ready":
+                        if connected:
+                            progress_callback(("reset", None))
+                        connected = True
+                    elif event == "gone":
+                        return "gone"
+                    else:
+                        progress_callback((event, data))
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if not connected:
+                    raise
+
+            deadline = time.monotonic() + WATCH_RETRY_DELAY
+            while time.monotonic() < deadline:
+                if is_cancelled and is_cancelled():
+                    return None
+                time.sleep(0.1)
+        return None
@@ -0,0 +1,428 @@
+import os
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QRect,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QCursor, QIcon
+
+from .FileUtils import format_size
+
+BACK_ROW_TEXT = "⬅ Revenir en arrière"
+
+NAME_COLUMN = 0
+SIZE_COLUMN = 1
+TOTAL_SIZE_COLUMN = 2
+MODIFIED_COLUMN = 3
+INODE_COLUMN = 4
+ACTIONS_COLUMN = 5
+
+HEADERS = ["Nom", "Taille", "Taille totale", "Modifié le", "Inode", "Actions"]
+
+FileRole = Qt.ItemDataRole.UserRole + 1
+
+# Au-delà, un lot de changements reconstruit le modèle d'un coup plutôt
+# que ligne par ligne.
+MAX_ROW_DELTAS = 200
+
+_icon_cache = {}
+
+
+def icon_for(file):
+    """Retourne l'icône d'une entrée, une seule QIcon par extension."""
+    file_type = file.get("type", "")
+    if file_type == "directory":
+        key = "open-folder"
+    elif file_type == "file":
+        key = os.path.splitext(file.get("name", ""))[1].lower().lstrip(".")
+    else:
+        key = "link"
+
+    icon = _icon_cache.get(key)
+    if icon is None:
+        icon_path = f"icons/{key}.png"
+        if not key or not os.path.exists(icon_path):
+            icon_path = "icons/file.png"
+        icon = _icon_cache[key] = QIcon(icon_path)
+    return icon
+
+
+def total_size(file):
+    """
+    Taille récursive d'une entrée : celle calculée par /du pour un
+    dossier (-1 tant qu'elle n'est pas connue), sa taille pour un fichier.
+    """
+    if file.get("type") == "directory":
+        return file.get("recursive_size", -1)
+    return file.get("size_bytes", 0)
+
+
+def delta_changes(deltas):
+    """
+    Associe le nom de chaque entrée changée à sa nouvelle fiche, None si
+    elle a été supprimée. Seul le dernier changement d'un nom compte.
+    """
+    return {
+        delta.get("name"): None if delta.get("op") == "remove" else delta.get("file")
+        for delta in deltas
+    }
+
+
+def merge_deltas(files, deltas):
+    """
+    Retourne une copie de files où les changements envoyés par /watch sont
+    appliqués : "add" et "modify" remplacent ou ajoutent l'entrée de même
+    nom, "remove" la retire.
+    """
+    changes = delta_changes(deltas)
+    merged = []
+    for file in files:
+        name = file.get("name")
+        if name not in changes:
+            merged.append(file)
+            continue
+        new = changes.pop(name)
+        if new is not None:
+            merged.append(new)
+    merged.extend(file for file in changes.values() if file is not None)
+    return merged
+
+
+def sort_key(column):
+    if column == SIZE_COLUMN:
+        return lambda file: file.get("size_bytes", 0)
+    if column == TOTAL_SIZE_COLUMN:
+        return total_size
+    if column == MODIFIED_COLUMN:
+        return lambda file: file.get("last_modified", "")
+    if column == INODE_COLUMN:
+        return lambda file: file.get("inode", 0)
+    return lambda file: file.get("name", "").lower()
+
+
+class FileTableModel(QAbstractTableModel):
+    """
+    Modèle du contenu d'un dossier. La ligne 0 est toujours le retour au
+    dossier parent ; les entrées suivent dans l'ordre de tri courant.
+
+    Les entrées reçues du serveur sont conservées dans all_files : le
+    filtre et le tri s'appliquent localement, sans nouvelle requête. Un
+    grand dossier arrive page par page : tant que next_cursor est défini,
+    la vue demande la suite (more_requested) quand on atteint le bas.
+    """
+
+    more_requested = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.all_files = []
+        self.files = []
+        self.predicate = None
+        self.sort_column = NAME_COLUMN
+        self.sort_order = Qt.SortOrder.AscendingOrder
+        self.next_cursor = None
+        self.fetching = False
+        self.usage = {}
+        self.usage_pending = False
+
+    def set_files(self, files, next_cursor=None):
+        self.all_files = list(files)
+        self.apply_usage(self.all_files)
+        self.next_cursor = next_cursor
+        self.fetching = False
+        self.sort_files()
+        self.refresh()
+
+    def append_files(self, files, next_cursor=None):
+        """
+        Ajoute des entrées (page suivante, résultats de recherche) en
+        conservant le tri courant.
+        """
+        self.next_cursor = next_cursor
+        self.fetching = False
+        self.apply_usage(files)
+        self.all_files.extend(files)
+        if self.predicate is not None:
+            files = [file for file in files if self.predicate(file)]
+        if not files:
+            # Aucune ligne ajoutée : la vue ne redemanderait pas la suite,
+            # le filtre local continue donc de parcourir les pages.
+            self.fetchMore()
+            return
+
+        first = len(self.files) + 1
+        self.beginInsertRows(QModelIndex(), first, first + len(files) - 1)
+        self.files.extend(files)
+        self.endInsertRows()
+        self.sort(self.sort_column, self.sort_order)
+
+    def apply_deltas(self, deltas):
+        """
+        Applique les changements envoyés par /watch sans recharger le
+        modèle : les lignes sont ajoutées, modifiées ou retirées une à une,
+        la vue garde sa sélection et sa position.
+        """
+        self.all_files = merge_deltas(self.all_files, deltas)
+        self.apply_usage(self.all_files)
+        if len(deltas) > MAX_ROW_DELTAS:
+            self.sort_files()
+            self.refresh()
+            return
+
+        changes = delta_changes(deltas)
+        removed_rows = []
+        for row, file in enumerate(self.files):
+            name = file.get("name")
+            if name not in changes:
+                continue
+            new = changes.pop(name)
+            if new is None or (self.predicate is not None and not self.predicate(new)):
+                removed_rows.append(row)
+                continue
+            self.files[row] = new
+            self.dataChanged.emit(
+                self.index(row + 1, 0), self.index(row + 1, ACTIONS_COLUMN)
+            )
+
+        for row in reversed(removed_rows):
+            self.beginRemoveRows(QModelIndex(), row + 1, row + 1)
+            del self.files[row]
+            self.endRemoveRows()
+
+        added = [
+            file
+            for file in changes.values()
+            if file is not None and (self.predicate is None or self.predicate(file))
+        ]
+        if added:
+            first = len(self.files) + 1
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self.files.extend(added)
+            self.endInsertRows()
+
+        self.sort(self.sort_column, self.sort_order)
+
+    def set_usage(self, usage, pending=False):
+        """
+        usage associe le nom d'un sous-dossier à son occupation renvoyée
+        par /du ; pending indique qu'un calcul est en cours.
+        """
+        self.usage = usage
+        self.usage_pending = pending
+        for file in self.all_files:
+            file.pop("recursive_size", None)
+        self.apply_usage(self.all_files)
+
+        if self.sort_column == TOTAL_SIZE_COLUMN:
+            self.sort(self.sort_column, self.sort_order)
+        elif self.files:
+            self.dataChanged.emit(
+                self.index(1, TOTAL_SIZE_COLUMN),
+                self.index(len(self.files), TOTAL_SIZE_COLUMN),
+            )
+
+    def apply_usage(self, files):
+        if not self.usage:
+            return
+        for file in files:
+            usage = self.usage.get(file.get("name"))
+            # Les résultats d'une recherche viennent d'autres dossiers.
+            if usage is not None and not file.get("path"):
+                file["recursive_size"] = usage.get("size_bytes", 0)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return bool(self.next_cursor) and not self.fetching
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self.fetching = True
+        self.more_requested.emit(self.next_cursor)
+
+    def fetch_failed(self):
+        self.fetching = False
+
+    def set_filter(self, predicate):
+        self.predicate = predicate
+        self.refresh()
+
+    def sort_files(self):
+        self.all_files.sort(
+            key=sort_key(self.sort_column),
+            reverse=self.sort_order == Qt.SortOrder.DescendingOrder,
+        )
+
+    def filtered_files(self):
+        if self.predicate is None:
+            return list(self.all_files)
+        return [file for file in self.all_files if self.predicate(file)]
+
+    def refresh(self):
+        self.beginResetModel()
+        self.files = self.filtered_files()
+        self.endResetModel()
+
+    def file_at(self, row):
+        if 1 <= row <= len(self.files):
+            return self.files[row - 1]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.files) + 1
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        file = self.file_at(index.row())
+        if index.column() == NAME_COLUMN and file and file.get("type") != "directory":
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        file = self.file_at(index.row())
+
+        if file is None:
+            if role == Qt.ItemDataRole.DisplayRole and column == NAME_COLUMN:
+                return BACK_ROW_TEXT
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == NAME_COLUMN:
+                # Les résultats d'une recherche récursive affichent leur chemin.
+                return file.get("path") or file.get("name", "Inconnu")
+            if column == SIZE_COLUMN:
+                return format_size(file.get("size_bytes", 0))
+            if column == TOTAL_SIZE_COLUMN:
+                size = total_size(file)
+                if size >= 0:
+                    return format_size(size)
+                return "…" if self.usage_pending else ""
+            if column == MODIFIED_COLUMN:
+                return file.get("last_modified", "")
+            if column == INODE_COLUMN:
+                return str(file.get("inode", ""))
+            return None
+
+        if role == Qt.ItemDataRole.DecorationRole and column == NAME_COLUMN:
+            return icon_for(file)
+
+        if role == FileRole:
+            return file
+
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column == ACTIONS_COLUMN:
+            return
+        self.sort_column = column
+        self.sort_order = order
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        tracked = [self.file_at(index.row()) for index in persistent]
+        self.sort_files()
+        self.files = self.filtered_files()
+
+        # La sélection suit ses entrées à leur nouvelle place.
+        rows = {id(file): row + 1 for row, file in enumerate(self.files)}
+        moved = []
+        for index, file in zip(persistent, tracked):
+            if file is None:
+                moved.append(index)
+            elif id(file) in rows:
+                moved.append(self.index(rows[id(file)], index.column()))
+            else:
+                moved.append(QModelIndex())
+        self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
+
+
+class FileActionDelegate(QStyledItemDelegate):
+    """
+    Dessine les boutons "Détails" et "Blocks" de la colonne Actions sans
+    créer de widget par ligne, et émet un signal lors d'un clic.
+    """
+
+    details_clicked = pyqtSignal(object)
+    blocks_clicked = pyqtSignal(object)
+
+    BUTTON_WIDTH = 90
+    SPACING = 10
+
+    def buttons(self, rect, file):
+        labels = ["Détails"]
+        if file.get("type") == "file":
+            labels.append("Blocks")
+
+        height = rect.height() - 8
+        buttons = []
+        x = rect.x() + 4
+        for label in labels:
+            buttons.append(
+                (label, QRect(x, rect.y() + 4, self.BUTTON_WIDTH, height))
+            )
+            x += self.BUTTON_WIDTH + self.SPACING
+        return buttons
+
+    def paint(self, painter, option, index):
+        file = index.data(FileRole)
+        if file is None:
+            return
+
+        hovered = option.state & QStyle.StateFlag.State_MouseOver
+        cursor = option.widget.viewport().mapFromGlobal(QCursor.pos())
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        for label, rect in self.buttons(option.rect, file):
+            background = "#666" if hovered and rect.contains(cursor) else "#444"
+            painter.setPen(QColor("#888"))
+            painter.setBrush(QColor(background))
+            painter.drawRoundedRect(rect, 5, 5)
+            painter.setPen(QColor("white"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.Type.MouseButtonRelease:
+            return False
+
+        file = index.data(FileRole)
+        if file is None:
+            return False
+
+        position = event.position().toPoint()
+        for label, rect in self.buttons(option.rect, file):
+            if rect.contains(position):
+                if label == "Blocks":
+                    self.blocks_clicked.emit(file)
+                else:
+                    self.details_clicked.emit(file)
+                return True
+        return False
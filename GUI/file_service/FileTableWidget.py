@@ -1,27 +1,37 @@
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QLabel,
     QPushButton,
-    QHBoxLayout,
-    QWidget,
     QDialog,
-    QScrollArea,
-    QGridLayout,
-    QTextEdit,
     QLineEdit,
+    QHBoxLayout,
+    QCheckBox,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 
 from .FileService import FileService
+from .FileUtils import format_size
+from .BlockViewer import BlockViewerDialog, BLOCKS_PAGE_SIZE
+from .FileFilter import parse_filter, search_params
+from .FileTableModel import (
+    FileTableModel,
+    FileActionDelegate,
+    NAME_COLUMN,
+    SIZE_COLUMN,
+    TOTAL_SIZE_COLUMN,
+    MODIFIED_COLUMN,
+    INODE_COLUMN,
+    ACTIONS_COLUMN,
+    merge_deltas,
+)
 
 from utils import *
-from PyQt6.QtGui import QIcon
-import os
+from RequestExecutor import get_executor
 
+FILTER_DELAY_MS = 150
 
 class FileTableWidget(QWidget):
     """Widget personnalisé pour afficher une liste de fichiers."""
@@ -32,37 +42,90 @@ class FileTableWidget(QWidget):
         super().__init__(parent)
         self.current_partition_id = None
         self.current_path = ""
+        self.listing = []
+        self.listing_cursor = None
+        self.listing_total = 0
+        self.searching = False
+        # Changements reçus avant la fin du premier chargement du dossier,
+        # et noms ajoutés en direct qu'une page suivante renverra aussi.
+        self.pending_deltas = None
+        self.live_names = set()
+        # Échec de la surveillance survenu avant l'affichage du dossier.
+        self.watch_error = None
 
         self.layout = QVBoxLayout(self)
         self.setLayout(self.layout)
 
         self.file_type_filter = QLineEdit()
         self.file_type_filter.setPlaceholderText(
-            "Saisir une extension (ex: .txt, .png)"
+            "Filtrer (ex: .png, *.log, re:^img, size>10M, mtime>2024-01-01)"
         )
-        self.file_type_filter.textChanged.connect(self.apply_filter)
         self.file_type_filter.setStyleSheet("color: white;")
-        self.layout.addWidget(self.file_type_filter)
+
+        self.recursive_check = QCheckBox("Récursif")
+        self.recursive_check.setToolTip(
+            "Chercher aussi dans les sous-dossiers (recherche côté serveur)"
+        )
+        self.recursive_check.setStyleSheet("color: white;")
+        self.recursive_check.toggled.connect(self.apply_filter)
+
+        self.usage_check = QCheckBox("Tailles des dossiers")
+        self.usage_check.setToolTip(
+            "Calculer la taille totale de chaque sous-dossier (colonne Taille totale)"
+        )
+        self.usage_check.setStyleSheet("color: white;")
+        self.usage_check.toggled.connect(self.on_usage_toggled)
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(self.file_type_filter)
+        filter_layout.addWidget(self.recursive_check)
+        filter_layout.addWidget(self.usage_check)
+        self.layout.addLayout(filter_layout)
+
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #aaaaaa; font-size: 12px;")
+        self.status_label.hide()
+        self.layout.addWidget(self.status_label)
+
+        # Le filtre n'est appliqué qu'une fois la saisie terminée.
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.file_type_filter.textChanged.connect(lambda: self.filter_timer.start())
 
         self.message_label = QLabel("")
         self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.message_label.setStyleSheet("color: white; font-size: 14px;")
         self.layout.addWidget(self.message_label)
 
-        self.table = QTableWidget(0, 2)
-        self.table.setHorizontalHeaderLabels(["Nom", "Actions"])
-        self.table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.Stretch
-        )
-        self.table.setColumnWidth(0, 300)
-        self.table.setColumnWidth(1, 200)
+        self.model = FileTableModel(self)
+        self.model.more_requested.connect(self.load_more_files)
+        self.action_delegate = FileActionDelegate(self)
+        self.action_delegate.details_clicked.connect(self.show_details)
+        self.action_delegate.blocks_clicked.connect(self.show_blocks_dialog)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(ACTIONS_COLUMN, self.action_delegate)
+        self.table.setMouseTracking(True)
+
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(NAME_COLUMN, QHeaderView.ResizeMode.Stretch)
+        self.table.setColumnWidth(SIZE_COLUMN, 90)
+        self.table.setColumnWidth(TOTAL_SIZE_COLUMN, 110)
+        self.table.setColumnWidth(MODIFIED_COLUMN, 150)
+        self.table.setColumnWidth(INODE_COLUMN, 90)
+        self.table.setColumnWidth(ACTIONS_COLUMN, 200)
 
-        self.table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.table.horizontalHeader().setVisible(False)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(36)
         self.table.setShowGrid(False)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.cellDoubleClicked.connect(self.on_item_double_clicked)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(NAME_COLUMN, Qt.SortOrder.AscendingOrder)
+        self.table.doubleClicked.connect(self.on_item_double_clicked)
         self.apply_style()
         self.layout.addWidget(self.table)
 
@@ -71,7 +134,7 @@ class FileTableWidget(QWidget):
     def apply_style(self):
         self.table.setStyleSheet(
             """
-            QTableWidget {
+            QTableView {
                 background-color: #1e1e2e;
                 color: white;
                 border: none;
@@ -84,29 +147,13 @@ class FileTableWidget(QWidget):
                 font-weight: bold;
                 border: none;
             }
-            QTableWidget::item {
+            QTableView::item {
                 border-bottom: none;
                 padding: 6px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #3D4455;
             }
-            QPushButton {
-                background-color: #444;
-                color: white;
-                border-radius: 5px;
-                padding: 4px 6px;
-                min-width: 90px;
-                font-size: 12px;
-                border: 1px solid #888;  
-            }
-            QPushButton:hover {
-                background-color: #666;
-            }
-            QPushButton:pressed {
-                background-color: #555;
-                border: 1px solid #bbb;  /* Even lighter border when pressed */
-            }
         """
         )
 
@@ -124,98 +171,280 @@ class FileTableWidget(QWidget):
         self.message_label.show()
         self.table.hide()
 
+    def show_loading(self, message="Chargement des fichiers..."):
+        self.display_message(message)
+
     def load_partition_files(self, partition_id, path=""):
         self.current_partition_id = partition_id
         self.current_path = path
 
-        files = FileService.fetch_files(partition_id, path)
+        get_executor().cancel("search")
+        self.status_label.hide()
+        self.show_loading()
+        get_executor().submit(
+            FileService.fetch_files,
+            partition_id,
+            path,
+            key="files",
+            on_result=self.show_files,
+            on_error=self.on_listing_error,
+        )
+        self.model.set_usage({})
+        if self.usage_check.isChecked():
+            self.start_disk_usage()
+        self.start_watch()
+
+    def show_files(self, files):
+        if not isinstance(files, dict):
+            self.on_listing_error(files)
+            return
 
         self.message_label.hide()
         self.table.show()
 
-        if not files.get("files"):
-            self.table.setRowCount(1)
-            back_item = QTableWidgetItem("⬅ Revenir en arrière")
-            back_item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-            self.table.setItem(0, 0, back_item)
+        self.listing = files.get("files") or []
+        self.listing_cursor = files.get("next_cursor")
+        self.listing_total = files.get("total", len(self.listing))
+        self.searching = False
+        self.live_names = set()
+        self.model.set_files(self.listing, self.listing_cursor)
+        self.table.scrollToTop()
+        self.show_listing_status()
+
+        pending, self.pending_deltas = self.pending_deltas, None
+        if pending:
+            self.apply_deltas(pending)
+        self.show_watch_error()
+
+        if self.recursive_check.isChecked() and self.file_type_filter.text().strip():
+            self.apply_filter()
+
+    def on_listing_error(self, message):
+        """
+        Le dossier n'a pas pu être listé : sa surveillance est arrêtée, les
+        changements qu'elle aurait accumulés n'ayant plus où s'appliquer.
+        """
+        get_executor().cancel("watch")
+        self.pending_deltas = None
+        self.watch_error = None
+        self.display_message(f"Erreur lors du chargement des fichiers : {message}")
+
+    def load_more_files(self, cursor):
+        get_executor().submit(
+            FileService.fetch_files,
+            self.current_partition_id,
+            self.current_path,
+            cursor,
+            key="files",
+            on_result=self.append_page,
+            on_error=self.on_page_error,
+        )
+
+    def append_page(self, page):
+        if not isinstance(page, dict):
+            self.on_page_error(page)
+            return
+        if self.searching:
             return
 
-        selected_filter = self.file_type_filter.text().strip()
-        if selected_filter:
-            files["files"] = [
-                file
-                for file in files["files"]
-                if file.get("name", "").endswith(selected_filter)
-            ]
-
-        self.table.setRowCount(len(files["files"]) + 1)
-
-        back_item = QTableWidgetItem("⬅ Revenir en arrière")
-        back_item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-        self.table.setItem(0, 0, back_item)
-
-        for row, file in enumerate(files.get("files")):
-            name = file.get("name", "Inconnu")
-            extension = file.get("type", "")
-
-            name_item = QTableWidgetItem(name)
-            if extension == "directory":
-                name_item.setIcon(QIcon("icons/open-folder.png"))
-                name_item.setFlags(
-                    Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
-                )
-            else:
-                if extension == "file":
-                    ext = os.path.splitext(name)[1].lower().lstrip(".")
-                    icon_path = f"icons/{ext}.png"
-                    if not os.path.exists(icon_path):
-                        icon_path = "icons/file.png"
-
-                    name_item.setIcon(QIcon(icon_path))
-                else:
-                    name_item.setIcon(QIcon("icons/link.png"))
-                name_item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self.table.setItem(row + 1, 0, name_item)
-
-            btn_widget = QWidget()
-            btn_layout = QHBoxLayout(btn_widget)
-            btn_layout.setContentsMargins(0, 0, 0, 0)
-            btn_layout.setSpacing(10)
-
-            details_btn = QPushButton("Détails")
-            details_btn.clicked.connect(lambda _, f=file: self.show_details(f))
-            btn_layout.addWidget(details_btn)
-
-            if extension == "file":
-                show_blocks_btn = QPushButton("Blocks")
-                show_blocks_btn.clicked.connect(
-                    lambda _, f=file: self.show_blocks_dialog(f)
-                )
-                btn_layout.addWidget(show_blocks_btn)
-
-            btn_widget.setLayout(btn_layout)
-            self.table.setCellWidget(row + 1, 1, btn_widget)
-
-    def on_item_double_clicked(self, row, column):
-        if column != 0:
+        files = page.get("files") or []
+        if self.live_names:
+            files = [file for file in files if file.get("name") not in self.live_names]
+        self.listing.extend(files)
+        self.listing_cursor = page.get("next_cursor")
+        self.listing_total = page.get("total", self.listing_total)
+        self.model.append_files(files, self.listing_cursor)
+        self.show_listing_status()
+
+    def on_page_error(self, message):
+        self.model.fetch_failed()
+        self.status_label.setText(f"Erreur lors du chargement des fichiers : {message}")
+        self.status_label.show()
+
+    def show_listing_status(self):
+        """
+        Indique qu'une partie seulement du dossier est chargée : le tri et
+        le filtre local ne portent alors que sur les entrées reçues.
+        """
+        if not self.listing_cursor:
+            self.status_label.hide()
             return
+        self.status_label.setText(
+            f"{len(self.listing)} entrées chargées sur {self.listing_total}"
+            " (la suite se charge au défilement)"
+        )
+        self.status_label.show()
 
-        if row == 0:
-            self.go_back()
+    def start_watch(self):
+        """
+        Suit les changements du dossier courant via /watch ; ils sont
+        appliqués au tableau sans le recharger.
+        """
+        self.pending_deltas = []
+        self.watch_error = None
+        # La connexion reste ouverte : une surveillance annulée ne se
+        # termine qu'au battement suivant du serveur.
+        get_executor().submit(
+            FileService.watch_directory,
+            self.current_partition_id,
+            self.current_path,
+            key="watch",
+            detached=True,
+            on_progress=self.on_watch_event,
+            on_result=self.on_watch_done,
+            on_error=self.on_watch_error,
+        )
+
+    def on_watch_event(self, event):
+        kind, data = event
+        if kind == "deltas":
+            self.apply_deltas(data)
+        elif kind == "reset":
+            self.reload_listing()
+
+    def apply_deltas(self, deltas):
+        if self.pending_deltas is not None:
+            self.pending_deltas.extend(deltas)
             return
 
-        name_item = self.table.item(row, 0)
-        if name_item:
-            folder_name = name_item.text()
-            self.current_path = (
-                f"{self.current_path}/{folder_name}"
-                if self.current_path
-                else folder_name
+        count = len(self.listing)
+        self.listing = merge_deltas(self.listing, deltas)
+        self.listing_total += len(self.listing) - count
+        if self.listing_cursor:
+            self.live_names.update(
+                delta.get("name") for delta in deltas if delta.get("op") != "remove"
             )
+
+        # Pendant une recherche, le tableau montre ses résultats : seul le
+        # contenu du dossier, réaffiché ensuite, est mis à jour.
+        if not self.searching:
+            self.model.apply_deltas(deltas)
+            if self.listing_cursor:
+                self.show_listing_status()
+
+    def reload_listing(self):
+        """Des changements ont été perdus : le dossier est relu."""
+        self.pending_deltas = []
+        get_executor().submit(
+            FileService.fetch_files,
+            self.current_partition_id,
+            self.current_path,
+            key="files",
+            on_result=self.on_listing_reloaded,
+            on_error=self.on_listing_error,
+        )
+
+    def on_listing_reloaded(self, files):
+        if not (self.searching and isinstance(files, dict)):
+            self.show_files(files)
+            return
+
+        # Les résultats de la recherche restent affichés.
+        self.listing = files.get("files") or []
+        self.listing_cursor = files.get("next_cursor")
+        self.listing_total = files.get("total", len(self.listing))
+        self.live_names = set()
+        pending, self.pending_deltas = self.pending_deltas, None
+        if pending:
+            self.apply_deltas(pending)
+        self.show_watch_error()
+
+    def on_watch_done(self, result):
+        if result == "gone":
+            self.status_label.setText("Ce dossier a été supprimé ou déplacé")
+            self.status_label.show()
+
+    def on_watch_error(self, message):
+        # Tant que le dossier n'est pas affiché, l'erreur est gardée pour
+        # ne pas être remplacée par l'état du chargement.
+        self.watch_error = message
+        if self.pending_deltas is None:
+            self.show_watch_error()
+
+    def show_watch_error(self):
+        if self.watch_error is None:
+            return
+        self.status_label.setText(f"Suivi des changements interrompu : {self.watch_error}")
+        self.status_label.show()
+        self.watch_error = None
+
+    def on_usage_toggled(self, checked):
+        if checked:
+            self.start_disk_usage()
+            return
+        get_executor().cancel("du")
+        self.model.set_usage({})
+        self.show_listing_status()
+
+    def start_disk_usage(self):
+        """
+        Lance /du sur le dossier courant. Le serveur garde les totaux des
+        sous-dossiers : rouvrir un dossier déjà parcouru est immédiat.
+        """
+        if not self.current_partition_id:
+            return
+
+        self.model.set_usage({}, pending=True)
+        get_executor().submit(
+            FileService.disk_usage,
+            self.current_partition_id,
+            self.current_path,
+            key="du",
+            on_progress=self.on_usage_progress,
+            on_result=self.on_usage_done,
+            on_error=self.on_usage_error,
+        )
+
+    def on_usage_progress(self, progress):
+        self.status_label.setText(
+            f"Calcul des tailles... {progress.get('dirs', 0)} dossiers, "
+            f"{progress.get('files', 0)} fichiers, "
+            f"{format_size(progress.get('size_bytes', 0))}"
+        )
+        self.status_label.show()
+
+    def on_usage_done(self, result):
+        if result is None:
+            return
+        usage = {
+            entry["path"].rsplit("/", 1)[-1]: entry for entry in result.get("dirs") or []
+        }
+        self.model.set_usage(usage)
+        self.show_listing_status()
+
+    def on_usage_error(self, message):
+        self.model.set_usage({})
+        self.status_label.setText(f"Erreur lors du calcul des tailles : {message}")
+        self.status_label.show()
+
+    def on_item_double_clicked(self, index):
+        if index.column() != NAME_COLUMN:
+            return
+
+        if index.row() == 0:
+            self.go_back()
+            return
+
+        file = self.model.file_at(index.row())
+        if file and file.get("type") == "directory":
+            self.current_path = self.path_of(file)
             self.load_partition_files(self.current_partition_id, self.current_path)
             self.folder_opened.emit(self.current_path)
 
     def show_details(self, file):
+        """Le tableau ne reçoit que quelques champs : la fiche est rechargée."""
+        self.setCursor(Qt.CursorShape.WaitCursor)
+        get_executor().submit(
+            FileService.fetch_file_info,
+            self.current_partition_id,
+            self.path_of(file),
+            key="details",
+            on_result=self.open_details_dialog,
+            on_error=lambda message: self.open_details_dialog(file),
+            on_finished=self.unsetCursor,
+        )
+
+    def open_details_dialog(self, file):
         dialog = QDialog(self)
         dialog.setWindowTitle(f"Détails de {file.get('name')}")
 
@@ -292,94 +521,115 @@ class FileTableWidget(QWidget):
         self.load_partition_files(self.current_partition_id, self.current_path)
         self.folder_opened.emit(self.current_path)
 
+    def path_of(self, file):
+        """Chemin d'une entrée depuis la racine de la partition."""
+        if file.get("path"):
+            return file["path"]
+        if self.current_path:
+            return f"{self.current_path}/{file['name']}"
+        return file["name"]
+
     def show_blocks_dialog(self, file):
-        path = f"{self.current_path}/{file['name']}"
+        path = self.path_of(file)
         current_partition = self.current_partition_id
 
-        blocks = getBlocksOfFile(current_partition, path)
-
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Blocks Viewer")
-        dialog.setMinimumSize(600, 400)
-        dialog.setStyleSheet("background-color: #1e1e2e; color: white;")
-
-        main_layout = QVBoxLayout(dialog)
-
-        title_label = QLabel(f"Blocks of the File {file.get('name', '')} :")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet(
-            "font-size: 16px; font-weight: bold; margin-bottom: 10px;"
+        self.setCursor(Qt.CursorShape.WaitCursor)
+        get_executor().submit(
+            getBlocksOfFile,
+            current_partition,
+            path,
+            0,
+            BLOCKS_PAGE_SIZE,
+            key="blocks",
+            on_result=lambda page: self.open_blocks_dialog(file, path, page),
+            on_error=self.on_blocks_error,
+            on_finished=self.unsetCursor,
         )
-        main_layout.addWidget(title_label)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("border: none;")
-
-        container = QWidget()
-        grid_layout = QGridLayout(container)
-        grid_layout.setSpacing(10)
-
-        row, col = 0, 0
-        max_columns = 5
-        for block_id in sorted(blocks.keys(), key=int):
-            block_btn = QPushButton(f"Block {block_id}")
-            block_btn.setFixedSize(80, 80)
-            block_btn.setStyleSheet(
-                """
-                QPushButton {
-                    background-color: #444;
-                    color: white;
-                    border: 1px solid #888;
-                    border-radius: 10px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #666;
-                }
-            """
-            )
 
-            block_btn.clicked.connect(
-                lambda _, b=block_id: self.show_block_content(self, blocks, b)
-            )
-            grid_layout.addWidget(block_btn, row, col)
+    def on_blocks_error(self, message):
+        self.status_label.setText(f"Erreur lors de la lecture des blocs : {message}")
+        self.status_label.show()
 
-            col += 1
-            if col >= max_columns:
-                col = 0
-                row += 1
+    def open_blocks_dialog(self, file, path, first_page):
+        dialog = BlockViewerDialog(
+            file.get("name", ""), self.current_partition_id, path, first_page, self
+        )
+        dialog.exec()
 
-        container.setLayout(grid_layout)
-        scroll_area.setWidget(container)
-        main_layout.addWidget(scroll_area)
+    def show_filter_error(self, message):
+        self.file_type_filter.setStyleSheet("color: #FF6B6B;")
+        self.file_type_filter.setToolTip(message)
 
-        dialog.setLayout(main_layout)
-        dialog.exec()
+    def apply_filter(self):
+        self.filter_timer.stop()
+        text = self.file_type_filter.text()
+
+        if self.recursive_check.isChecked() and text.strip():
+            try:
+                params = search_params(text)
+            except ValueError as e:
+                self.show_filter_error(str(e))
+                return
+            self.file_type_filter.setStyleSheet("color: white;")
+            self.file_type_filter.setToolTip("")
+            self.start_search(params)
+            return
 
-    def show_block_content(self, parent, blocks, block_id):
-        block_content = blocks.get(block_id, "No Data Available")
+        try:
+            predicate = parse_filter(text)
+        except ValueError as e:
+            self.show_filter_error(str(e))
+            return
 
-        content_dialog = QDialog(parent)
-        content_dialog.setWindowTitle(f"Block {block_id} Content")
-        content_dialog.setMinimumSize(500, 300)
-        content_dialog.setStyleSheet("background-color: #1e1e2e; color: white;")
+        self.file_type_filter.setStyleSheet("color: white;")
+        self.file_type_filter.setToolTip("")
+        self.stop_search()
+        self.model.set_filter(predicate)
 
-        layout = QVBoxLayout(content_dialog)
+    def start_search(self, params):
+        if not self.current_partition_id:
+            return
 
-        label = QLabel(f"Content of Block {block_id}:")
-        label.setStyleSheet("font-size: 14px; font-weight: bold;")
-        layout.addWidget(label)
+        get_executor().cancel("du")
 
-        text_area = QTextEdit()
-        text_area.setText(block_content)
-        text_area.setReadOnly(True)
-        text_area.setStyleSheet("background-color: #333; color: white; border: none;")
-        layout.addWidget(text_area)
+        self.searching = True
+        self.model.set_filter(None)
+        self.model.set_files([])
+        self.message_label.hide()
+        self.table.show()
+        self.status_label.setText("Recherche en cours...")
+        self.status_label.show()
+
+        get_executor().submit(
+            FileService.search_files,
+            self.current_partition_id,
+            self.current_path,
+            params,
+            key="search",
+            on_progress=self.on_search_progress,
+            on_result=self.on_search_done,
+            on_error=self.on_search_error,
+        )
 
-        content_dialog.setLayout(layout)
-        content_dialog.exec()
+    def on_search_progress(self, batch):
+        self.model.append_files(batch)
+        self.status_label.setText(
+            f"Recherche en cours... {self.model.rowCount() - 1} résultat(s)"
+        )
 
-    def apply_filter(self):
-        if self.current_partition_id:
-            self.load_partition_files(self.current_partition_id, self.current_path)
+    def on_search_done(self, summary):
+        message = f"{summary.get('matches', 0)} résultat(s) dans les sous-dossiers"
+        if summary.get("truncated"):
+            message += " (limite atteinte)"
+        self.status_label.setText(message)
+
+    def on_search_error(self, message):
+        self.status_label.setText(f"Erreur lors de la recherche : {message}")
+
+    def stop_search(self):
+        """Annule la recherche en cours et revient au contenu du dossier."""
+        get_executor().cancel("search")
+        if self.searching:
+            self.searching = False
+            self.model.set_files(self.listing, self.listing_cursor)
+        self.show_listing_status()
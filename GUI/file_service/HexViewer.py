@@ -0,0 +1,389 @@
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import (
+    QAbstractScrollArea,
+    QComboBox,
+    QDialog,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QVBoxLayout,
+)
+from PyQt6.QtGui import QColor, QFont, QFontDatabase, QPainter
+from PyQt6.QtCore import Qt
+
+from utils import getBlocksOfFile
+from RequestExecutor import get_executor
+
+BYTES_PER_ROW = 16
+CHUNK_BLOCKS = 128
+MAX_CACHED_CHUNKS = 64
+MAX_SCROLL = 2**30
+
+
+class RemoteByteSource:
+    """
+    Accès paresseux aux octets d'un fichier via /blocks?format=raw.
+
+    Le fichier est découpé en morceaux de CHUNK_BLOCKS blocs, chargés à la
+    demande et gardés dans un cache LRU borné : la mémoire utilisée reste
+    constante quelle que soit la taille du fichier.
+    """
+
+    def __init__(self, partition, path, first_buffer, max_chunks=MAX_CACHED_CHUNKS):
+        self.partition = partition
+        self.path = path
+        self.size = first_buffer.file_size
+        self.block_size = first_buffer.block_size
+        self.chunk_size = CHUNK_BLOCKS * self.block_size
+        self.max_chunks = max_chunks
+
+        self.chunks = OrderedDict()
+        self.pending = set()
+        self.wanted = frozenset()
+        self.listeners = []
+        self.closed = False
+
+        if first_buffer.offset == 0 and len(first_buffer) >= CHUNK_BLOCKS:
+            self.store(0, first_buffer)
+
+    def chunk_of(self, offset):
+        return offset // self.chunk_size
+
+    def row_bytes(self, offset, length):
+        """
+        Retourne les octets [offset, offset + length) s'ils sont en cache,
+        sinon None après avoir demandé le morceau correspondant.
+        """
+        index = self.chunk_of(offset)
+        buffer = self.chunks.get(index)
+        if buffer is None:
+            self.request(index)
+            return None
+
+        self.chunks.move_to_end(index)
+        start = offset - index * self.chunk_size
+        return buffer.view[start : start + length]
+
+    def set_visible_chunks(self, indexes):
+        self.wanted = frozenset(indexes)
+
+    def request(self, index):
+        if index in self.pending or self.closed:
+            return
+
+        self.pending.add(index)
+        get_executor().submit(
+            self.fetch_if_wanted,
+            index,
+            on_result=lambda buffer: self.store(index, buffer),
+            on_error=lambda message: self.pending.discard(index),
+        )
+
+    def fetch_if_wanted(self, index):
+        # Exécuté dans le pool : un morceau sorti de l'écran entre-temps
+        # n'est pas téléchargé.
+        if index not in self.wanted:
+            return None
+        return self.fetch(index)
+
+    def fetch(self, index):
+        return getBlocksOfFile(
+            self.partition, self.path, index * CHUNK_BLOCKS, CHUNK_BLOCKS
+        )
+
+    def store(self, index, buffer):
+        self.pending.discard(index)
+        if self.closed or not buffer:
+            return
+
+        self.chunks[index] = buffer
+        self.chunks.move_to_end(index)
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+
+        for listener in self.listeners:
+            listener(index)
+
+    def search(self, pattern, start, progress_callback=None, is_cancelled=None):
+        """
+        Cherche pattern à partir de start, morceau par morceau, et retourne
+        son offset ou None s'il n'apparaît pas. Un morceau illisible lève
+        son ApiError : un échec ne se confond pas avec « aucune occurrence ».
+        Exécuté dans le pool : les morceaux lus ne passent pas par le cache.
+        """
+        if not pattern:
+            return None
+
+        index = self.chunk_of(start)
+        last_index = self.chunk_of(max(self.size - 1, 0))
+        tail = b""
+        tail_offset = start
+
+        while index <= last_index:
+            if is_cancelled and is_cancelled():
+                return None
+
+            buffer = self.fetch(index)
+            if not buffer:
+                # Le fichier a raccourci depuis l'ouverture.
+                return None
+
+            chunk_start = index * self.chunk_size
+            data = bytes(buffer.view[max(start - chunk_start, 0) :])
+            window = tail + data
+            found = window.find(pattern)
+            if found >= 0:
+                return tail_offset + found
+
+            keep = len(pattern) - 1
+            tail = window[-keep:] if keep else b""
+            tail_offset = chunk_start + len(buffer.data) - len(tail)
+
+            if progress_callback:
+                progress_callback((index + 1) / (last_index + 1))
+            index += 1
+
+        return None
+
+    def close(self):
+        self.closed = True
+        self.listeners.clear()
+        self.chunks.clear()
+
+
+class HexView(QAbstractScrollArea):
+    """
+    Vue hexadécimale (offset | hex | ASCII) qui ne dessine que les lignes
+    visibles et défile sur tout le fichier.
+    """
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.source.listeners.append(self.on_chunk_loaded)
+        self.selection = None
+
+        font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        font.setPointSize(10)
+        self.setFont(font)
+        self.setStyleSheet("background-color: #333; color: white; border: none;")
+
+        self.total_rows = (source.size + BYTES_PER_ROW - 1) // BYTES_PER_ROW
+        self.verticalScrollBar().valueChanged.connect(self.viewport().update)
+        self.update_scrollbar()
+
+    def char_width(self):
+        return self.fontMetrics().horizontalAdvance("0")
+
+    def row_height(self):
+        return self.fontMetrics().height()
+
+    def visible_rows(self):
+        return max(self.viewport().height() // self.row_height(), 1)
+
+    def scroll_scale(self):
+        # Au-delà de MAX_SCROLL lignes, une unité de la barre couvre
+        # plusieurs lignes (QScrollBar est limité aux entiers 32 bits).
+        return max(1, -(-self.total_rows // MAX_SCROLL))
+
+    def update_scrollbar(self):
+        scale = self.scroll_scale()
+        max_row = max(self.total_rows - self.visible_rows(), 0)
+        bar = self.verticalScrollBar()
+        bar.setRange(0, -(-max_row // scale))
+        bar.setPageStep(max(self.visible_rows() // scale, 1))
+        bar.setSingleStep(1)
+
+    def first_row(self):
+        row = self.verticalScrollBar().value() * self.scroll_scale()
+        return min(row, max(self.total_rows - 1, 0))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_scrollbar()
+
+    def on_chunk_loaded(self, index):
+        self.viewport().update()
+
+    def goto_offset(self, offset, length=1):
+        offset = min(max(offset, 0), max(self.source.size - 1, 0))
+        self.selection = (offset, offset + length)
+        row = offset // BYTES_PER_ROW
+        target = max(row - self.visible_rows() // 2, 0)
+        self.verticalScrollBar().setValue(target // self.scroll_scale())
+        self.viewport().update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.setFont(self.font())
+        painter.fillRect(self.viewport().rect(), QColor("#333"))
+
+        char_width = self.char_width()
+        row_height = self.row_height()
+        ascent = self.fontMetrics().ascent()
+
+        hex_x = 12 * char_width
+        ascii_x = hex_x + (BYTES_PER_ROW * 3 + 2) * char_width
+
+        first_row = self.first_row()
+        last_row = min(first_row + self.visible_rows() + 1, self.total_rows)
+
+        self.source.set_visible_chunks(
+            {
+                self.source.chunk_of(row * BYTES_PER_ROW)
+                for row in (first_row, max(last_row - 1, first_row))
+            }
+        )
+
+        for i, row in enumerate(range(first_row, last_row)):
+            y = i * row_height
+            offset = row * BYTES_PER_ROW
+            length = min(BYTES_PER_ROW, self.source.size - offset)
+
+            painter.setPen(QColor("#66A3FF"))
+            painter.drawText(0, y + ascent, f"{offset:010X}")
+
+            data = self.source.row_bytes(offset, length)
+            for column in range(length):
+                x = hex_x + column * 3 * char_width
+                byte_offset = offset + column
+
+                if self.selection and self.selection[0] <= byte_offset < self.selection[1]:
+                    painter.fillRect(x, y, 2 * char_width, row_height, QColor("#3D4455"))
+                    painter.fillRect(
+                        ascii_x + column * char_width,
+                        y,
+                        char_width,
+                        row_height,
+                        QColor("#3D4455"),
+                    )
+
+                painter.setPen(QColor("white"))
+                if data is None:
+                    painter.drawText(x, y + ascent, "..")
+                    continue
+
+                value = data[column]
+                painter.drawText(x, y + ascent, f"{value:02X}")
+                char = chr(value) if 32 <= value < 127 else "."
+                painter.setPen(QColor("#aaaaaa"))
+                painter.drawText(ascii_x + column * char_width, y + ascent, char)
+
+    def closeEvent(self, event):
+        self.source.close()
+        super().closeEvent(event)
+
+
+class HexViewerDialog(QDialog):
+    """
+    Fenêtre contenant la vue hexadécimale d'un fichier complet, avec saut
+    à un offset et recherche de texte ou d'octets.
+    """
+
+    def __init__(self, file_name, partition, path, first_buffer, offset=0, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Contenu de {file_name}")
+        self.setMinimumSize(760, 500)
+        self.setStyleSheet("background-color: #1e1e2e; color: white;")
+
+        self.source = RemoteByteSource(partition, path, first_buffer)
+        self.search_key = f"hex_search_{id(self)}"
+
+        layout = QVBoxLayout(self)
+
+        title_label = QLabel(f"{file_name} ({self.source.size} octets)")
+        title_label.setStyleSheet("font-size: 14px; font-weight: bold;")
+        layout.addWidget(title_label)
+
+        tools_layout = QHBoxLayout()
+
+        self.offset_input = QLineEdit()
+        self.offset_input.setPlaceholderText("Offset (ex: 4096 ou 0x1000)")
+        self.offset_input.returnPressed.connect(self.on_goto)
+        tools_layout.addWidget(self.offset_input)
+
+        goto_btn = QPushButton("Aller")
+        goto_btn.clicked.connect(self.on_goto)
+        tools_layout.addWidget(goto_btn)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Rechercher")
+        self.search_input.returnPressed.connect(self.on_search)
+        tools_layout.addWidget(self.search_input)
+
+        self.search_mode = QComboBox()
+        self.search_mode.addItems(["Texte", "Hex"])
+        tools_layout.addWidget(self.search_mode)
+
+        search_btn = QPushButton("Suivant")
+        search_btn.clicked.connect(self.on_search)
+        tools_layout.addWidget(search_btn)
+
+        layout.addLayout(tools_layout)
+
+        self.hex_view = HexView(self.source)
+        layout.addWidget(self.hex_view)
+
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("font-size: 12px;")
+        layout.addWidget(self.status_label)
+
+        self.finished.connect(self.on_closed)
+        self.setLayout(layout)
+
+        if offset:
+            self.hex_view.goto_offset(offset, self.source.block_size)
+
+    def on_goto(self):
+        text = self.offset_input.text().strip()
+        try:
+            offset = int(text, 0)
+        except ValueError:
+            self.status_label.setText(f"Offset invalide : {text}")
+            return
+        self.status_label.setText("")
+        self.hex_view.goto_offset(offset)
+
+    def search_pattern(self):
+        text = self.search_input.text()
+        if self.search_mode.currentText() == "Hex":
+            return bytes.fromhex(text.replace(" ", ""))
+        return text.encode("utf-8")
+
+    def on_search(self):
+        try:
+            pattern = self.search_pattern()
+        except ValueError:
+            self.status_label.setText("Motif hexadécimal invalide")
+            return
+        if not pattern:
+            return
+
+        start = self.hex_view.selection[0] + 1 if self.hex_view.selection else 0
+        self.status_label.setText("Recherche...")
+        get_executor().submit(
+            self.source.search,
+            pattern,
+            start,
+            key=self.search_key,
+            on_result=lambda offset: self.on_search_done(offset, len(pattern)),
+            on_error=lambda message: self.status_label.setText(
+                f"Recherche impossible : {message}"
+            ),
+            on_progress=lambda value: self.status_label.setText(
+                f"Recherche... {int(value * 100)}%"
+            ),
+        )
+
+    def on_search_done(self, offset, length):
+        if offset is None:
+            self.status_label.setText("Aucune occurrence trouvée")
+            return
+        self.status_label.setText(f"Trouvé à l'offset {offset} (0x{offset:X})")
+        self.hex_view.goto_offset(offset, length)
+
+    def on_closed(self):
+        get_executor().cancel(self.search_key)
+        self.source.close()
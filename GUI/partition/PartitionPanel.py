@@ -78,6 +78,7 @@ class PartitionPanel(QFrame):
     def show_loading(self, disk_name):
         self.clear_partitions()
         self.info_label.setText(f"Chargement des partitions de {disk_name}...")
+        self.info_label.setStyleSheet("color: white; font-size: 14px;")
 
     def show_error(self, message):
         self.clear_partitions()
@@ -1,3 +1,5 @@
+from RequestExecutor import get_executor
+
 from .PartitionService import PartitionService
 
 
@@ -26,7 +28,18 @@ class PartitionPresenter:
 
         self.view.show_partition_loading(disk_name)
 
-        partitions, error = PartitionService.get_partitions_for_disk(disk_name)
+        get_executor().submit(
+            PartitionService.get_partitions_for_disk,
+            disk_name,
+            key="partitions",
+            on_result=lambda response: self.on_partitions_loaded(disk_name, response),
+            on_error=lambda message: self.on_partitions_loaded(
+                disk_name, (None, message)
+            ),
+        )
+
+    def on_partitions_loaded(self, disk_name, response):
+        partitions, error = response
 
         if error:
             self.view.show_partition_error(
@@ -1,4 +1,6 @@
 import requests
+
+from api import get_client, get_partition_repository, PARTITIONS_ENDPOINT
 from .PartitionModel import Partition
 
 
@@ -8,17 +10,10 @@ class PartitionService:
     Traite les requêtes et transforme les réponses en objets métier.
     """
 
-    BASE_URL = "http://localhost:8080"
-    PARTITIONS_ENDPOINT = "/partitions"
-
     @staticmethod
     def get_partitions_for_disk(disk_name):
         try:
-            url = f"{PartitionService.BASE_URL}{PartitionService.PARTITIONS_ENDPOINT}"
-            params = {"disk": disk_name}
-            response = requests.get(url, params=params, timeout=5)
-            response.raise_for_status()
-            partitions_data = response.json()
+            partitions_data = get_partition_repository().get(disk_name)
 
             if not isinstance(partitions_data, list):
                 return None, "Format de réponse invalide"
@@ -32,14 +27,17 @@ class PartitionService:
         except requests.exceptions.RequestException as e:
             return None, str(e)
 
+    @staticmethod
+    def invalidate(disk_name=None):
+        get_partition_repository().invalidate(disk_name)
+
     @staticmethod
     def get_partition_details(partition_name):
         try:
-            url = f"{PartitionService.BASE_URL}{PartitionService.PARTITIONS_ENDPOINT}"
             params = {"name": partition_name}
-            response = requests.get(url, params=params, timeout=5)
-            response.raise_for_status()
-            partition_data = response.json()
+            partition_data = get_client().get_json(
+                PARTITIONS_ENDPOINT, params=params, timeout=5
+            )
 
             if not partition_data:
                 return None, f"Partition {partition_name} non trouvée"
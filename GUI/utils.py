@@ -1,21 +1,19 @@
 import requests
 
-SERVER_IP = "localhost"
-SERVER_PORT = 8080
-PROTOCOL = "http"
-BASE_URL = f"{PROTOCOL}://{SERVER_IP}:{SERVER_PORT}"
-DISKS_ENDPOINT = "/disks"
-PARTITIONS_ENDPOINT = "/partitions"
-FILES_ENDPOINT = "/files"
-BLOCKS_ENDPOINT = "/blocks"
+from api import (
+    BlockBuffer,
+    get_client,
+    get_partition_repository,
+    DISKS_ENDPOINT,
+    FILES_ENDPOINT,
+    BLOCKS_ENDPOINT,
+)
+from api.ApiErrors import api_error
 
 
 def get_disks():
-    url = f"{BASE_URL}{DISKS_ENDPOINT}"
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        disks_data = response.json()
+        disks_data = get_client().get_json(DISKS_ENDPOINT)
 
         disks_list = [(disk["name"], disk["capacity_gb"]) for disk in disks_data]
         return disks_list
@@ -25,13 +23,10 @@ def get_disks():
 
 
 def get_partitions_from_disk(disk_name):
-    url = f"{BASE_URL}{PARTITIONS_ENDPOINT}?disk={disk_name}"
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        partitions_data = response.json()
+        partitions_data = get_partition_repository().get(disk_name)
 
-        partitions_dict = [dict(partition) for partition in partitions_data]
+        partitions_dict = [dict(partition) for partition in partitions_data or []]
         return partitions_dict
     except requests.exceptions.RequestException as e:
         print(
@@ -40,6 +35,15 @@ def get_partitions_from_disk(disk_name):
         return []
 
 
+def get_partitions_of_disks(disk_names):
+    """Partitions de plusieurs disques, chargées en une seule requête."""
+    try:
+        return get_partition_repository().get_many(disk_names)
+    except requests.exceptions.RequestException as e:
+        print(f"Erreur lors de la récupération des partitions des disques: {e}")
+        return {}
+
+
 def getFilesAndfolderList(partitionName, path=None, filter=None):
     params = {"partition": partitionName}
     if path:
@@ -47,27 +51,24 @@ def getFilesAndfolderList(partitionName, path=None, filter=None):
     if filter:
         params["filter"] = filter
 
-    url = f"{BASE_URL}{FILES_ENDPOINT}"
-
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-
-        return response.json()
+        return get_client().get_json(FILES_ENDPOINT, params=params)
     except requests.exceptions.RequestException as e:
         print(f"Erreur lors de la récupération des fichiers: {e}")
         return []
 
 
-def getBlocksOfFile(partition, path):
-    params = {"partition": partition, "path": path}
-    url = f"{BASE_URL}{BLOCKS_ENDPOINT}"
+def getBlocksOfFile(partition, path, offset=0, count=None):
+    """
+    Blocs [offset, offset + count) du fichier. Un échec lève ApiError : un
+    fichier vide donne un BlockBuffer vide, pas une erreur.
+    """
+    params = {"partition": partition, "path": path, "offset": offset, "format": "raw"}
+    if count:
+        params["count"] = count
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-
-        return response.json()
+        response = get_client().get(BLOCKS_ENDPOINT, params=params)
     except requests.exceptions.RequestException as e:
-        print(f"Erreur lors de la récupération des blocs du fichier: {e}")
-        return []
+        raise api_error(e, BLOCKS_ENDPOINT) from e
+    return BlockBuffer.from_response(response)
@@ -19,14 +19,82 @@
 package main
 
 import (
+  "context"
   "encoding/json"
-  "os"
   "net/http"
+  "strconv"
+  "time"
   "github.com/gin-gonic/gin"
 )
 
+func nameMatcherFromQuery(c *gin.Context) (NameMatcher, error) {
+  return NewNameMatcher(FilterOptions{
+    Contains:      c.Query("filter"),
+    Extensions:    ParseExtensions(c.Query("ext")),
+    Glob:          c.Query("glob"),
+    Regex:         c.Query("regex"),
+    CaseSensitive: c.Query("case") == "sensitive",
+  })
+}
+
+// searchOptionsFromQuery lit les critères communs à /search et
+// /index/query ; en cas d'erreur, la réponse 400 est déjà envoyée.
+func searchOptionsFromQuery(c *gin.Context) (SearchOptions, bool) {
+  match, err := nameMatcherFromQuery(c)
+  if err != nil {
+    c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+    return SearchOptions{}, false
+  }
+
+  opts := SearchOptions{Match: match, Type: c.Query("type")}
+  if opts.Type != "" && opts.Type != "file" && opts.Type != "directory" && opts.Type != "symlink" {
+    c.JSON(http.StatusBadRequest, gin.H{"error": "type must be file, directory or symlink"})
+    return opts, false
+  }
+
+  for name, bound := range map[string]*string{"min_mtime": &opts.MinModified, "max_mtime": &opts.MaxModified} {
+    if value := c.Query(name); value != "" {
+      if *bound, err = ParseSearchDate(value); err != nil {
+        c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+        return opts, false
+      }
+    }
+  }
+
+  var ok bool
+  if opts.MinSize, ok = intQuery(c, "min_size", -1, 0, 1<<62); !ok {
+    return opts, false
+  }
+  if opts.MaxSize, ok = intQuery(c, "max_size", -1, 0, 1<<62); !ok {
+    return opts, false
+  }
+  return opts, true
+}
+
+// intQuery lit un paramètre entier optionnel compris entre min et max.
+func intQuery(c *gin.Context, name string, def int64, min int64, max int64) (int64, bool) {
+  raw, ok := c.GetQuery(name)
+  if !ok || raw == "" {
+    return def, true
+  }
+  value, err := strconv.ParseInt(raw, 10, 64)
+  if err != nil || value < min || value > max {
+    c.JSON(http.StatusBadRequest, gin.H{"error": name + " must be an integer between " + strconv.FormatInt(min, 10) + " and " + strconv.FormatInt(max, 10)})
+    return 0, false
+  }
+  return value, true
+}
+
 func main() {
   r := gin.Default()
+  // Placé avant Compression : les octets comptés sont ceux envoyés.
+  r.Use(Instrument())
+  r.Use(Compression())
+
+  r.GET("/metrics", MetricsHandler)
+  if PprofEnabled() {
+    RegisterPprof(r)
+  }
 
   r.GET("/disks", func(c *gin.Context) {
     data, err := GetDisksInfoJSON()
@@ -59,7 +127,12 @@ func main() {
     }
 
     path := c.Query("path")
-    filter := c.Query("filter")
+
+    match, err := nameMatcherFromQuery(c)
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+      return
+    }
 
     mountPath, err := getMountPoint(partition)
     if err != nil {
@@ -67,28 +140,89 @@ func main() {
       return
     }
 
-    if _, err := os.Stat(mountPath); os.IsNotExist(err) {
+    if !Mounts().Accessible(mountPath) {
       c.JSON(http.StatusBadRequest, gin.H{"error": "The mount point is not accessible"})
       return
     }
 
-    data, err := listRootFiles(mountPath, path)
-    if err != nil {
-      c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+    if NotModified(c, dirPathOf(mountPath, path)) {
       return
     }
 
-    if filter == "" {
-      c.JSON(http.StatusOK, json.RawMessage(data))
-    } else {
-      filteredData, err := FilterFilesByName([]byte(data), filter)
+    if countOnly, _ := strconv.ParseBool(c.Query("count_only")); countOnly {
+      total, err := countFiles(mountPath, path, match)
       if err != nil {
         c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
         return
       }
+      c.JSON(http.StatusOK, gin.H{"mount_path": mountPath, "total": total})
+      return
+    }
+
+    limit, ok := intQuery(c, "limit", 0, 0, MaxFilesPageSize)
+    if !ok {
+      return
+    }
+
+    cursor := c.Query("cursor")
+    if cursor != "" {
+      if _, err := DecodeCursor(cursor); err != nil {
+        c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+        return
+      }
+    }
 
-      c.JSON(http.StatusOK, json.RawMessage(filteredData))
+    workers, ok := intQuery(c, "workers", int64(DefaultStatWorkers()), 1, MaxStatWorkers)
+    if !ok {
+      return
     }
+
+    fields, err := ParseFileFields(c.Query("fields"))
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+      return
+    }
+
+    content, err := listFilesPage(mountPath, path, ListOptions{Match: match, Cursor: cursor, Limit: int(limit), Fields: fields, Workers: int(workers)})
+    if err != nil {
+      c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+      return
+    }
+
+    c.JSON(http.StatusOK, content)
+  })
+
+  r.GET("/files/info", func(c *gin.Context) {
+    partition := c.Query("partition")
+    path := c.Query("path")
+    if partition == "" || path == "" {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "partition and path parameters are required"})
+      return
+    }
+
+    mountPath, err := getMountPoint(partition)
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "No mount point found for the given partition"})
+      return
+    }
+
+    if !Mounts().Accessible(mountPath) {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "The mount point is not accessible"})
+      return
+    }
+
+    filePath := RemoveDoubleSlashes(mountPath + AddSlash(path))
+    if NotModified(c, filePath) {
+      return
+    }
+
+    info, err := statFile(filePath)
+    if err != nil {
+      c.JSON(http.StatusNotFound, gin.H{"error": err.Error()})
+      return
+    }
+
+    c.JSON(http.StatusOK, info)
   })
 
   r.GET("/blocks", func(c *gin.Context) {
@@ -110,23 +244,375 @@ func main() {
       return
     }
 
-    if _, err := os.Stat(mountPath); os.IsNotExist(err) {
+    if !Mounts().Accessible(mountPath) {
       c.JSON(http.StatusBadRequest, gin.H{"error": "The mount point is not accessible"})
       return
     }
 
-    path = AddSlash(path)
+    offset, err := strconv.ParseInt(c.DefaultQuery("offset", "0"), 10, 64)
+    if err != nil || offset < 0 {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "offset must be a positive integer"})
+      return
+    }
+
+    count, err := strconv.Atoi(c.DefaultQuery("count", strconv.Itoa(DefaultBlockCount)))
+    if err != nil || count <= 0 {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "count must be a strictly positive integer"})
+      return
+    }
+
+    filePath := RemoveDoubleSlashes(mountPath + AddSlash(path))
+    if NotModified(c, filePath) {
+      return
+    }
+
+    if c.Query("format") == "raw" || c.GetHeader("Accept") == "application/octet-stream" {
+      if err := ServeRawBlocks(c.Writer, c.Request, filePath, offset, count); err != nil {
+        c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+      }
+      return
+    }
 
-	  blocks, err := GenerateJSON(RemoveDoubleSlashes(mountPath + path))
+	  page, err := GenerateBlockPage(filePath, offset, count)
 
 	  if err != nil {
       c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 		  return
 	  }
     
-    c.JSON(http.StatusOK, json.RawMessage(blocks))
+    c.JSON(http.StatusOK, page)
+  })
+
+  r.GET("/sectors", func(c *gin.Context) {
+    device := c.Query("device")
+    image := c.Query("image")
+    if (device == "") == (image == "") {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "exactly one of device or image is required"})
+      return
+    }
+
+    sectorSize, ok := intQuery(c, "sector_size", 0, MinSectorSize, MaxSectorSize)
+    if !ok {
+      return
+    }
+    if sectorSize != 0 && !ValidSectorSize(int(sectorSize)) {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "sector_size must be a power of 2"})
+      return
+    }
+    offset, ok := intQuery(c, "offset", 0, 0, 1<<62)
+    if !ok {
+      return
+    }
+    count, ok := intQuery(c, "count", DefaultSectorCount, 1, MaxSectorBytes/MinSectorSize)
+    if !ok {
+      return
+    }
+
+    var source SectorSource
+    var err error
+    if device != "" {
+      source, err = DeviceSectorSource(device, int(sectorSize))
+    } else {
+      source, err = ImageSectorSource(image, int(sectorSize))
+    }
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+      return
+    }
+
+    if c.Query("format") == "raw" || c.GetHeader("Accept") == "application/octet-stream" {
+      if err := ServeRawSectors(c.Writer, source, offset, int(count)); err != nil && !c.Writer.Written() {
+        c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+      }
+      return
+    }
+
+    page, err := GenerateSectorPage(source, offset, int(count))
+    if err != nil {
+      c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+      return
+    }
+    c.JSON(http.StatusOK, page)
   })
 
+  r.GET("/search", func(c *gin.Context) {
+    partition := c.Query("partition")
+    if partition == "" {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "partition parameter is required"})
+      return
+    }
+
+    opts, ok := searchOptionsFromQuery(c)
+    if !ok {
+      return
+    }
+
+    var limit, depth, workers int64
+    if limit, ok = intQuery(c, "limit", DefaultSearchLimit, 1, MaxSearchLimit); !ok {
+      return
+    }
+    if depth, ok = intQuery(c, "max_depth", 0, 0, 4096); !ok {
+      return
+    }
+    if workers, ok = intQuery(c, "workers", int64(DefaultSearchWorkers()), 1, MaxSearchWorkers); !ok {
+      return
+    }
+    opts.MaxDepth = int(depth)
+    opts.Workers = int(workers)
+
+    mountPath, err := getMountPoint(partition)
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "No mount point found for the given partition"})
+      return
+    }
+
+    if !Mounts().Accessible(mountPath) {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "The mount point is not accessible"})
+      return
+    }
+
+    // Le contexte de la requête est annulé à la déconnexion du client,
+    // ce qui arrête le parcours.
+    ctx, cancel := context.WithCancel(c.Request.Context())
+    defer cancel()
+
+    results, err := SearchFiles(ctx, mountPath, c.Query("path"), opts)
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+      return
+    }
+
+    c.Header("Content-Type", "application/x-ndjson")
+    c.Header("X-Content-Type-Options", "nosniff")
+    c.Status(http.StatusOK)
+
+    encoder := json.NewEncoder(c.Writer)
+    matches := 0
+    for result := range results {
+      if matches == int(limit) {
+        cancel()
+        continue
+      }
+      if err := encoder.Encode(result); err != nil {
+        cancel()
+        continue
+      }
+      matches++
+      if len(results) == 0 {
+        c.Writer.Flush()
+      }
+    }
+
+    encoder.Encode(gin.H{"done": true, "matches": matches, "truncated": matches == int(limit) && ctx.Err() != nil})
+    c.Writer.Flush()
+  })
+
+  r.GET("/du", func(c *gin.Context) {
+    partition := c.Query("partition")
+    if partition == "" {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "partition parameter is required"})
+      return
+    }
+
+    depth, ok := intQuery(c, "max_depth", 1, 0, 64)
+    if !ok {
+      return
+    }
+    workers, ok := intQuery(c, "workers", int64(DefaultStatWorkers()), 1, MaxStatWorkers)
+    if !ok {
+      return
+    }
+    refresh, _ := strconv.ParseBool(c.Query("refresh"))
+
+    mountPath, err := getMountPoint(partition)
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "No mount point found for the given partition"})
+      return
+    }
+
+    if !Mounts().Accessible(mountPath) {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "The mount point is not accessible"})
+      return
+    }
+
+    // Comme pour /search, la déconnexion du client arrête le parcours.
+    ctx, cancel := context.WithCancel(c.Request.Context())
+    defer cancel()
+
+    scan, err := StartDiskUsage(ctx, mountPath, c.Query("path"), DuOptions{MaxDepth: int(depth), Workers: int(workers), Refresh: refresh})
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+      return
+    }
+
+    c.Header("Content-Type", "application/x-ndjson")
+    c.Header("X-Content-Type-Options", "nosniff")
+    c.Status(http.StatusOK)
+
+    encoder := json.NewEncoder(c.Writer)
+    ticker := time.NewTicker(DuProgressInterval)
+    defer ticker.Stop()
+    for {
+      select {
+      case <-scan.Done():
+        result, err := scan.Result()
+        if err != nil {
+          return
+        }
+        encoder.Encode(gin.H{"done": true, "total": result.Total, "dirs": result.Dirs})
+        c.Writer.Flush()
+        return
+      case <-ticker.C:
+        if err := encoder.Encode(gin.H{"progress": scan.Progress()}); err != nil {
+          cancel()
+          continue
+        }
+        c.Writer.Flush()
+      }
+    }
+  })
+
+  r.GET("/watch", func(c *gin.Context) {
+    partition := c.Query("partition")
+    if partition == "" {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "partition parameter is required"})
+      return
+    }
+
+    mountPath, err := getMountPoint(partition)
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "No mount point found for the given partition"})
+      return
+    }
+
+    if !Mounts().Accessible(mountPath) {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "The mount point is not accessible"})
+      return
+    }
+
+    sub, err := WatchDir(dirPathOf(mountPath, c.Query("path")))
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+      return
+    }
+    defer sub.Close()
+
+    c.Header("Content-Type", "text/event-stream")
+    c.Header("Cache-Control", "no-cache")
+    c.Header("X-Accel-Buffering", "no")
+    c.Status(http.StatusOK)
+
+    // "ready" indique que le watch est posé : les changements suivants
+    // seront tous envoyés.
+    WriteWatchEvent(c.Writer, "ready", gin.H{"path": c.Query("path")})
+    c.Writer.Flush()
+
+    heartbeat := time.NewTicker(WatchHeartbeatInterval)
+    defer heartbeat.Stop()
+    for {
+      select {
+      case <-c.Request.Context().Done():
+        return
+      case deltas, ok := <-sub.Deltas():
+        if !ok {
+          WriteWatchEvent(c.Writer, "gone", gin.H{"path": c.Query("path")})
+          c.Writer.Flush()
+          return
+        }
+        err = WriteWatchEvent(c.Writer, "deltas", deltas)
+      case <-sub.Reset():
+        err = WriteWatchEvent(c.Writer, "reset", gin.H{})
+      case <-heartbeat.C:
+        _, err = c.Writer.Write([]byte(": ping\n\n"))
+      }
+      if err != nil {
+        return
+      }
+      c.Writer.Flush()
+    }
+  })
+
+  r.POST("/index", func(c *gin.Context) {
+    partition := c.Query("partition")
+    if partition == "" {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "partition parameter is required"})
+      return
+    }
+
+    mountPath, err := getMountPoint(partition)
+    if err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "No mount point found for the given partition"})
+      return
+    }
+
+    idx := GetPartitionIndex(partition)
+    idx.StartRefresh(mountPath)
+    c.JSON(http.StatusAccepted, idx.Status())
+  })
+
+  r.GET("/index", func(c *gin.Context) {
+    partition := c.Query("partition")
+    if partition == "" {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "partition parameter is required"})
+      return
+    }
+
+    c.JSON(http.StatusOK, GetPartitionIndex(partition).Status())
+  })
+
+  r.GET("/index/query", func(c *gin.Context) {
+    partition := c.Query("partition")
+    if partition == "" {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "partition parameter is required"})
+      return
+    }
+
+    opts, ok := searchOptionsFromQuery(c)
+    if !ok {
+      return
+    }
+
+    limit, ok := intQuery(c, "limit", DefaultSearchLimit, 1, MaxSearchLimit)
+    if !ok {
+      return
+    }
+
+    sortBy := c.DefaultQuery("sort", "path")
+    if sortBy != "path" && sortBy != "name" && sortBy != "size" && sortBy != "mtime" {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "sort must be path, name, size or mtime"})
+      return
+    }
+
+    result, err := GetPartitionIndex(partition).Query(IndexQuery{
+      Options:    opts,
+      Path:       c.Query("path"),
+      Sort:       sortBy,
+      Descending: c.Query("order") == "desc",
+      Limit:      int(limit),
+    })
+    if err != nil {
+      c.JSON(http.StatusNotFound, gin.H{"error": err.Error()})
+      return
+    }
+
+    c.JSON(http.StatusOK, result)
+  })
+
+  r.POST("/batch", func(c *gin.Context) {
+    var batch struct {
+      Requests []BatchRequest `json:"requests"`
+    }
+    if err := json.NewDecoder(c.Request.Body).Decode(&batch); err != nil {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "invalid batch body: " + err.Error()})
+      return
+    }
+    if len(batch.Requests) == 0 || len(batch.Requests) > MaxBatchRequests {
+      c.JSON(http.StatusBadRequest, gin.H{"error": "requests must contain between 1 and " + strconv.Itoa(MaxBatchRequests) + " entries"})
+      return
+    }
+
+    c.JSON(http.StatusOK, gin.H{"responses": RunBatch(c.Request.Context(), r, batch.Requests, MaxBatchWorkers)})
+  })
 
   r.Run("0.0.0.0:8080")
 }
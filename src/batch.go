@@ -0,0 +1,113 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"context"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"net/url"
+	"sync"
+	"sync/atomic"
+)
+
+const (
+	MaxBatchRequests = 100
+	MaxBatchWorkers  = 16
+)
+
+// batchRoutes sont les routes GET à réponse JSON utilisables dans /batch.
+var batchRoutes = map[string]bool{
+	"/disks":       true,
+	"/partitions":  true,
+	"/files":       true,
+	"/files/info":  true,
+	"/blocks":      true,
+	"/sectors":     true,
+	"/index":       true,
+	"/index/query": true,
+}
+
+type BatchRequest struct {
+	Path   string            `json:"path"`
+	Params map[string]string `json:"params"`
+}
+
+type BatchResponse struct {
+	Status int             `json:"status"`
+	Body   json.RawMessage `json:"body"`
+}
+
+func batchError(status int, message string) BatchResponse {
+	body, _ := json.Marshal(map[string]string{"error": message})
+	return BatchResponse{Status: status, Body: body}
+}
+
+// runBatchRequest passe une sous-requête au routeur, comme si elle était
+// arrivée seule : validation, erreurs et ETag restent ceux de la route.
+func runBatchRequest(ctx context.Context, handler http.Handler, request BatchRequest) BatchResponse {
+	if !batchRoutes[request.Path] {
+		return batchError(http.StatusNotFound, "Route non prise en charge dans un lot : "+request.Path)
+	}
+	if request.Params["format"] == "raw" {
+		return batchError(http.StatusBadRequest, "format=raw n'est pas pris en charge dans un lot")
+	}
+
+	query := url.Values{}
+	for name, value := range request.Params {
+		query.Set(name, value)
+	}
+	httpRequest, err := http.NewRequestWithContext(ctx, http.MethodGet, request.Path+"?"+query.Encode(), nil)
+	if err != nil {
+		return batchError(http.StatusBadRequest, err.Error())
+	}
+	httpRequest.Header.Set("Accept", "application/json")
+
+	recorder := httptest.NewRecorder()
+	handler.ServeHTTP(recorder, httpRequest)
+
+	body := recorder.Body.Bytes()
+	if !json.Valid(body) {
+		body = []byte("null")
+	}
+	return BatchResponse{Status: recorder.Code, Body: body}
+}
+
+// RunBatch exécute les sous-requêtes sur handler, au plus workers à la
+// fois, et retourne leurs réponses dans l'ordre des requêtes.
+func RunBatch(ctx context.Context, handler http.Handler, requests []BatchRequest, workers int) []BatchResponse {
+	responses := make([]BatchResponse, len(requests))
+
+	var next atomic.Int64
+	var wg sync.WaitGroup
+	for w := 0; w < min(workers, len(requests)); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := int(next.Add(1)) - 1; i < len(requests); i = int(next.Add(1)) - 1 {
+				responses[i] = runBatchRequest(ctx, handler, requests[i])
+			}
+		}()
+	}
+	wg.Wait()
+
+	return responses
+}
@@ -22,9 +22,26 @@ package main
 import (
 	"encoding/hex"
 	"encoding/json"
+	"io"
+	"net/http"
 	"os"
+	"strconv"
 )
 
+const (
+	BlockSize         = 512
+	DefaultBlockCount = 256
+	MaxBlockCount     = 4096
+)
+
+type BlockPage struct {
+	TotalBlocks int64            `json:"total_blocks"`
+	BlockSize   int              `json:"block_size"`
+	Offset      int64            `json:"offset"`
+	Count       int              `json:"count"`
+	Blocks      map[int64]string `json:"blocks"`
+}
+
 func ReadBlock(file *os.File, blockNumber int) (string, error) {
 	const blockSize = 512
 
@@ -76,3 +93,97 @@ func GenerateJSON(filePath string) (string, error) {
 
 	return string(jsonData), nil
 }
+
+func GenerateBlockPage(filePath string, offset int64, count int) (BlockPage, error) {
+	file, err := os.Open(filePath)
+	if err != nil {
+		return BlockPage{}, err
+	}
+	defer file.Close()
+
+	fileInfo, err := file.Stat()
+	if err != nil {
+		return BlockPage{}, err
+	}
+
+	if count > MaxBlockCount {
+		count = MaxBlockCount
+	}
+
+	page := BlockPage{
+		TotalBlocks: totalBlocks(fileInfo.Size()),
+		BlockSize:   BlockSize,
+		Offset:      offset,
+		Blocks:      make(map[int64]string),
+	}
+
+	if offset >= page.TotalBlocks || count <= 0 {
+		return page, nil
+	}
+	if remaining := page.TotalBlocks - offset; int64(count) > remaining {
+		count = int(remaining)
+	}
+
+	buffer := make([]byte, count*BlockSize)
+	n, err := file.ReadAt(buffer, offset*BlockSize)
+	if err != nil && err != io.EOF {
+		return BlockPage{}, err
+	}
+
+	for i := 0; i*BlockSize < n; i++ {
+		end := (i + 1) * BlockSize
+		if end > n {
+			end = n
+		}
+		page.Blocks[offset+int64(i)] = hex.EncodeToString(buffer[i*BlockSize : end])
+		page.Count++
+	}
+
+	return page, nil
+}
+
+func totalBlocks(fileSize int64) int64 {
+	return (fileSize + BlockSize - 1) / BlockSize
+}
+
+// ServeRawBlocks envoie les octets bruts du fichier en
+// application/octet-stream. Un en-tête "Range: bytes=..." est appliqué à
+// tout le fichier ; sans lui, seule la fenêtre de count blocs à partir de
+// offset est envoyée.
+func ServeRawBlocks(w http.ResponseWriter, r *http.Request, filePath string, offset int64, count int) error {
+	file, err := os.Open(filePath)
+	if err != nil {
+		return err
+	}
+	defer file.Close()
+
+	fileInfo, err := file.Stat()
+	if err != nil {
+		return err
+	}
+	fileSize := fileInfo.Size()
+
+	header := w.Header()
+	header.Set("Content-Type", "application/octet-stream")
+	header.Set("X-Block-Size", strconv.Itoa(BlockSize))
+	header.Set("X-Total-Blocks", strconv.FormatInt(totalBlocks(fileSize), 10))
+	header.Set("X-File-Size", strconv.FormatInt(fileSize, 10))
+
+	var content io.ReadSeeker = file
+	if r.Header.Get("Range") == "" {
+		// Comme dans GenerateBlockPage, offset est comparé au nombre de
+		// blocs avant toute multiplication : un offset énorme déborderait
+		// et désignerait un autre bloc.
+		count = min(count, MaxBlockCount)
+		start, length := fileSize, int64(0)
+		if offset >= 0 && offset < totalBlocks(fileSize) && count > 0 {
+			start = offset * BlockSize
+			length = min(int64(count)*BlockSize, fileSize-start)
+		}
+		header.Set("X-Block-Offset", strconv.FormatInt(offset, 10))
+		content = io.NewSectionReader(file, start, length)
+	}
+
+	http.ServeContent(w, r, fileInfo.Name(), fileInfo.ModTime(), content)
+	return nil
+}
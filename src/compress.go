@@ -0,0 +1,142 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"compress/gzip"
+	"strconv"
+	"strings"
+	"sync"
+
+	"github.com/gin-gonic/gin"
+)
+
+var gzipWriters = sync.Pool{
+	New: func() interface{} {
+		writer, _ := gzip.NewWriterLevel(nil, gzip.BestSpeed)
+		return writer
+	},
+}
+
+// compressible indique si un type de contenu gagne à être compressé : les
+// réponses JSON et texte, pas les blocs bruts (servis par plages d'octets)
+// ni les flux d'événements de /watch, faits de petits messages espacés.
+func compressible(contentType string) bool {
+	if strings.HasPrefix(contentType, "text/event-stream") {
+		return false
+	}
+	return strings.HasPrefix(contentType, "application/json") ||
+		strings.HasPrefix(contentType, "application/x-ndjson") ||
+		strings.HasPrefix(contentType, "text/")
+}
+
+// acceptsGzip lit l'en-tête Accept-Encoding, en tenant compte de "q=0".
+func acceptsGzip(header string) bool {
+	for _, part := range strings.Split(header, ",") {
+		name, params, _ := strings.Cut(strings.TrimSpace(part), ";")
+		name = strings.ToLower(strings.TrimSpace(name))
+		if name != "gzip" && name != "*" {
+			continue
+		}
+		_, quality, found := strings.Cut(strings.ReplaceAll(params, " ", ""), "q=")
+		if !found {
+			return true
+		}
+		q, err := strconv.ParseFloat(quality, 64)
+		return err == nil && q > 0
+	}
+	return false
+}
+
+// compressWriter compresse le corps de la réponse. La décision est prise
+// à la première écriture, une fois le type de contenu et le statut connus.
+type compressWriter struct {
+	gin.ResponseWriter
+	gz      *gzip.Writer
+	decided bool
+}
+
+func (w *compressWriter) decide() {
+	if w.decided {
+		return
+	}
+	w.decided = true
+
+	header := w.Header()
+	status := w.Status()
+	if status < 200 || status == 204 || status == 206 || status == 304 ||
+		header.Get("Content-Encoding") != "" || !compressible(header.Get("Content-Type")) {
+		return
+	}
+
+	header.Set("Content-Encoding", "gzip")
+	header.Del("Content-Length")
+	w.gz = gzipWriters.Get().(*gzip.Writer)
+	w.gz.Reset(w.ResponseWriter)
+}
+
+func (w *compressWriter) Write(data []byte) (int, error) {
+	w.decide()
+	if w.gz != nil {
+		return w.gz.Write(data)
+	}
+	return w.ResponseWriter.Write(data)
+}
+
+func (w *compressWriter) WriteString(s string) (int, error) {
+	return w.Write([]byte(s))
+}
+
+// Flush envoie ce qui a déjà été compressé : les flux NDJSON de /search
+// restent progressifs.
+func (w *compressWriter) Flush() {
+	if w.gz != nil {
+		w.gz.Flush()
+	}
+	w.ResponseWriter.Flush()
+}
+
+func (w *compressWriter) close() {
+	if w.gz == nil {
+		return
+	}
+	w.gz.Close()
+	gzipWriters.Put(w.gz)
+	w.gz = nil
+}
+
+// Compression compresse en gzip les réponses des clients qui l'acceptent.
+func Compression() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		c.Header("Vary", "Accept-Encoding")
+		if c.Request.Method == "HEAD" || !acceptsGzip(c.GetHeader("Accept-Encoding")) {
+			c.Next()
+			return
+		}
+
+		writer := &compressWriter{ResponseWriter: c.Writer}
+		c.Writer = writer
+		defer func() {
+			writer.close()
+			c.Writer = writer.ResponseWriter
+		}()
+		c.Next()
+	}
+}
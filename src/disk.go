@@ -22,13 +22,12 @@ package main
 import (
 	"encoding/json"
 	"fmt"
+	"os"
 	"os/exec"
 	"runtime"
 	"strconv"
 	"strings"
-
-
-	"github.com/shirou/gopsutil/v3/disk"
+	"sync"
 )
 
 type DiskInfo struct {
@@ -63,38 +62,17 @@ func GetDisksInfoJSON() (string, error) {
 }
 
 func getPhysicalDisks() ([]string, error) {
-	partitions, err := disk.Partitions(false)
+	topo, err := Topologies().Get()
 	if err != nil {
 		return nil, err
 	}
 
 	var disks []string
-	seenDisks := make(map[string]bool)
-
-	for _, part := range partitions {
-		diskName := part.Device
-
-		if strings.Contains(diskName, "loop") {
+	for _, disk := range topo.Disks {
+		if !disk.Physical || disk.SizeBytes == 0 {
 			continue
 		}
-
-		if strings.Contains(diskName, "nvme") && strings.Contains(diskName, "p") {
-			diskName = strings.Split(diskName, "p")[0]
-
-		} else if strings.HasPrefix(diskName, "/dev/sd") || strings.HasPrefix(diskName, "/dev/vd") {
-			diskName = trimLastDigit(diskName)
-
-		} else if strings.HasPrefix(diskName, "/dev/mmcblk") && strings.Contains(diskName, "p") {
-			diskName = strings.Split(diskName, "p")[0]
-
-		} else if strings.HasPrefix(diskName, "/dev/md") && strings.Contains(diskName, "p") {
-			diskName = strings.Split(diskName, "p")[0]
-		}
-
-		if !seenDisks[diskName] {
-			seenDisks[diskName] = true
-			disks = append(disks, diskName)
-		}
+		disks = append(disks, "/dev/"+disk.Name)
 	}
 	return disks, nil
 }
@@ -114,22 +92,20 @@ func getDiskCapacity(diskName string) (uint64, error) {
 }
 
 func getLinuxDiskCapacity(diskName string) (uint64, error) {
-	diskName = strings.TrimPrefix(diskName, "/dev/")
-	out, err := exec.Command("lsblk", "-b", "-dn", "-o", "SIZE", "/dev/"+diskName).Output()
+	topo, err := Topologies().Get()
 	if err != nil {
 		return 0, err
 	}
 
-	size, err := strconv.ParseUint(strings.TrimSpace(string(out)), 10, 64)
-	if err != nil {
-		return 0, err
+	disk, ok := topo.Device(diskName)
+	if !ok {
+		return 0, fmt.Errorf("Disque %s introuvable", diskName)
 	}
-
-	return size, nil
+	return disk.SizeBytes, nil
 }
 
 func getWindowsDiskCapacity(diskName string) (uint64, error) {
-	out, err := exec.Command("wmic", "diskdrive", "get", "size").Output()
+	out, err := commandOutput(exec.Command("wmic", "diskdrive", "get", "size"), false)
 	if err != nil {
 		return 0, fmt.Errorf("Erreur lors de l'exécution de WMIC : %v", err)
 	}
@@ -149,7 +125,7 @@ func getWindowsDiskCapacity(diskName string) (uint64, error) {
 }
 
 func getMacOSDiskCapacity(diskName string) (uint64, error) {
-	out, err := exec.Command("diskutil", "info", diskName).Output()
+	out, err := commandOutput(exec.Command("diskutil", "info", diskName), false)
 	if err != nil {
 		return 0, fmt.Errorf("Erreur lors de l'exécution de diskutil : %v", err)
 	}
@@ -176,10 +152,15 @@ func trimLastDigit(diskName string) string {
 	})
 }
 
+var (
+	wslOnce sync.Once
+	wsl     bool
+)
+
 func isWSL() bool {
-	out, err := exec.Command("uname", "-r").Output()
-	if err != nil {
-		return false
-	}
-	return strings.Contains(string(out), "WSL")
+	wslOnce.Do(func() {
+		release, err := os.ReadFile("/proc/sys/kernel/osrelease")
+		wsl = err == nil && strings.Contains(string(release), "WSL")
+	})
+	return wsl
 }
@@ -0,0 +1,292 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"sort"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"syscall"
+	"time"
+)
+
+// DuProgressInterval est l'intervalle entre deux lignes de progression de /du.
+const DuProgressInterval = 250 * time.Millisecond
+
+// DuCacheMaxDirs borne le nombre de dossiers gardés dans le cache de du ;
+// au-delà, le cache est vidé.
+const DuCacheMaxDirs = 1 << 20
+
+// DirUsage est l'occupation d'un dossier et de ses sous-dossiers.
+type DirUsage struct {
+	Path           string `json:"path"`
+	SizeBytes      int64  `json:"size_bytes"`
+	AllocatedBytes int64  `json:"allocated_bytes"`
+	Files          int64  `json:"files"`
+	Dirs           int64  `json:"dirs"`
+}
+
+func (usage *DirUsage) add(other DirUsage) {
+	usage.SizeBytes += other.SizeBytes
+	usage.AllocatedBytes += other.AllocatedBytes
+	usage.Files += other.Files
+	usage.Dirs += other.Dirs
+}
+
+// addFile compte un fichier direct du dossier.
+func (usage *DirUsage) addFile(info os.FileInfo) {
+	usage.Files++
+	usage.SizeBytes += info.Size()
+	if sys, ok := info.Sys().(*syscall.Stat_t); ok {
+		usage.AllocatedBytes += sys.Blocks * 512
+	}
+}
+
+type DuOptions struct {
+	// MaxDepth est la profondeur des dossiers détaillés dans le résultat
+	// (1 : les sous-dossiers directs).
+	MaxDepth int
+	Workers  int
+	// Refresh ignore le cache et relit tout le sous-arbre.
+	Refresh bool
+}
+
+type DuProgress struct {
+	Dirs       int64 `json:"dirs"`
+	CachedDirs int64 `json:"cached_dirs"`
+	Files      int64 `json:"files"`
+	SizeBytes  int64 `json:"size_bytes"`
+}
+
+type DuResult struct {
+	Total DirUsage   `json:"total"`
+	Dirs  []DirUsage `json:"dirs"`
+}
+
+// duNode est ce que le cache garde d'un dossier : le nom de ses fichiers
+// directs et de ses sous-dossiers. Il reste valable tant que la date de
+// modification du dossier ne change pas. La taille des fichiers n'y est
+// pas gardée : un fichier réécrit sur place ne change pas cette date.
+type duNode struct {
+	inode    uint64
+	modTime  int64
+	files    []string
+	children []string
+}
+
+var duCache = struct {
+	sync.Mutex
+	nodes map[string]*duNode
+}{nodes: make(map[string]*duNode)}
+
+// DuScan est un calcul d'occupation en cours.
+type DuScan struct {
+	dirs, cachedDirs, files, bytes atomic.Int64
+
+	done   chan struct{}
+	result DuResult
+	err    error
+}
+
+func (scan *DuScan) Progress() DuProgress {
+	return DuProgress{
+		Dirs:       scan.dirs.Load(),
+		CachedDirs: scan.cachedDirs.Load(),
+		Files:      scan.files.Load(),
+		SizeBytes:  scan.bytes.Load(),
+	}
+}
+
+// Done est fermé à la fin du calcul.
+func (scan *DuScan) Done() <-chan struct{} {
+	return scan.done
+}
+
+func (scan *DuScan) Result() (DuResult, error) {
+	<-scan.done
+	return scan.result, scan.err
+}
+
+type duWalker struct {
+	ctx       context.Context
+	scan      *DuScan
+	opts      DuOptions
+	mountPath string
+	device    uint64
+	slots     chan struct{}
+
+	mu   sync.Mutex
+	dirs []DirUsage
+}
+
+// StartDiskUsage calcule la taille et le nombre de fichiers de path et de
+// chacun de ses sous-dossiers, sans quitter la partition. Les dossiers
+// sont lus en parallèle par au plus opts.Workers goroutines. Un dossier
+// dont la date n'a pas changé depuis le calcul précédent n'est pas relu :
+// rouvrir un sous-dossier ne coûte qu'un lstat par entrée.
+func StartDiskUsage(ctx context.Context, mountPath string, path string, opts DuOptions) (*DuScan, error) {
+	mountPath = strings.TrimSuffix(mountPath, "/")
+	rel := strings.Trim(RemoveDoubleSlashes("/"+path), "/")
+
+	var stat syscall.Stat_t
+	if err := statPath(mountPath+"/"+rel, &stat); err != nil {
+		return nil, fmt.Errorf("Le dossier %s n'existe pas : %v", rel, err)
+	}
+	if stat.Mode&syscall.S_IFMT != syscall.S_IFDIR {
+		return nil, fmt.Errorf("%s n'est pas un dossier", rel)
+	}
+
+	if opts.Workers <= 0 {
+		opts.Workers = DefaultStatWorkers()
+	}
+
+	scan := &DuScan{done: make(chan struct{})}
+	w := &duWalker{
+		ctx:       ctx,
+		scan:      scan,
+		opts:      opts,
+		mountPath: mountPath,
+		device:    uint64(stat.Dev),
+		slots:     make(chan struct{}, opts.Workers),
+	}
+
+	go func() {
+		defer close(scan.done)
+		total, _ := w.usage(rel, 0)
+		if err := ctx.Err(); err != nil {
+			scan.err = err
+			return
+		}
+		sort.Slice(w.dirs, func(i, j int) bool { return w.dirs[i].Path < w.dirs[j].Path })
+		scan.result = DuResult{Total: total, Dirs: w.dirs}
+	}()
+
+	return scan, nil
+}
+
+// usage retourne l'occupation du dossier rel, ou false s'il n'est pas
+// lisible ou appartient à une autre partition.
+func (w *duWalker) usage(rel string, depth int) (DirUsage, bool) {
+	if w.ctx.Err() != nil {
+		return DirUsage{}, false
+	}
+
+	dirPath := w.mountPath + "/" + rel
+	var stat syscall.Stat_t
+	if err := lstatPath(dirPath, &stat); err != nil || uint64(stat.Dev) != w.device {
+		return DirUsage{}, false
+	}
+
+	node, total := w.node(dirPath, &stat)
+	total.Path = rel
+
+	children := make([]DirUsage, len(node.children))
+	found := make([]bool, len(node.children))
+	var wg sync.WaitGroup
+	for i, name := range node.children {
+		childRel := joinIndexPath(rel, name)
+		select {
+		case w.slots <- struct{}{}:
+			wg.Add(1)
+			go func(i int, childRel string) {
+				defer wg.Done()
+				defer func() { <-w.slots }()
+				children[i], found[i] = w.usage(childRel, depth+1)
+			}(i, childRel)
+		default:
+			children[i], found[i] = w.usage(childRel, depth+1)
+		}
+	}
+	wg.Wait()
+
+	for i, child := range children {
+		if found[i] {
+			total.add(child)
+			total.Dirs++
+		}
+	}
+
+	if depth >= 1 && depth <= w.opts.MaxDepth {
+		w.mu.Lock()
+		w.dirs = append(w.dirs, total)
+		w.mu.Unlock()
+	}
+	return total, true
+}
+
+// node retourne le contenu direct du dossier et l'occupation de ses
+// fichiers. Si la date de modification du dossier n'a pas changé, la
+// liste des entrées vient du cache et seuls les fichiers sont relus
+// (lstat), pour compter ceux qui ont grossi ou été réécrits sur place.
+func (w *duWalker) node(dirPath string, stat *syscall.Stat_t) (*duNode, DirUsage) {
+	w.scan.dirs.Add(1)
+
+	if !w.opts.Refresh {
+		duCache.Lock()
+		node := duCache.nodes[dirPath]
+		duCache.Unlock()
+		if node != nil && node.inode == stat.Ino && node.modTime == stat.Mtim.Nano() {
+			duCacheStats.Hit()
+			w.scan.cachedDirs.Add(1)
+			var own DirUsage
+			for _, name := range node.files {
+				if info, err := lstatInfo(dirPath + "/" + name); err == nil {
+					own.addFile(info)
+				}
+			}
+			w.scan.files.Add(own.Files)
+			w.scan.bytes.Add(own.SizeBytes)
+			return node, own
+		}
+		duCacheStats.Miss()
+	}
+
+	node := &duNode{inode: stat.Ino, modTime: stat.Mtim.Nano()}
+	var own DirUsage
+	entries, err := readDir(dirPath)
+	if err != nil {
+		return node, own
+	}
+
+	for _, entry := range entries {
+		if entry.IsDir() {
+			node.children = append(node.children, entry.Name())
+			continue
+		}
+		node.files = append(node.files, entry.Name())
+		if info, err := entryInfo(entry); err == nil {
+			own.addFile(info)
+		}
+	}
+	w.scan.files.Add(own.Files)
+	w.scan.bytes.Add(own.SizeBytes)
+
+	duCache.Lock()
+	if len(duCache.nodes) >= DuCacheMaxDirs {
+		duCache.nodes = make(map[string]*duNode)
+	}
+	duCache.nodes[dirPath] = node
+	duCache.Unlock()
+	return node, own
+}
@@ -0,0 +1,80 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"fmt"
+	"hash/fnv"
+	"net/http"
+	"strings"
+	"syscall"
+
+	"github.com/gin-gonic/gin"
+)
+
+// ResourceETag construit un ETag faible à partir de l'identité du fichier
+// ou du dossier path (inode, taille, date de modification) et de la
+// requête qui le lit. Pour un dossier, seule la date du dossier compte :
+// un fichier réécrit sans être renommé ne change pas son ETag.
+func ResourceETag(path string, query string) (string, error) {
+	var stat syscall.Stat_t
+	if err := statPath(path, &stat); err != nil {
+		return "", fmt.Errorf("Impossible d'obtenir les informations de %s : %v", path, err)
+	}
+
+	hash := fnv.New64a()
+	hash.Write([]byte(query))
+	return fmt.Sprintf(`W/"%x-%x-%x-%x"`, stat.Ino, stat.Size, stat.Mtim.Nano(), hash.Sum64()), nil
+}
+
+// ETagMatches compare l'en-tête If-None-Match à etag (comparaison faible).
+func ETagMatches(header string, etag string) bool {
+	etag = strings.TrimPrefix(etag, "W/")
+	for _, candidate := range strings.Split(header, ",") {
+		candidate = strings.TrimSpace(candidate)
+		if candidate == "*" || strings.TrimPrefix(candidate, "W/") == etag {
+			return true
+		}
+	}
+	return false
+}
+
+// NotModified pose l'ETag de la ressource path et répond 304 si le client
+// en a déjà cette version. Si path ne peut pas être lu, le gestionnaire
+// continue et signale l'erreur lui-même.
+func NotModified(c *gin.Context, path string) bool {
+	etag, err := ResourceETag(path, c.Request.URL.RawQuery)
+	if err != nil {
+		return false
+	}
+
+	c.Header("ETag", etag)
+	condition := c.GetHeader("If-None-Match")
+	if condition == "" {
+		return false
+	}
+	if !ETagMatches(condition, etag) {
+		etagStats.Miss()
+		return false
+	}
+	etagStats.Hit()
+	c.Status(http.StatusNotModified)
+	return true
+}
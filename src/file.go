@@ -22,14 +22,17 @@
 package main
 
 import (
+	"encoding/base64"
 	"encoding/json"
   "strings"
 	"fmt"
 	"os"
+	"runtime"
+	"sort"
+	"sync"
+	"sync/atomic"
 	"syscall"
 	"time"
-
-	"github.com/shirou/gopsutil/disk"
 )
 
 type FileInfo struct {
@@ -51,29 +54,184 @@ type FileInfo struct {
 type PartitionContent struct {
 	MountPath string     `json:"mount_path"`
 	Files     []FileInfo `json:"files"`
+	// Total est le nombre d'entrées du dossier acceptées par le filtre.
+	Total int `json:"total"`
+	// NextCursor est vide sur la dernière page.
+	NextCursor string `json:"next_cursor,omitempty"`
+	// Fields restreint les champs sérialisés de chaque entrée (nil : tous).
+	Fields FileFields `json:"-"`
+}
+
+// FileFields est l'ensemble des champs de FileInfo demandés.
+type FileFields map[string]bool
+
+// ParseFileFields lit une liste de champs séparés par des virgules, par
+// exemple "name,type,size_bytes". Le nom est toujours inclus. Une liste
+// vide retourne nil : tous les champs.
+func ParseFileFields(list string) (FileFields, error) {
+	if strings.TrimSpace(list) == "" {
+		return nil, nil
+	}
+
+	fields := FileFields{"name": true}
+	for _, name := range strings.Split(list, ",") {
+		name = strings.TrimSpace(name)
+		if name == "" {
+			continue
+		}
+		if _, ok := fileField(FileInfo{}, name); !ok {
+			return nil, fmt.Errorf("Champ inconnu : %s", name)
+		}
+		fields[name] = true
+	}
+	return fields, nil
+}
+
+// NeedsStat indique si un des champs demandés n'est pas connu dès la
+// lecture du dossier : le nom et le type viennent de d_type, sans stat.
+func (fields FileFields) NeedsStat() bool {
+	if fields == nil {
+		return true
+	}
+	for name := range fields {
+		if name != "name" && name != "type" && name != "is_symlink" {
+			return true
+		}
+	}
+	return false
+}
+
+func fileField(info FileInfo, name string) (interface{}, bool) {
+	switch name {
+	case "name":
+		return info.Name, true
+	case "type":
+		return info.Type, true
+	case "is_symlink":
+		return info.IsSymlink, true
+	case "size_bytes":
+		return info.SizeBytes, true
+	case "permissions":
+		return info.Permissions, true
+	case "hard_links":
+		return info.HardLinks, true
+	case "inode":
+		return info.Inode, true
+	case "owner_uid":
+		return info.OwnerUID, true
+	case "owner_gid":
+		return info.OwnerGID, true
+	case "block_size":
+		return info.BlockSize, true
+	case "blocks_allocated":
+		return info.BlocksAllocated, true
+	case "last_modified":
+		return info.LastModified, true
+	case "last_access":
+		return info.LastAccess, true
+	}
+	return nil, false
+}
+
+// fileFieldNames donne l'ordre de sérialisation des champs, celui de FileInfo.
+var fileFieldNames = []string{
+	"name", "type", "is_symlink", "size_bytes", "permissions", "hard_links", "inode",
+	"owner_uid", "owner_gid", "block_size", "blocks_allocated", "last_modified", "last_access",
+}
+
+// appendProjected ajoute à buf l'objet JSON réduit aux champs demandés.
+func (fields FileFields) appendProjected(buf []byte, info FileInfo) ([]byte, error) {
+	buf = append(buf, '{')
+	first := true
+	for _, name := range fileFieldNames {
+		if !fields[name] {
+			continue
+		}
+		if !first {
+			buf = append(buf, ',')
+		}
+		first = false
+
+		value, _ := fileField(info, name)
+		encoded, err := json.Marshal(value)
+		if err != nil {
+			return nil, err
+		}
+		buf = append(buf, '"')
+		buf = append(buf, name...)
+		buf = append(buf, '"', ':')
+		buf = append(buf, encoded...)
+	}
+	return append(buf, '}'), nil
+}
+
+func (content PartitionContent) MarshalJSON() ([]byte, error) {
+	type plain PartitionContent
+	if content.Fields == nil {
+		return json.Marshal(plain(content))
+	}
+
+	files := []byte("null")
+	if content.Files != nil {
+		files = append(make([]byte, 0, 64*len(content.Files)), '[')
+		for i, info := range content.Files {
+			if i > 0 {
+				files = append(files, ',')
+			}
+			var err error
+			if files, err = content.Fields.appendProjected(files, info); err != nil {
+				return nil, err
+			}
+		}
+		files = append(files, ']')
+	}
+	return json.Marshal(struct {
+		plain
+		Files json.RawMessage `json:"files"`
+	}{plain(content), files})
 }
 
 func getMountPoint(partition string) (string, error) {
-	partitions, err := disk.Partitions(false)
+	entry, ok, err := Mounts().Lookup(partition)
 	if err != nil {
 		return "", fmt.Errorf("Erreur lors de la récupération des partitions : %v", err)
 	}
-
-	for _, p := range partitions {
-		if p.Device == partition {
-			return p.Mountpoint, nil
-		}
+	if !ok {
+		return "", fmt.Errorf("Aucun point de montage trouvé pour la partition %s", partition)
 	}
 
-	return "", fmt.Errorf("Aucun point de montage trouvé pour la partition %s", partition)
+	return entry.MountPoint, nil
 }
 
 func getFileInfo(path string, entry os.DirEntry) (FileInfo, error) {
-	info, err := entry.Info()
+	info, err := entryInfo(entry)
 	if err != nil {
 		return FileInfo{}, fmt.Errorf("Impossible d'obtenir les informations de %s : %v", path, err)
 	}
+	return buildFileInfo(path, info)
+}
+
+// statFile retourne la fiche complète d'une seule entrée, sans lire son
+// dossier.
+func statFile(path string) (FileInfo, error) {
+	info, err := lstatInfo(path)
+	if err != nil {
+		return FileInfo{}, fmt.Errorf("Impossible d'obtenir les informations de %s : %v", path, err)
+	}
+	return buildFileInfo(path, info)
+}
+
+// direntInfo construit une fiche réduite au nom et au type fournis par
+// la lecture du dossier.
+func direntInfo(entry os.DirEntry) FileInfo {
+	return FileInfo{
+		Name:      entry.Name(),
+		Type:      entryType(entry),
+		IsSymlink: entry.Type()&os.ModeSymlink != 0,
+	}
+}
 
+func buildFileInfo(path string, info os.FileInfo) (FileInfo, error) {
 	isSymlink := info.Mode()&os.ModeSymlink != 0
 
 	var fileType string
@@ -86,9 +244,13 @@ func getFileInfo(path string, entry os.DirEntry) (FileInfo, error) {
 		fileType = "file"
 	}
 
-	var stat syscall.Stat_t
-	if err := syscall.Lstat(path, &stat); err != nil {
-		return FileInfo{}, fmt.Errorf("Impossible d'obtenir les métadonnées avancées de %s : %v", path, err)
+	// Sous Linux, info provient déjà d'un lstat : il n'est pas refait.
+	stat, ok := info.Sys().(*syscall.Stat_t)
+	if !ok {
+		stat = new(syscall.Stat_t)
+		if err := syscall.Lstat(path, stat); err != nil {
+			return FileInfo{}, fmt.Errorf("Impossible d'obtenir les métadonnées avancées de %s : %v", path, err)
+		}
 	}
 
 	formatDate := func(ts syscall.Timespec) string {
@@ -136,25 +298,255 @@ func RemoveDoubleSlashes(s string) string {
 	return s
 }
 
-func listRootFiles(mountPath string, path string) (string, error) {
-  path = AddTrailingSlash(path)
-  path = AddSlash(path)
+// MaxFilesPageSize borne le paramètre limit de /files.
+const MaxFilesPageSize = 10000
+
+// MaxStatWorkers borne le nombre de stat menés en parallèle pour un dossier.
+const MaxStatWorkers = 64
+
+// DefaultStatWorkers est le nombre de stat parallèles par défaut. Un stat
+// attend surtout le disque ou le réseau (HDD froid, NFS, FUSE) : on en
+// lance plus que de processeurs.
+func DefaultStatWorkers() int {
+	return min(4*runtime.NumCPU(), MaxStatWorkers)
+}
+
+type statFunc func(path string, entry os.DirEntry) (FileInfo, error)
+
+// collectFileInfos stat'e les entrées de dirPath avec au plus workers
+// appels simultanés. Le résultat garde l'ordre des entrées ; celles qui
+// ne peuvent pas être lues sont ignorées.
+func collectFileInfos(dirPath string, entries []os.DirEntry, workers int, stat statFunc) []FileInfo {
+	infos := make([]FileInfo, len(entries))
+	found := make([]bool, len(entries))
+	statAt := func(i int) {
+		info, err := stat(dirPath+entries[i].Name(), entries[i])
+		if err != nil {
+			fmt.Println(err)
+			return
+		}
+		infos[i], found[i] = info, true
+	}
+
+	workers = min(workers, len(entries))
+	if workers <= 1 {
+		for i := range entries {
+			statAt(i)
+		}
+	} else {
+		var next atomic.Int64
+		var wg sync.WaitGroup
+		for w := 0; w < workers; w++ {
+			wg.Add(1)
+			go func() {
+				defer wg.Done()
+				for i := int(next.Add(1)) - 1; i < len(entries); i = int(next.Add(1)) - 1 {
+					statAt(i)
+				}
+			}()
+		}
+		wg.Wait()
+	}
+
+	files := infos[:0]
+	for i, info := range infos {
+		if found[i] {
+			files = append(files, info)
+		}
+	}
+	return files
+}
+
+// DirCacheSize est le nombre de dossiers dont la liste des noms est gardée
+// entre deux pages.
+const DirCacheSize = 8
+
+// ListOptions décrit la portion d'un dossier à lister.
+type ListOptions struct {
+	Match NameMatcher
+	// Cursor est le curseur renvoyé avec la page précédente ("" : début).
+	Cursor string
+	// Limit est le nombre maximal d'entrées renvoyées (0 : toutes).
+	Limit int
+	// Fields restreint les champs renvoyés (nil : tous).
+	Fields FileFields
+	// Workers est le nombre de stat simultanés (0 : DefaultStatWorkers).
+	Workers int
+}
 
-  var content PartitionContent
-	content.MountPath = mountPath
+type cachedDir struct {
+	inode   uint64
+	modTime syscall.Timespec
+	entries []os.DirEntry
+}
+
+// dirCache garde les entrées triées des derniers dossiers paginés : les
+// pages suivantes ne relisent pas le dossier tant que sa date de
+// modification n'a pas changé.
+var dirCache = struct {
+	sync.Mutex
+	dirs  map[string]*cachedDir
+	order []string
+}{dirs: make(map[string]*cachedDir)}
+
+// readDirCached retourne les entrées de dirPath triées par nom, sans stat.
+func readDirCached(dirPath string) ([]os.DirEntry, error) {
+	var stat syscall.Stat_t
+	if err := statPath(dirPath, &stat); err != nil {
+		return nil, err
+	}
+
+	dirCache.Lock()
+	cached, ok := dirCache.dirs[dirPath]
+	dirCache.Unlock()
+	if ok && cached.inode == stat.Ino && cached.modTime == stat.Mtim {
+		dirCacheStats.Hit()
+		return cached.entries, nil
+	}
+	dirCacheStats.Miss()
 
-	entries, err := os.ReadDir(RemoveDoubleSlashes(mountPath + path))
+	// La date est relevée avant la lecture : un ajout entre les deux
+	// provoque une nouvelle lecture à la page suivante.
+	entries, err := readDir(dirPath)
 	if err != nil {
-		return "", fmt.Errorf("Le dossier %s n'existe pas : %v", RemoveDoubleSlashes(mountPath + path), err)
+		return nil, err
 	}
 
+	dirCache.Lock()
+	defer dirCache.Unlock()
+	if _, ok := dirCache.dirs[dirPath]; !ok {
+		dirCache.order = append(dirCache.order, dirPath)
+		if len(dirCache.order) > DirCacheSize {
+			delete(dirCache.dirs, dirCache.order[0])
+			dirCache.order = dirCache.order[1:]
+		}
+	}
+	dirCache.dirs[dirPath] = &cachedDir{inode: stat.Ino, modTime: stat.Mtim, entries: entries}
+	return entries, nil
+}
+
+// EncodeCursor construit le curseur désignant l'entrée name.
+func EncodeCursor(name string) string {
+	return base64.RawURLEncoding.EncodeToString([]byte(name))
+}
+
+// DecodeCursor retourne le nom de l'entrée désignée par cursor.
+func DecodeCursor(cursor string) (string, error) {
+	name, err := base64.RawURLEncoding.DecodeString(cursor)
+	if err != nil || len(name) == 0 {
+		return "", fmt.Errorf("Curseur invalide : %s", cursor)
+	}
+	return string(name), nil
+}
+
+// matchingEntries lit le dossier et ne garde que les entrées acceptées
+// par match, dans l'ordre des noms.
+func matchingEntries(dirPath string, match NameMatcher, cached bool) ([]os.DirEntry, error) {
+	var entries []os.DirEntry
+	var err error
+	if cached {
+		entries, err = readDirCached(dirPath)
+	} else {
+		entries, err = readDir(dirPath)
+	}
+	if err != nil {
+		return nil, fmt.Errorf("Le dossier %s n'existe pas : %v", dirPath, err)
+	}
+	if match == nil {
+		return entries, nil
+	}
+
+	matched := make([]os.DirEntry, 0, len(entries))
 	for _, entry := range entries {
-		fileInfo, err := getFileInfo(RemoveDoubleSlashes(mountPath + path) + entry.Name(), entry)
+		if match(entry.Name()) {
+			matched = append(matched, entry)
+		}
+	}
+	return matched, nil
+}
+
+func dirPathOf(mountPath string, path string) string {
+	path = AddTrailingSlash(path)
+	path = AddSlash(path)
+	return RemoveDoubleSlashes(mountPath + path)
+}
+
+// listFiles liste le dossier path de la partition montée en mountPath.
+// Le filtre est appliqué sur le nom fourni par la lecture du dossier :
+// les entrées écartées ne sont jamais stat'ées.
+func listFiles(mountPath string, path string, match NameMatcher) (PartitionContent, error) {
+	return listFilesPage(mountPath, path, ListOptions{Match: match})
+}
+
+// listFilesPage liste une page du dossier path, triée par nom. Seules les
+// entrées de la page sont stat'ées : le coût d'une page dépend de sa
+// taille, pas de celle du dossier.
+func listFilesPage(mountPath string, path string, opts ListOptions) (PartitionContent, error) {
+	dirPath := dirPathOf(mountPath, path)
+	content := PartitionContent{MountPath: mountPath, Fields: opts.Fields}
+
+	after := ""
+	if opts.Cursor != "" {
+		name, err := DecodeCursor(opts.Cursor)
 		if err != nil {
-			fmt.Println(err) 
-			continue
+			return content, err
+		}
+		after = name
+	}
+
+	paged := opts.Limit > 0 || opts.Cursor != ""
+	entries, err := matchingEntries(dirPath, opts.Match, paged)
+	if err != nil {
+		return content, err
+	}
+	content.Total = len(entries)
+
+	start := 0
+	if after != "" {
+		start = sort.Search(len(entries), func(i int) bool {
+			return entries[i].Name() > after
+		})
+	}
+	end := len(entries)
+	if opts.Limit > 0 && start+opts.Limit < end {
+		end = start + opts.Limit
+		content.NextCursor = EncodeCursor(entries[end-1].Name())
+	}
+
+	if !opts.Fields.NeedsStat() {
+		content.Files = make([]FileInfo, 0, end-start)
+		for _, entry := range entries[start:end] {
+			content.Files = append(content.Files, direntInfo(entry))
 		}
-		content.Files = append(content.Files, fileInfo)
+		return content, nil
+	}
+
+	workers := opts.Workers
+	if workers <= 0 {
+		workers = DefaultStatWorkers()
+	}
+	content.Files = collectFileInfos(dirPath, entries[start:end], workers, getFileInfo)
+	if len(content.Files) == 0 {
+		content.Files = nil
+	}
+
+	return content, nil
+}
+
+// countFiles compte les entrées du dossier path acceptées par match, sans
+// les stat'er.
+func countFiles(mountPath string, path string, match NameMatcher) (int, error) {
+	entries, err := matchingEntries(dirPathOf(mountPath, path), match, true)
+	if err != nil {
+		return 0, err
+	}
+	return len(entries), nil
+}
+
+func listRootFiles(mountPath string, path string) (string, error) {
+	content, err := listFiles(mountPath, path, nil)
+	if err != nil {
+		return "", err
 	}
 
 	jsonData, err := json.MarshalIndent(content, "", "  ")
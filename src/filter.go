@@ -21,6 +21,9 @@ package main
 
 import (
 	"encoding/json"
+	"fmt"
+	"path/filepath"
+	"regexp"
 	"strings"
 )
 
@@ -29,19 +32,141 @@ type FilesResponse struct {
 	Files     []FileInfo `json:"files"`
 }
 
+// NameMatcher indique si un nom d'entrée doit être conservé.
+// Un NameMatcher nil accepte tous les noms.
+type NameMatcher func(name string) bool
+
+// FilterOptions regroupe les critères de filtrage d'un listing ;
+// tous les critères renseignés doivent être vérifiés.
+type FilterOptions struct {
+	Contains      string
+	Extensions    []string
+	Glob          string
+	Regex         string
+	CaseSensitive bool
+}
+
+// ParseExtensions découpe une liste d'extensions "png,.jpg, tar.gz"
+// en suffixes normalisés ".png", ".jpg", ".tar.gz".
+func ParseExtensions(list string) []string {
+	var extensions []string
+	for _, ext := range strings.Split(list, ",") {
+		ext = strings.TrimSpace(ext)
+		if ext == "" {
+			continue
+		}
+		if !strings.HasPrefix(ext, ".") {
+			ext = "." + ext
+		}
+		extensions = append(extensions, ext)
+	}
+	return extensions
+}
+
+// NewNameMatcher compile les critères une seule fois : le filtre, les
+// extensions et le motif glob sont mis en minuscules ici et non pour
+// chaque fichier.
+func NewNameMatcher(opts FilterOptions) (NameMatcher, error) {
+	var matchers []NameMatcher
+
+	fold := func(s string) string {
+		if opts.CaseSensitive {
+			return s
+		}
+		return strings.ToLower(s)
+	}
+
+	if opts.Contains != "" {
+		contains := fold(opts.Contains)
+		matchers = append(matchers, func(name string) bool {
+			return strings.Contains(name, contains)
+		})
+	}
+
+	if len(opts.Extensions) > 0 {
+		extensions := make([]string, len(opts.Extensions))
+		for i, ext := range opts.Extensions {
+			extensions[i] = fold(ext)
+		}
+		matchers = append(matchers, func(name string) bool {
+			for _, ext := range extensions {
+				if strings.HasSuffix(name, ext) {
+					return true
+				}
+			}
+			return false
+		})
+	}
+
+	if opts.Glob != "" {
+		glob := fold(opts.Glob)
+		if _, err := filepath.Match(glob, ""); err != nil {
+			return nil, fmt.Errorf("Motif glob invalide %s : %v", opts.Glob, err)
+		}
+		matchers = append(matchers, func(name string) bool {
+			ok, _ := filepath.Match(glob, name)
+			return ok
+		})
+	}
+
+	var regex *regexp.Regexp
+	if opts.Regex != "" {
+		expr := opts.Regex
+		if !opts.CaseSensitive {
+			expr = "(?i)" + expr
+		}
+		var err error
+		regex, err = regexp.Compile(expr)
+		if err != nil {
+			return nil, fmt.Errorf("Expression régulière invalide %s : %v", opts.Regex, err)
+		}
+	}
+
+	if len(matchers) == 0 && regex == nil {
+		return nil, nil
+	}
+
+	return func(name string) bool {
+		// L'expression régulière gère elle-même la casse et reçoit le nom
+		// d'origine ; les autres critères reçoivent le nom replié.
+		if regex != nil && !regex.MatchString(name) {
+			return false
+		}
+		folded := fold(name)
+		for _, match := range matchers {
+			if !match(folded) {
+				return false
+			}
+		}
+		return true
+	}, nil
+}
+
+func FilterFiles(files []FileInfo, match NameMatcher) []FileInfo {
+	if match == nil {
+		return files
+	}
+
+	var filteredFiles []FileInfo
+	for _, file := range files {
+		if match(file.Name) {
+			filteredFiles = append(filteredFiles, file)
+		}
+	}
+	return filteredFiles
+}
+
 func FilterFilesByName(jsonData []byte, filter string) ([]byte, error) {
 	var response FilesResponse
 	if err := json.Unmarshal(jsonData, &response); err != nil {
 		return nil, err
 	}
 
-	var filteredFiles []FileInfo
-	for _, file := range response.Files {
-		if strings.Contains(strings.ToLower(file.Name), strings.ToLower(filter)) {
-			filteredFiles = append(filteredFiles, file)
-		}
+	match, err := NewNameMatcher(FilterOptions{Contains: filter})
+	if err != nil {
+		return nil, err
 	}
 
-	response.Files = filteredFiles
+	response.Files = FilterFiles(response.Files, match)
 	return json.Marshal(response)
 }
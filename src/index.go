@@ -0,0 +1,404 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"encoding/gob"
+	"fmt"
+	"os"
+	"path/filepath"
+	"sort"
+	"strings"
+	"sync"
+	"syscall"
+	"time"
+)
+
+const IndexFormatVersion = 1
+
+// IndexedDir contient les entrées directes d'un dossier et la date de
+// modification du dossier au moment de sa lecture : tant qu'elle ne
+// change pas, aucune entrée n'a été ajoutée, supprimée ou renommée et le
+// dossier n'est pas relu. Ses entrées sont tout de même stat'ées à
+// nouveau, un fichier réécrit sur place ne changeant pas cette date.
+type IndexedDir struct {
+	ModTime int64
+	Files   []FileInfo
+}
+
+type indexSnapshot struct {
+	Version   int
+	Partition string
+	MountPath string
+	UpdatedAt time.Time
+	Dirs      map[string]*IndexedDir
+}
+
+type IndexStatus struct {
+	Partition     string  `json:"partition"`
+	MountPath     string  `json:"mount_path,omitempty"`
+	State         string  `json:"state"`
+	Dirs          int     `json:"dirs"`
+	Files         int     `json:"files"`
+	UpdatedAt     string  `json:"updated_at,omitempty"`
+	LastDuration  float64 `json:"last_duration_ms"`
+	ReusedDirs    int     `json:"reused_dirs"`
+	RescannedDirs int     `json:"rescanned_dirs"`
+	Error         string  `json:"error,omitempty"`
+}
+
+type IndexQuery struct {
+	Options    SearchOptions
+	Path       string
+	Sort       string
+	Descending bool
+	Limit      int
+}
+
+type IndexQueryResult struct {
+	Partition string         `json:"partition"`
+	UpdatedAt string         `json:"updated_at"`
+	Total     int            `json:"total_matches"`
+	Files     []SearchResult `json:"files"`
+}
+
+// PartitionIndex est l'index des métadonnées d'une partition, sauvegardé
+// sur disque. Les requêtes lisent le dernier index complet pendant qu'un
+// rafraîchissement construit le suivant.
+type PartitionIndex struct {
+	mu       sync.RWMutex
+	file     string
+	snapshot *indexSnapshot
+	status   IndexStatus
+}
+
+var (
+	indexesMu sync.Mutex
+	indexes   = map[string]*PartitionIndex{}
+)
+
+// IndexDir retourne le dossier des index : $DISK_INDEX_DIR, ou le dossier
+// de cache de l'utilisateur.
+func IndexDir() string {
+	if dir := os.Getenv("DISK_INDEX_DIR"); dir != "" {
+		return dir
+	}
+	if dir, err := os.UserCacheDir(); err == nil {
+		return filepath.Join(dir, "disk-analysis", "index")
+	}
+	return filepath.Join(os.TempDir(), "disk-analysis-index")
+}
+
+func indexFileName(partition string) string {
+	name := strings.ReplaceAll(strings.Trim(partition, "/"), "/", "_")
+	return filepath.Join(IndexDir(), name+".gob")
+}
+
+// GetPartitionIndex retourne l'index de la partition, chargé depuis le
+// disque à la première utilisation.
+func GetPartitionIndex(partition string) *PartitionIndex {
+	indexesMu.Lock()
+	defer indexesMu.Unlock()
+
+	idx, ok := indexes[partition]
+	if !ok {
+		idx = NewPartitionIndex(partition, indexFileName(partition))
+		indexes[partition] = idx
+	}
+	return idx
+}
+
+func NewPartitionIndex(partition string, file string) *PartitionIndex {
+	idx := &PartitionIndex{
+		file:   file,
+		status: IndexStatus{Partition: partition, State: "empty"},
+	}
+
+	if snapshot, err := loadIndexSnapshot(file); err == nil && snapshot.Partition == partition {
+		idx.snapshot = snapshot
+		idx.status.MountPath = snapshot.MountPath
+		idx.status.State = "ready"
+		idx.status.UpdatedAt = snapshot.UpdatedAt.Format("2006-01-02 15:04:05")
+		idx.status.Dirs, idx.status.Files = snapshot.counts()
+	}
+	return idx
+}
+
+func loadIndexSnapshot(file string) (*indexSnapshot, error) {
+	f, err := os.Open(file)
+	if err != nil {
+		return nil, err
+	}
+	defer f.Close()
+
+	var snapshot indexSnapshot
+	if err := gob.NewDecoder(f).Decode(&snapshot); err != nil {
+		return nil, fmt.Errorf("Index illisible %s : %v", file, err)
+	}
+	if snapshot.Version != IndexFormatVersion {
+		return nil, fmt.Errorf("Version d'index %d non prise en charge", snapshot.Version)
+	}
+	return &snapshot, nil
+}
+
+func (snapshot *indexSnapshot) save(file string) error {
+	if err := os.MkdirAll(filepath.Dir(file), 0755); err != nil {
+		return fmt.Errorf("Impossible de créer le dossier des index : %v", err)
+	}
+
+	tmp := file + ".tmp"
+	f, err := os.Create(tmp)
+	if err != nil {
+		return fmt.Errorf("Impossible d'écrire l'index %s : %v", file, err)
+	}
+	if err := gob.NewEncoder(f).Encode(snapshot); err != nil {
+		f.Close()
+		os.Remove(tmp)
+		return fmt.Errorf("Impossible d'écrire l'index %s : %v", file, err)
+	}
+	if err := f.Close(); err != nil {
+		os.Remove(tmp)
+		return err
+	}
+	return os.Rename(tmp, file)
+}
+
+func (snapshot *indexSnapshot) counts() (int, int) {
+	files := 0
+	for _, dir := range snapshot.Dirs {
+		files += len(dir.Files)
+	}
+	return len(snapshot.Dirs), files
+}
+
+func (idx *PartitionIndex) Status() IndexStatus {
+	idx.mu.RLock()
+	defer idx.mu.RUnlock()
+	return idx.status
+}
+
+// StartRefresh lance Refresh en arrière-plan ; retourne false si un
+// rafraîchissement est déjà en cours.
+func (idx *PartitionIndex) StartRefresh(mountPath string) bool {
+	idx.mu.Lock()
+	if idx.status.State == "indexing" {
+		idx.mu.Unlock()
+		return false
+	}
+	idx.status.State = "indexing"
+	idx.status.Error = ""
+	idx.mu.Unlock()
+
+	go idx.refresh(mountPath)
+	return true
+}
+
+// Refresh met l'index à jour de façon synchrone.
+func (idx *PartitionIndex) Refresh(mountPath string) error {
+	idx.mu.Lock()
+	if idx.status.State == "indexing" {
+		idx.mu.Unlock()
+		return fmt.Errorf("Indexation déjà en cours pour %s", idx.status.Partition)
+	}
+	idx.status.State = "indexing"
+	idx.mu.Unlock()
+
+	return idx.refresh(mountPath)
+}
+
+func (idx *PartitionIndex) refresh(mountPath string) error {
+	start := time.Now()
+
+	idx.mu.RLock()
+	var previous map[string]*IndexedDir
+	if idx.snapshot != nil && idx.snapshot.MountPath == mountPath {
+		previous = idx.snapshot.Dirs
+	}
+	partition := idx.status.Partition
+	idx.mu.RUnlock()
+
+	dirs, reused, rescanned, err := crawlIndex(mountPath, previous)
+	var snapshot *indexSnapshot
+	if err == nil {
+		snapshot = &indexSnapshot{
+			Version:   IndexFormatVersion,
+			Partition: partition,
+			MountPath: mountPath,
+			UpdatedAt: time.Now(),
+			Dirs:      dirs,
+		}
+		err = snapshot.save(idx.file)
+	}
+
+	idx.mu.Lock()
+	defer idx.mu.Unlock()
+
+	if err != nil {
+		idx.status.State = "error"
+		idx.status.Error = err.Error()
+		if idx.snapshot != nil {
+			idx.status.State = "ready"
+		}
+		return err
+	}
+
+	idx.snapshot = snapshot
+	idx.status.MountPath = mountPath
+	idx.status.State = "ready"
+	idx.status.UpdatedAt = snapshot.UpdatedAt.Format("2006-01-02 15:04:05")
+	idx.status.LastDuration = float64(time.Since(start).Microseconds()) / 1000
+	idx.status.ReusedDirs = reused
+	idx.status.RescannedDirs = rescanned
+	idx.status.Dirs, idx.status.Files = snapshot.counts()
+	return nil
+}
+
+// crawlIndex parcourt la partition depuis sa racine sans en sortir. Un
+// dossier dont la date de modification est inchangée depuis previous
+// reprend ses entrées sans être relu, mais chacune est stat'ée à nouveau
+// pour suivre les fichiers qui ont grossi ou été réécrits ; ses
+// sous-dossiers sont tout de même visités.
+func crawlIndex(mountPath string, previous map[string]*IndexedDir) (map[string]*IndexedDir, int, int, error) {
+	var root syscall.Stat_t
+	if err := statPath(mountPath, &root); err != nil {
+		return nil, 0, 0, fmt.Errorf("Point de montage inaccessible %s : %v", mountPath, err)
+	}
+
+	dirs := make(map[string]*IndexedDir)
+	reused, rescanned := 0, 0
+	queue := []string{""}
+
+	for len(queue) > 0 {
+		rel := queue[len(queue)-1]
+		queue = queue[:len(queue)-1]
+
+		var stat syscall.Stat_t
+		if err := lstatPath(RemoveDoubleSlashes(mountPath+"/"+rel), &stat); err != nil || stat.Dev != root.Dev {
+			continue
+		}
+		modTime := stat.Mtim.Nano()
+
+		dir, ok := previous[rel]
+		if ok && dir.ModTime == modTime {
+			dir = &IndexedDir{ModTime: modTime, Files: restatFiles(dirPathOf(mountPath, rel), dir.Files)}
+			reused++
+		} else {
+			content, err := listFiles(mountPath, rel, nil)
+			if err != nil {
+				continue
+			}
+			dir = &IndexedDir{ModTime: modTime, Files: content.Files}
+			rescanned++
+		}
+		dirs[rel] = dir
+
+		for _, file := range dir.Files {
+			if file.Type == "directory" {
+				queue = append(queue, joinIndexPath(rel, file.Name))
+			}
+		}
+	}
+
+	return dirs, reused, rescanned, nil
+}
+
+// restatFiles relit les métadonnées des entrées files du dossier dirPath,
+// sans relire le dossier. Une entrée disparue entre-temps est ignorée.
+func restatFiles(dirPath string, files []FileInfo) []FileInfo {
+	updated := make([]FileInfo, 0, len(files))
+	for _, file := range files {
+		info, err := statFile(dirPath + file.Name)
+		if err != nil {
+			continue
+		}
+		updated = append(updated, info)
+	}
+	return updated
+}
+
+func joinIndexPath(dir string, name string) string {
+	if dir == "" {
+		return name
+	}
+	return dir + "/" + name
+}
+
+func indexSortLess(files []SearchResult, by string) func(i, j int) bool {
+	switch by {
+	case "size":
+		return func(i, j int) bool { return files[i].SizeBytes < files[j].SizeBytes }
+	case "mtime":
+		return func(i, j int) bool { return files[i].LastModified < files[j].LastModified }
+	case "name":
+		return func(i, j int) bool { return files[i].Name < files[j].Name }
+	default:
+		return func(i, j int) bool { return files[i].Path < files[j].Path }
+	}
+}
+
+// Query cherche dans l'index sans accéder au disque.
+func (idx *PartitionIndex) Query(q IndexQuery) (IndexQueryResult, error) {
+	idx.mu.RLock()
+	snapshot := idx.snapshot
+	partition := idx.status.Partition
+	idx.mu.RUnlock()
+
+	if snapshot == nil {
+		return IndexQueryResult{}, fmt.Errorf("La partition %s n'a pas encore été indexée", partition)
+	}
+
+	prefix := strings.Trim(q.Path, "/")
+	var matches []SearchResult
+	for rel, dir := range snapshot.Dirs {
+		if prefix != "" && rel != prefix && !strings.HasPrefix(rel, prefix+"/") {
+			continue
+		}
+		for _, file := range dir.Files {
+			if q.Options.Match != nil && !q.Options.Match(file.Name) {
+				continue
+			}
+			if !q.Options.accepts(file) {
+				continue
+			}
+			matches = append(matches, SearchResult{Path: joinIndexPath(rel, file.Name), FileInfo: file})
+		}
+	}
+
+	less := indexSortLess(matches, q.Sort)
+	if q.Descending {
+		sort.Slice(matches, func(i, j int) bool { return less(j, i) })
+	} else {
+		sort.Slice(matches, less)
+	}
+
+	result := IndexQueryResult{
+		Partition: snapshot.Partition,
+		UpdatedAt: snapshot.UpdatedAt.Format("2006-01-02 15:04:05"),
+		Total:     len(matches),
+		Files:     matches,
+	}
+	if q.Limit > 0 && len(matches) > q.Limit {
+		result.Files = matches[:q.Limit]
+	}
+	if result.Files == nil {
+		result.Files = []SearchResult{}
+	}
+	return result, nil
+}
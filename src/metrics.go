@@ -0,0 +1,409 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"bytes"
+	"fmt"
+	"io"
+	"net/http"
+	"net/http/pprof"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"runtime"
+	"sort"
+	"strconv"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"syscall"
+	"time"
+
+	"github.com/gin-gonic/gin"
+)
+
+// MetricsPrefix préfixe le nom de toutes les métriques exportées.
+const MetricsPrefix = "partition_api_"
+
+// Seuils (en secondes) des histogrammes : requêtes HTTP, appels au
+// système de fichiers et sous-processus.
+var (
+	RequestBuckets    = []float64{0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10}
+	FsBuckets         = []float64{0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01, 0.1}
+	SubprocessBuckets = []float64{0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5}
+)
+
+// Histogram compte les durées observées par intervalle. Il est sûr pour
+// un usage concurrent et ne prend pas de verrou.
+type Histogram struct {
+	bounds []float64
+	// counts[i] compte les durées de ]bounds[i-1], bounds[i]] ; la
+	// dernière case, celles au-delà du dernier seuil.
+	counts []atomic.Uint64
+	sum    atomic.Int64
+}
+
+func NewHistogram(bounds []float64) *Histogram {
+	return &Histogram{bounds: bounds, counts: make([]atomic.Uint64, len(bounds)+1)}
+}
+
+func (h *Histogram) Observe(d time.Duration) {
+	h.counts[sort.SearchFloat64s(h.bounds, d.Seconds())].Add(1)
+	h.sum.Add(int64(d))
+}
+
+// Snapshot retourne les comptes cumulés par seuil (le dernier est le
+// total), et la somme des durées en secondes.
+func (h *Histogram) Snapshot() ([]uint64, float64) {
+	cumulative := make([]uint64, len(h.counts))
+	var total uint64
+	for i := range h.counts {
+		total += h.counts[i].Load()
+		cumulative[i] = total
+	}
+	return cumulative, time.Duration(h.sum.Load()).Seconds()
+}
+
+// OpMetrics chronomètre un type d'opération (stat, readdir, commande...).
+type OpMetrics struct {
+	Duration *Histogram
+	Errors   atomic.Uint64
+}
+
+func newOpMetrics(bounds []float64) func() *OpMetrics {
+	return func() *OpMetrics {
+		return &OpMetrics{Duration: NewHistogram(bounds)}
+	}
+}
+
+// observe s'utilise en defer : defer m.observe(time.Now(), &err).
+func (m *OpMetrics) observe(start time.Time, err *error) {
+	m.Duration.Observe(time.Since(start))
+	if *err != nil {
+		m.Errors.Add(1)
+	}
+}
+
+// CacheStats compte les accès à un cache.
+type CacheStats struct {
+	hits   atomic.Uint64
+	misses atomic.Uint64
+}
+
+func (s *CacheStats) Hit()  { s.hits.Add(1) }
+func (s *CacheStats) Miss() { s.misses.Add(1) }
+
+// routeMetrics regroupe les mesures d'une route HTTP.
+type routeMetrics struct {
+	duration *Histogram
+	bytes    atomic.Uint64
+	// codes compte les réponses par classe de statut, de 1xx à 5xx.
+	codes [5]atomic.Uint64
+}
+
+// metricSet associe une mesure à chaque valeur d'étiquette, créée au
+// premier usage.
+type metricSet[T any] struct {
+	mu     sync.Mutex
+	items  map[string]*T
+	create func() *T
+}
+
+func newMetricSet[T any](create func() *T) *metricSet[T] {
+	return &metricSet[T]{items: map[string]*T{}, create: create}
+}
+
+func (s *metricSet[T]) get(key string) *T {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	item, ok := s.items[key]
+	if !ok {
+		item = s.create()
+		s.items[key] = item
+	}
+	return item
+}
+
+// each parcourt les mesures dans l'ordre des clés.
+func (s *metricSet[T]) each(fn func(key string, item *T)) {
+	s.mu.Lock()
+	keys := make([]string, 0, len(s.items))
+	for key := range s.items {
+		keys = append(keys, key)
+	}
+	s.mu.Unlock()
+
+	sort.Strings(keys)
+	for _, key := range keys {
+		fn(key, s.get(key))
+	}
+}
+
+var (
+	httpInFlight atomic.Int64
+	httpRoutes   = newMetricSet(func() *routeMetrics {
+		return &routeMetrics{duration: NewHistogram(RequestBuckets)}
+	})
+
+	fsOps   = newMetricSet(newOpMetrics(FsBuckets))
+	fsStat  = fsOps.get("stat")
+	fsLstat = fsOps.get("lstat")
+	fsRead  = fsOps.get("readdir")
+	fsPread = fsOps.get("pread")
+
+	subprocesses = newMetricSet(newOpMetrics(SubprocessBuckets))
+
+	caches             = newMetricSet(func() *CacheStats { return &CacheStats{} })
+	dirCacheStats      = caches.get("dir")
+	duCacheStats       = caches.get("du")
+	topologyCacheStats = caches.get("topology")
+	mountsCacheStats   = caches.get("mounts")
+	etagStats          = caches.get("etag")
+)
+
+// statPath, lstatPath, statInfo, lstatInfo, entryInfo et readDir
+// remplacent les appels directs au système de fichiers pour qu'ils soient
+// comptés et chronométrés.
+func statPath(path string, stat *syscall.Stat_t) (err error) {
+	defer fsStat.observe(time.Now(), &err)
+	return syscall.Stat(path, stat)
+}
+
+func lstatPath(path string, stat *syscall.Stat_t) (err error) {
+	defer fsLstat.observe(time.Now(), &err)
+	return syscall.Lstat(path, stat)
+}
+
+func statInfo(path string) (info os.FileInfo, err error) {
+	defer fsStat.observe(time.Now(), &err)
+	return os.Stat(path)
+}
+
+func lstatInfo(path string) (info os.FileInfo, err error) {
+	defer fsLstat.observe(time.Now(), &err)
+	return os.Lstat(path)
+}
+
+// entryInfo fait le lstat d'une entrée lue par readDir.
+func entryInfo(entry os.DirEntry) (info os.FileInfo, err error) {
+	defer fsLstat.observe(time.Now(), &err)
+	return entry.Info()
+}
+
+func readDir(path string) (entries []os.DirEntry, err error) {
+	defer fsRead.observe(time.Now(), &err)
+	return os.ReadDir(path)
+}
+
+// commandOutput exécute cmd et retourne sa sortie standard, ou sa sortie
+// standard et d'erreur si combined est vrai. L'appel est compté sous le
+// nom de la commande (celle lancée par sudo le cas échéant).
+func commandOutput(cmd *exec.Cmd, combined bool) (out []byte, err error) {
+	name := filepath.Base(cmd.Path)
+	if len(cmd.Args) > 1 && name == "sudo" {
+		name = cmd.Args[1]
+	}
+	defer subprocesses.get(name).observe(time.Now(), &err)
+
+	if combined {
+		return cmd.CombinedOutput()
+	}
+	return cmd.Output()
+}
+
+// Instrument mesure chaque requête : durée, octets envoyés (après
+// compression si le middleware est placé avant Compression) et classe du
+// statut, par route. Les flux (/search, /du, /watch) restent comptés en
+// cours jusqu'à leur fin.
+func Instrument() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		httpInFlight.Add(1)
+		start := time.Now()
+		defer func() {
+			httpInFlight.Add(-1)
+
+			route := c.FullPath()
+			if route == "" {
+				route = "unmatched"
+			}
+			metrics := httpRoutes.get(c.Request.Method + " " + route)
+			metrics.duration.Observe(time.Since(start))
+			if size := c.Writer.Size(); size > 0 {
+				metrics.bytes.Add(uint64(size))
+			}
+			if class := c.Writer.Status() / 100; class >= 1 && class <= 5 {
+				metrics.codes[class-1].Add(1)
+			}
+		}()
+		c.Next()
+	}
+}
+
+var labelEscaper = strings.NewReplacer(`\`, `\\`, `"`, `\"`, "\n", `\n`)
+
+// metricsWriter écrit au format texte de Prometheus.
+type metricsWriter struct {
+	w io.Writer
+}
+
+func (m metricsWriter) header(name string, kind string, help string) {
+	fmt.Fprintf(m.w, "# HELP %s%s %s\n# TYPE %s%s %s\n", MetricsPrefix, name, help, MetricsPrefix, name, kind)
+}
+
+// labels formate des couples nom, valeur : labels("op", "stat").
+func labels(pairs ...string) string {
+	parts := make([]string, 0, len(pairs)/2)
+	for i := 0; i+1 < len(pairs); i += 2 {
+		parts = append(parts, pairs[i]+`="`+labelEscaper.Replace(pairs[i+1])+`"`)
+	}
+	return "{" + strings.Join(parts, ",") + "}"
+}
+
+func formatFloat(value float64) string {
+	return strconv.FormatFloat(value, 'g', -1, 64)
+}
+
+func (m metricsWriter) value(name string, labels string, value float64) {
+	fmt.Fprintf(m.w, "%s%s%s %s\n", MetricsPrefix, name, labels, formatFloat(value))
+}
+
+// histogram écrit les séries _bucket, _sum et _count ; pairs sont les
+// étiquettes communes à ces séries.
+func (m metricsWriter) histogram(name string, h *Histogram, pairs ...string) {
+	counts, sum := h.Snapshot()
+	for i, count := range counts {
+		le := "+Inf"
+		if i < len(h.bounds) {
+			le = formatFloat(h.bounds[i])
+		}
+		m.value(name+"_bucket", labels(append(pairs, "le", le)...), float64(count))
+	}
+	m.value(name+"_sum", labels(pairs...), sum)
+	m.value(name+"_count", labels(pairs...), float64(counts[len(counts)-1]))
+}
+
+func (m metricsWriter) ops(set *metricSet[OpMetrics], name string, label string, what string) {
+	m.header(name+"_duration_seconds", "histogram", "Durée des "+what+".")
+	set.each(func(key string, op *OpMetrics) {
+		m.histogram(name+"_duration_seconds", op.Duration, label, key)
+	})
+	m.header(name+"_errors_total", "counter", "Échecs des "+what+".")
+	set.each(func(key string, op *OpMetrics) {
+		m.value(name+"_errors_total", labels(label, key), float64(op.Errors.Load()))
+	})
+}
+
+// WriteMetrics écrit toutes les métriques du serveur au format texte de
+// Prometheus (version 0.0.4).
+func WriteMetrics(w io.Writer) {
+	m := metricsWriter{w}
+
+	m.header("http_requests_in_flight", "gauge", "Requêtes en cours de traitement.")
+	m.value("http_requests_in_flight", "", float64(httpInFlight.Load()))
+
+	m.header("http_requests_total", "counter", "Requêtes traitées, par route et classe de statut.")
+	httpRoutes.each(func(key string, route *routeMetrics) {
+		method, path, _ := strings.Cut(key, " ")
+		for i := range route.codes {
+			if count := route.codes[i].Load(); count > 0 {
+				m.value("http_requests_total", labels("method", method, "route", path, "code", strconv.Itoa(i+1)+"xx"), float64(count))
+			}
+		}
+	})
+
+	m.header("http_request_duration_seconds", "histogram", "Durée des requêtes, jusqu'au dernier octet envoyé.")
+	httpRoutes.each(func(key string, route *routeMetrics) {
+		method, path, _ := strings.Cut(key, " ")
+		m.histogram("http_request_duration_seconds", route.duration, "method", method, "route", path)
+	})
+
+	m.header("http_response_bytes_total", "counter", "Octets envoyés dans les corps de réponse.")
+	httpRoutes.each(func(key string, route *routeMetrics) {
+		method, path, _ := strings.Cut(key, " ")
+		m.value("http_response_bytes_total", labels("method", method, "route", path), float64(route.bytes.Load()))
+	})
+
+	m.ops(fsOps, "fs_operation", "op", "appels au système de fichiers (stat, lstat, readdir, pread)")
+	m.ops(subprocesses, "subprocess", "command", "commandes externes")
+
+	m.header("cache_requests_total", "counter", "Accès aux caches du serveur.")
+	caches.each(func(key string, stats *CacheStats) {
+		m.value("cache_requests_total", labels("cache", key, "result", "hit"), float64(stats.hits.Load()))
+		m.value("cache_requests_total", labels("cache", key, "result", "miss"), float64(stats.misses.Load()))
+	})
+	m.header("cache_hit_ratio", "gauge", "Part des accès servis par le cache depuis le démarrage.")
+	caches.each(func(key string, stats *CacheStats) {
+		hits, misses := stats.hits.Load(), stats.misses.Load()
+		if hits+misses > 0 {
+			m.value("cache_hit_ratio", labels("cache", key), float64(hits)/float64(hits+misses))
+		}
+	})
+
+	var memory runtime.MemStats
+	runtime.ReadMemStats(&memory)
+	m.header("goroutines", "gauge", "Goroutines en cours.")
+	m.value("goroutines", "", float64(runtime.NumGoroutine()))
+	m.header("heap_alloc_bytes", "gauge", "Mémoire allouée sur le tas.")
+	m.value("heap_alloc_bytes", "", float64(memory.HeapAlloc))
+	m.header("gc_cycles_total", "counter", "Cycles du ramasse-miettes.")
+	m.value("gc_cycles_total", "", float64(memory.NumGC))
+}
+
+// MetricsHandler sert /metrics.
+func MetricsHandler(c *gin.Context) {
+	var buffer bytes.Buffer
+	WriteMetrics(&buffer)
+	c.Data(http.StatusOK, "text/plain; version=0.0.4; charset=utf-8", buffer.Bytes())
+}
+
+// PprofEnabled indique si les profils de net/http/pprof sont exposés
+// (variable d'environnement ENABLE_PPROF). Ils sont désactivés par
+// défaut : ils révèlent l'état interne du serveur et un profil CPU le
+// ralentit pendant sa capture.
+func PprofEnabled() bool {
+	enabled, _ := strconv.ParseBool(os.Getenv("ENABLE_PPROF"))
+	return enabled
+}
+
+// RegisterPprof expose net/http/pprof sous /debug/pprof/ et active
+// l'échantillonnage des attentes sur verrous et canaux.
+func RegisterPprof(r *gin.Engine) {
+	runtime.SetMutexProfileFraction(10)
+	runtime.SetBlockProfileRate(int(time.Millisecond))
+
+	handler := func(c *gin.Context) {
+		switch strings.TrimPrefix(c.Request.URL.Path, "/debug/pprof/") {
+		case "cmdline":
+			pprof.Cmdline(c.Writer, c.Request)
+		case "profile":
+			pprof.Profile(c.Writer, c.Request)
+		case "symbol":
+			pprof.Symbol(c.Writer, c.Request)
+		case "trace":
+			pprof.Trace(c.Writer, c.Request)
+		default:
+			// Index sert aussi les profils nommés (heap, goroutine, mutex...).
+			pprof.Index(c.Writer, c.Request)
+		}
+	}
+	r.GET("/debug/pprof/*any", handler)
+	r.POST("/debug/pprof/*any", handler)
+}
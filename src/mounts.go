@@ -0,0 +1,300 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"fmt"
+	"io"
+	"os"
+	"strings"
+	"sync"
+	"syscall"
+)
+
+const MountInfoPath = "/proc/self/mountinfo"
+
+type MountEntry struct {
+	Device     string
+	MountPoint string
+	FSType     string
+	Options    string
+}
+
+// MountTable garde en mémoire la table des montages. Elle n'est relue que
+// lorsque le noyau signale une modification de /proc/self/mountinfo
+// (POLLPRI, surveillé avec epoll), et non à chaque requête.
+type MountTable struct {
+	path string
+
+	mu         sync.RWMutex
+	entries    []MountEntry
+	devices    map[string]MountEntry
+	accessible map[string]bool
+	version    uint64
+	watching   bool
+
+	file   *os.File
+	fileMu sync.Mutex
+}
+
+var (
+	mountsOnce sync.Once
+	mounts     *MountTable
+)
+
+// Mounts retourne la table des montages partagée, surveillée dès le
+// premier appel.
+func Mounts() *MountTable {
+	mountsOnce.Do(func() {
+		mounts = NewMountTable(MountInfoPath)
+		if err := mounts.Watch(); err != nil {
+			fmt.Println(err)
+		}
+	})
+	return mounts
+}
+
+func NewMountTable(path string) *MountTable {
+	return &MountTable{path: path}
+}
+
+// unescapeMountField décode les caractères échappés en octal par le noyau
+// (espace : \040, tabulation : \011, retour à la ligne : \012, \ : \134).
+func unescapeMountField(s string) string {
+	if !strings.Contains(s, `\`) {
+		return s
+	}
+
+	var b strings.Builder
+	for i := 0; i < len(s); i++ {
+		if s[i] == '\\' && i+3 < len(s) {
+			value := 0
+			valid := true
+			for _, c := range s[i+1 : i+4] {
+				if c < '0' || c > '7' {
+					valid = false
+					break
+				}
+				value = value*8 + int(c-'0')
+			}
+			if valid {
+				b.WriteByte(byte(value))
+				i += 3
+				continue
+			}
+		}
+		b.WriteByte(s[i])
+	}
+	return b.String()
+}
+
+// ParseMountInfo lit le format de /proc/<pid>/mountinfo :
+// "id parent maj:min racine point options [champs optionnels] - type source options".
+func ParseMountInfo(data []byte) []MountEntry {
+	var entries []MountEntry
+	for _, line := range strings.Split(string(data), "\n") {
+		fields := strings.Fields(line)
+		separator := -1
+		for i, field := range fields {
+			if field == "-" {
+				separator = i
+				break
+			}
+		}
+		if separator < 6 || len(fields) < separator+3 {
+			continue
+		}
+
+		entries = append(entries, MountEntry{
+			Device:     unescapeMountField(fields[separator+2]),
+			MountPoint: unescapeMountField(fields[4]),
+			FSType:     fields[separator+1],
+			Options:    fields[5],
+		})
+	}
+	return entries
+}
+
+func (t *MountTable) load(data []byte) {
+	entries := ParseMountInfo(data)
+	devices := make(map[string]MountEntry, len(entries))
+	for _, entry := range entries {
+		// Comme disk.Partitions, le premier montage d'un périphérique
+		// donne son point de montage.
+		if _, ok := devices[entry.Device]; !ok {
+			devices[entry.Device] = entry
+		}
+	}
+
+	t.mu.Lock()
+	t.entries = entries
+	t.devices = devices
+	t.accessible = make(map[string]bool)
+	t.version++
+	t.mu.Unlock()
+}
+
+// Reload relit la table des montages.
+func (t *MountTable) Reload() error {
+	t.fileMu.Lock()
+	defer t.fileMu.Unlock()
+
+	var data []byte
+	var err error
+	if t.file != nil {
+		// Relire par le descripteur surveillé acquitte l'événement epoll.
+		if _, err = t.file.Seek(0, io.SeekStart); err == nil {
+			data, err = io.ReadAll(t.file)
+		}
+	} else {
+		data, err = os.ReadFile(t.path)
+	}
+	if err != nil {
+		return fmt.Errorf("Erreur lors de la lecture de %s : %v", t.path, err)
+	}
+
+	t.load(data)
+	return nil
+}
+
+// Watch charge la table puis la recharge à chaque modification signalée
+// par le noyau. Sans surveillance, la table est relue à chaque accès.
+func (t *MountTable) Watch() error {
+	file, err := os.Open(t.path)
+	if err != nil {
+		return fmt.Errorf("Impossible d'ouvrir %s : %v", t.path, err)
+	}
+
+	epfd, err := syscall.EpollCreate1(syscall.EPOLL_CLOEXEC)
+	if err != nil {
+		file.Close()
+		return fmt.Errorf("Impossible de surveiller %s : %v", t.path, err)
+	}
+
+	event := syscall.EpollEvent{Events: syscall.EPOLLPRI | syscall.EPOLLERR, Fd: int32(file.Fd())}
+	if err := syscall.EpollCtl(epfd, syscall.EPOLL_CTL_ADD, int(file.Fd()), &event); err != nil {
+		syscall.Close(epfd)
+		file.Close()
+		return fmt.Errorf("Impossible de surveiller %s : %v", t.path, err)
+	}
+
+	t.fileMu.Lock()
+	t.file = file
+	t.fileMu.Unlock()
+
+	if err := t.Reload(); err != nil {
+		t.fileMu.Lock()
+		t.file = nil
+		t.fileMu.Unlock()
+		syscall.Close(epfd)
+		file.Close()
+		return err
+	}
+
+	t.mu.Lock()
+	t.watching = true
+	t.mu.Unlock()
+
+	go func() {
+		events := make([]syscall.EpollEvent, 1)
+		for {
+			n, err := syscall.EpollWait(epfd, events, -1)
+			if err == syscall.EINTR {
+				continue
+			}
+			if err != nil {
+				fmt.Println("Surveillance des montages interrompue :", err)
+				t.mu.Lock()
+				t.watching = false
+				t.mu.Unlock()
+				return
+			}
+			if n > 0 {
+				if err := t.Reload(); err != nil {
+					fmt.Println(err)
+				}
+			}
+		}
+	}()
+
+	return nil
+}
+
+func (t *MountTable) ensureFresh() error {
+	t.mu.RLock()
+	fresh := t.watching && t.devices != nil
+	t.mu.RUnlock()
+
+	if fresh {
+		mountsCacheStats.Hit()
+		return nil
+	}
+	mountsCacheStats.Miss()
+	return t.Reload()
+}
+
+// Version change à chaque rechargement de la table.
+func (t *MountTable) Version() uint64 {
+	t.mu.RLock()
+	defer t.mu.RUnlock()
+	return t.version
+}
+
+func (t *MountTable) Entries() ([]MountEntry, error) {
+	if err := t.ensureFresh(); err != nil {
+		return nil, err
+	}
+
+	t.mu.RLock()
+	defer t.mu.RUnlock()
+	return append([]MountEntry(nil), t.entries...), nil
+}
+
+func (t *MountTable) Lookup(device string) (MountEntry, bool, error) {
+	if err := t.ensureFresh(); err != nil {
+		return MountEntry{}, false, err
+	}
+
+	t.mu.RLock()
+	defer t.mu.RUnlock()
+	entry, ok := t.devices[device]
+	return entry, ok, nil
+}
+
+// Accessible indique si le point de montage existe ; le résultat du stat
+// est gardé jusqu'au prochain changement de la table.
+func (t *MountTable) Accessible(mountPoint string) bool {
+	t.mu.RLock()
+	accessible, ok := t.accessible[mountPoint]
+	t.mu.RUnlock()
+	if ok {
+		return accessible
+	}
+
+	_, err := os.Stat(mountPoint)
+	accessible = !os.IsNotExist(err)
+
+	t.mu.Lock()
+	if t.accessible != nil {
+		t.accessible[mountPoint] = accessible
+	}
+	t.mu.Unlock()
+	return accessible
+}
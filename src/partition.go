@@ -24,6 +24,7 @@ import (
 	"fmt"
 	"os"
 	"os/exec"
+	"strconv"
 	"strings"
 
 	"github.com/shirou/gopsutil/v3/disk"
@@ -43,28 +44,9 @@ type PartitionInfo struct {
 	LogSec       json.RawMessage `json:"logical_sector_size,omitempty"`
 }
 
-type LsblkDevice struct {
-	Name         string          `json:"name"`
-	FSType       string          `json:"fstype,omitempty"`
-	MountPoint   string          `json:"mountpoint,omitempty"`
-	Size         string          `json:"size"`
-	FSSize       string          `json:"fssize,omitempty"`
-	FSUsed       string          `json:"fsused,omitempty"`
-	UUID         string          `json:"uuid,omitempty"`
-	PartTypeName string          `json:"parttypename,omitempty"`
-	PartNumber   json.RawMessage `json:"partn,omitempty"`
-	PhySec       json.RawMessage `json:"phy-sec,omitempty"`
-	LogSec       json.RawMessage `json:"log-sec,omitempty"`
-	Children     []LsblkDevice   `json:"children,omitempty"`
-}
-
-type LsblkJSON struct {
-	BlockDevices []LsblkDevice `json:"blockdevices"`
-}
-
 func mountPartition(device string, mountPoint string, fstype string) error {
 	cmd := exec.Command("sudo", "mount", "-t", fstype, device, mountPoint)
-	output, err := cmd.CombinedOutput()
+	output, err := commandOutput(cmd, true)
 	if err != nil {
 		return fmt.Errorf("Erreur lors du montage: %v\nSortie: %s", err, string(output))
 	}
@@ -73,7 +55,7 @@ func mountPartition(device string, mountPoint string, fstype string) error {
 
 func unmountPartition(device string) error {
 	cmd := exec.Command("sudo", "umount", device)
-	output, err := cmd.CombinedOutput()
+	output, err := commandOutput(cmd, true)
 	if err != nil {
 		return fmt.Errorf("Erreur lors du démontage: %v\nSortie: %s", err, string(output))
 	}
@@ -114,8 +96,18 @@ func MountUnmountedPartitions(diskName string) error {
 		return fmt.Errorf("Aucun point de montage valide trouvé (/media ou /mnt)")
 	}
 
+	// La table est relue dès la fin des montages, sans attendre
+	// l'événement du noyau.
+	table := Mounts()
+	defer table.Reload()
+
 	for _, part := range partitions {
-		if part.MountPoint == "" && part.FSType != "" {
+		_, mounted, err := table.Lookup(part.Name)
+		if err != nil {
+			return err
+		}
+
+		if !mounted && part.MountPoint == "" && part.FSType != "" {
 			mountDir := fmt.Sprintf("%s%s", mountBase + "/", removeDevPrefix(part.Name))
 
       if _, err := os.Stat(mountDir); os.IsNotExist(err) {
@@ -134,58 +126,50 @@ func MountUnmountedPartitions(diskName string) error {
 }
 
 func GetPartitionsInfo(diskName string) ([]PartitionInfo, error) {
-	out, err := exec.Command("lsblk", "-J", "-o", "NAME,FSTYPE,MOUNTPOINT,SIZE,FSSIZE,FSUSED,UUID,PHY-SEC,LOG-SEC,PARTTYPENAME").Output()
+	topo, err := Topologies().Get()
 	if err != nil {
-		return nil, fmt.Errorf("Erreur lors de l'exécution de lsblk : %v", err)
+		return nil, err
 	}
 
-	var lsblkData LsblkJSON
-	err = json.Unmarshal(out, &lsblkData)
-	if err != nil {
-		return nil, fmt.Errorf("Erreur lors de la lecture du JSON lsblk : %v", err)
+	disk, found := topo.Device(diskName)
+	if !found || disk.PartNumber != 0 {
+		return nil, fmt.Errorf("Aucune partition trouvée pour le disque %s", diskName)
 	}
 
 	var partitions []PartitionInfo
-
-	found := false
-	for _, device := range lsblkData.BlockDevices {
-		if "/dev/"+device.Name == diskName {
-			found = true
-			for _, part := range device.Children {
-				partitions = append(partitions, formatPartitionInfo(part))
-			}
-		}
-	}
-
-	if !found {
-		return nil, fmt.Errorf("Aucune partition trouvée pour le disque %s", diskName)
+	for _, part := range disk.Partitions {
+		partitions = append(partitions, formatPartitionInfo(part))
 	}
 
 	return partitions, nil
 }
 
-func formatPartitionInfo(dev LsblkDevice) PartitionInfo {
-	fsUsed := dev.FSUsed
-	if fsUsed == "" && dev.MountPoint != "" {
-		usage, err := disk.Usage(dev.MountPoint)
-		if err == nil {
-			fsUsed = fmt.Sprintf("%v", usage.Used)
-		}
+func formatPartitionInfo(part *BlockDevice) PartitionInfo {
+	info := PartitionInfo{
+		Name:         "/dev/" + part.Name,
+		FSType:       part.FSType,
+		Size:         HumanSize(part.SizeBytes),
+		UUID:         part.UUID,
+		PartTypeName: part.PartTypeName,
+		PartNumber:   json.RawMessage(strconv.Itoa(part.PartNumber)),
+		PhySec:       json.RawMessage(strconv.Itoa(part.PhysicalSectorSize)),
+		LogSec:       json.RawMessage(strconv.Itoa(part.LogicalSectorSize)),
 	}
 
-	return PartitionInfo{
-		Name:         "/dev/" + dev.Name,
-		FSType:       dev.FSType,
-		MountPoint:   dev.MountPoint,
-		Size:         dev.Size,
-		FSSize:       dev.FSSize,
-		FSUsed:       fsUsed,
-		UUID:         dev.UUID,
-		PartTypeName: dev.PartTypeName,
-		PartNumber:   dev.PartNumber,
-		PhySec:       dev.PhySec,
-		LogSec:       dev.LogSec,
+	entry, mounted, err := Mounts().Lookup(info.Name)
+	if err != nil || !mounted {
+		return info
+	}
+
+	info.MountPoint = entry.MountPoint
+	if info.FSType == "" {
+		info.FSType = entry.FSType
+	}
+	if usage, err := disk.Usage(entry.MountPoint); err == nil {
+		info.FSSize = HumanSize(usage.Total)
+		info.FSUsed = HumanSize(usage.Used)
 	}
+	return info
 }
 
 func GetPartitionsForDiskJSON(diskName string) (string, error) {
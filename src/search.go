@@ -0,0 +1,219 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"runtime"
+	"strings"
+	"sync"
+	"syscall"
+	"time"
+)
+
+const (
+	DefaultSearchLimit = 1000
+	MaxSearchLimit     = 100000
+	MaxSearchWorkers   = 64
+)
+
+// SearchOptions décrit une recherche récursive. Les bornes de taille sont
+// inclusives (-1 : pas de borne) ; les bornes de date sont au format de
+// LastModified ("2006-01-02 15:04:05") et se comparent comme des chaînes.
+type SearchOptions struct {
+	Match       NameMatcher
+	Type        string
+	MinSize     int64
+	MaxSize     int64
+	MinModified string
+	MaxModified string
+	MaxDepth    int
+	Workers     int
+}
+
+type SearchResult struct {
+	Path string `json:"path"`
+	FileInfo
+}
+
+func DefaultSearchWorkers() int {
+	return runtime.NumCPU()
+}
+
+func (opts SearchOptions) accepts(info FileInfo) bool {
+	if opts.Type != "" && info.Type != opts.Type {
+		return false
+	}
+	if opts.MinSize >= 0 && info.SizeBytes < opts.MinSize {
+		return false
+	}
+	if opts.MaxSize >= 0 && info.SizeBytes > opts.MaxSize {
+		return false
+	}
+	if opts.MinModified != "" && info.LastModified < opts.MinModified {
+		return false
+	}
+	if opts.MaxModified != "" && info.LastModified > opts.MaxModified {
+		return false
+	}
+	return true
+}
+
+// entryType donne le type d'une entrée à partir de la lecture du dossier
+// (d_type), ce qui permet d'écarter une entrée sans la stat'er.
+func entryType(entry os.DirEntry) string {
+	switch {
+	case entry.Type()&os.ModeSymlink != 0:
+		return "symlink"
+	case entry.IsDir():
+		return "directory"
+	default:
+		return "file"
+	}
+}
+
+type searcher struct {
+	ctx       context.Context
+	opts      SearchOptions
+	mountPath string
+	device    uint64
+	slots     chan struct{}
+	wg        sync.WaitGroup
+	results   chan SearchResult
+}
+
+// SearchFiles parcourt path et ses sous-dossiers dans la partition montée
+// en mountPath et envoie les entrées correspondantes sur le canal retourné,
+// au fur et à mesure. Au plus opts.Workers goroutines lisent des dossiers
+// en parallèle ; au-delà, le dossier est parcouru par la goroutine
+// courante. Le parcours ne quitte pas la partition et s'arrête dès que ctx
+// est annulé. Le canal est fermé à la fin du parcours.
+func SearchFiles(ctx context.Context, mountPath string, path string, opts SearchOptions) (<-chan SearchResult, error) {
+	root := RemoveDoubleSlashes(AddSlash(mountPath + "/" + path))
+	root = strings.TrimSuffix(root, "/")
+
+	var stat syscall.Stat_t
+	if err := statPath(mountPath, &stat); err != nil {
+		return nil, err
+	}
+	if _, err := readDir(AddTrailingSlash(root)); err != nil {
+		return nil, err
+	}
+
+	if opts.Workers <= 0 {
+		opts.Workers = DefaultSearchWorkers()
+	}
+
+	s := &searcher{
+		ctx:       ctx,
+		opts:      opts,
+		mountPath: strings.TrimSuffix(mountPath, "/"),
+		device:    uint64(stat.Dev),
+		slots:     make(chan struct{}, opts.Workers),
+		results:   make(chan SearchResult, 256),
+	}
+
+	s.wg.Add(1)
+	go func() {
+		s.walk(root, 1)
+		s.wg.Wait()
+		close(s.results)
+	}()
+
+	return s.results, nil
+}
+
+func (s *searcher) spawn(dir string, depth int) {
+	s.wg.Add(1)
+	select {
+	case s.slots <- struct{}{}:
+		go func() {
+			defer func() { <-s.slots }()
+			s.walk(dir, depth)
+		}()
+	default:
+		s.walk(dir, depth)
+	}
+}
+
+func (s *searcher) sameDevice(dir string) bool {
+	var stat syscall.Stat_t
+	if err := lstatPath(dir, &stat); err != nil {
+		return false
+	}
+	return uint64(stat.Dev) == s.device
+}
+
+func (s *searcher) walk(dir string, depth int) {
+	defer s.wg.Done()
+
+	entries, err := readDir(AddTrailingSlash(dir))
+	if err != nil {
+		return
+	}
+
+	for _, entry := range entries {
+		if s.ctx.Err() != nil {
+			return
+		}
+
+		fullPath := dir + "/" + entry.Name()
+		kind := entryType(entry)
+
+		if kind == "directory" && (s.opts.MaxDepth <= 0 || depth < s.opts.MaxDepth) && s.sameDevice(fullPath) {
+			s.spawn(fullPath, depth+1)
+		}
+
+		if s.opts.Type != "" && kind != s.opts.Type {
+			continue
+		}
+		if s.opts.Match != nil && !s.opts.Match(entry.Name()) {
+			continue
+		}
+
+		info, err := getFileInfo(fullPath, entry)
+		if err != nil || !s.opts.accepts(info) {
+			continue
+		}
+
+		result := SearchResult{
+			Path:     strings.TrimPrefix(strings.TrimPrefix(fullPath, s.mountPath), "/"),
+			FileInfo: info,
+		}
+		select {
+		case s.results <- result:
+		case <-s.ctx.Done():
+			return
+		}
+	}
+}
+
+// ParseSearchDate accepte "2006-01-02" ou "2006-01-02 15:04:05" et
+// retourne la date au format de LastModified.
+func ParseSearchDate(value string) (string, error) {
+	for _, layout := range []string{"2006-01-02 15:04:05", "2006-01-02T15:04:05", "2006-01-02"} {
+		if t, err := time.ParseInLocation(layout, value, time.Local); err == nil {
+			return t.Format("2006-01-02 15:04:05"), nil
+		}
+	}
+	return "", fmt.Errorf("Date invalide %s : formats acceptés AAAA-MM-JJ ou AAAA-MM-JJ HH:MM:SS", value)
+}
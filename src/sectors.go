@@ -0,0 +1,257 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"encoding/hex"
+	"fmt"
+	"io"
+	"net/http"
+	"os"
+	"path/filepath"
+	"strconv"
+	"strings"
+	"sync"
+	"time"
+)
+
+const (
+	DevRoot = "/dev"
+
+	DefaultSectorCount = 1
+	// MaxSectorBytes borne la taille d'une lecture de /sectors ; count est
+	// réduit en conséquence.
+	MaxSectorBytes = 1 << 20
+
+	// DefaultImageSectorSize est la taille de secteur supposée pour une
+	// image, faute de périphérique à interroger.
+	DefaultImageSectorSize = 512
+	MinSectorSize          = 512
+	MaxSectorSize          = 64 * 1024
+)
+
+// SectorSource est un disque, une partition ou une image disque lus
+// secteur par secteur, sans rien monter.
+type SectorSource struct {
+	Path               string
+	SectorSize         int
+	PhysicalSectorSize int
+	SizeBytes          int64
+}
+
+func (s SectorSource) TotalSectors() int64 {
+	return (s.SizeBytes + int64(s.SectorSize) - 1) / int64(s.SectorSize)
+}
+
+type SectorPage struct {
+	Source             string           `json:"source"`
+	SectorSize         int              `json:"sector_size"`
+	PhysicalSectorSize int              `json:"physical_sector_size"`
+	TotalSectors       int64            `json:"total_sectors"`
+	Offset             int64            `json:"offset"`
+	Count              int              `json:"count"`
+	Sectors            map[int64]string `json:"sectors"`
+}
+
+// sectorBuffers évite d'allouer un tampon par requête : chaque lecture
+// tient dans MaxSectorBytes.
+var sectorBuffers = sync.Pool{
+	New: func() interface{} {
+		buffer := make([]byte, MaxSectorBytes)
+		return &buffer
+	},
+}
+
+// ValidSectorSize indique si size est une taille de secteur plausible :
+// une puissance de 2 entre MinSectorSize et MaxSectorSize.
+func ValidSectorSize(size int) bool {
+	return size >= MinSectorSize && size <= MaxSectorSize && size&(size-1) == 0
+}
+
+// DeviceSectorSource décrit le disque ou la partition name (avec ou sans
+// préfixe /dev/). Seuls les périphériques de la topologie sont acceptés ;
+// la taille de secteur est leur taille logique, sauf si sectorSize est
+// donnée (0 sinon).
+func DeviceSectorSource(name string, sectorSize int) (SectorSource, error) {
+	topo, err := Topologies().Get()
+	if err != nil {
+		return SectorSource{}, err
+	}
+	device, ok := topo.Device(name)
+	if !ok {
+		return SectorSource{}, fmt.Errorf("Périphérique %s introuvable", name)
+	}
+
+	source := SectorSource{
+		Path:               filepath.Join(DevRoot, device.Name),
+		SectorSize:         device.LogicalSectorSize,
+		PhysicalSectorSize: device.PhysicalSectorSize,
+		SizeBytes:          int64(device.SizeBytes),
+	}
+	if sectorSize != 0 {
+		source.SectorSize = sectorSize
+	}
+	if !ValidSectorSize(source.SectorSize) {
+		source.SectorSize = DefaultImageSectorSize
+	}
+	if source.PhysicalSectorSize < source.SectorSize {
+		source.PhysicalSectorSize = source.SectorSize
+	}
+	return source, nil
+}
+
+// ImageDir retourne le dossier des images disque lisibles par /sectors :
+// $DISK_IMAGE_DIR, ou "" si la lecture d'images est désactivée. Sans
+// cette restriction, la route lirait n'importe quel fichier du serveur,
+// qui tourne en root pour accéder aux périphériques.
+func ImageDir() string {
+	return os.Getenv("DISK_IMAGE_DIR")
+}
+
+// resolveImagePath retourne le chemin réel de l'image path, après
+// résolution des liens symboliques, s'il se trouve dans ImageDir.
+func resolveImagePath(path string) (string, error) {
+	dir := ImageDir()
+	if dir == "" {
+		return "", fmt.Errorf("Lecture d'images désactivée (DISK_IMAGE_DIR non défini)")
+	}
+	if !filepath.IsAbs(path) {
+		return "", fmt.Errorf("Le chemin de l'image doit être absolu : %s", path)
+	}
+
+	root, err := filepath.EvalSymlinks(dir)
+	if err != nil {
+		return "", fmt.Errorf("Dossier des images %s inaccessible : %v", dir, err)
+	}
+	resolved, err := filepath.EvalSymlinks(path)
+	if err != nil {
+		return "", fmt.Errorf("Image %s inaccessible : %v", path, err)
+	}
+	rel, err := filepath.Rel(root, resolved)
+	if err != nil || rel == ".." || strings.HasPrefix(rel, ".."+string(filepath.Separator)) {
+		return "", fmt.Errorf("L'image %s n'est pas dans %s", path, dir)
+	}
+	return resolved, nil
+}
+
+// ImageSectorSource décrit l'image disque path, un fichier ordinaire
+// désigné par un chemin absolu dans ImageDir. Sans sectorSize (0), les
+// secteurs font DefaultImageSectorSize octets.
+func ImageSectorSource(path string, sectorSize int) (SectorSource, error) {
+	path, err := resolveImagePath(path)
+	if err != nil {
+		return SectorSource{}, err
+	}
+	info, err := statInfo(path)
+	if err != nil {
+		return SectorSource{}, fmt.Errorf("Image %s inaccessible : %v", path, err)
+	}
+	if !info.Mode().IsRegular() {
+		return SectorSource{}, fmt.Errorf("%s n'est pas un fichier image", path)
+	}
+
+	if sectorSize == 0 {
+		sectorSize = DefaultImageSectorSize
+	}
+	return SectorSource{
+		Path:               path,
+		SectorSize:         sectorSize,
+		PhysicalSectorSize: sectorSize,
+		SizeBytes:          info.Size(),
+	}, nil
+}
+
+// ReadSectors lit au plus count secteurs à partir du secteur offset, en
+// une lecture positionnelle (pread) dans un tampon du pool, et passe les
+// octets lus à use. Le tampon est réutilisé ensuite : use ne doit pas le
+// garder. count est réduit à MaxSectorBytes et à la fin de la source ;
+// au-delà de la fin, use reçoit une tranche vide.
+func ReadSectors(source SectorSource, offset int64, count int, use func(data []byte) error) error {
+	file, err := os.Open(source.Path)
+	if err != nil {
+		return fmt.Errorf("Impossible d'ouvrir %s : %v", source.Path, err)
+	}
+	defer file.Close()
+
+	// offset est comparé au nombre de secteurs avant toute multiplication :
+	// un offset énorme déborderait et désignerait un autre secteur.
+	count = min(count, MaxSectorBytes/source.SectorSize)
+	if offset < 0 || count <= 0 || offset >= source.TotalSectors() {
+		return use(nil)
+	}
+	size := int64(source.SectorSize)
+	start := offset * size
+	length := min(int64(count)*size, source.SizeBytes-start)
+
+	buffer := sectorBuffers.Get().(*[]byte)
+	defer sectorBuffers.Put(buffer)
+
+	n, err := preadAt(file, (*buffer)[:length], start)
+	if err != nil && err != io.EOF {
+		return fmt.Errorf("Erreur de lecture de %s : %v", source.Path, err)
+	}
+	return use((*buffer)[:n])
+}
+
+func preadAt(file *os.File, buffer []byte, offset int64) (n int, err error) {
+	defer fsPread.observe(time.Now(), &err)
+	return file.ReadAt(buffer, offset)
+}
+
+// GenerateSectorPage lit les secteurs demandés et les encode en
+// hexadécimal, un par entrée comme les pages de /blocks.
+func GenerateSectorPage(source SectorSource, offset int64, count int) (SectorPage, error) {
+	page := SectorPage{
+		Source:             source.Path,
+		SectorSize:         source.SectorSize,
+		PhysicalSectorSize: source.PhysicalSectorSize,
+		TotalSectors:       source.TotalSectors(),
+		Offset:             offset,
+		Sectors:            make(map[int64]string),
+	}
+
+	err := ReadSectors(source, offset, count, func(data []byte) error {
+		for i := 0; i*source.SectorSize < len(data); i++ {
+			end := min((i+1)*source.SectorSize, len(data))
+			page.Sectors[offset+int64(i)] = hex.EncodeToString(data[i*source.SectorSize : end])
+			page.Count++
+		}
+		return nil
+	})
+	return page, err
+}
+
+// ServeRawSectors envoie les secteurs demandés en application/octet-stream.
+// Les en-têtes X-Sector-* décrivent la géométrie et la portion envoyée.
+func ServeRawSectors(w http.ResponseWriter, source SectorSource, offset int64, count int) error {
+	return ReadSectors(source, offset, count, func(data []byte) error {
+		header := w.Header()
+		header.Set("Content-Type", "application/octet-stream")
+		header.Set("Content-Length", strconv.Itoa(len(data)))
+		header.Set("X-Sector-Size", strconv.Itoa(source.SectorSize))
+		header.Set("X-Physical-Sector-Size", strconv.Itoa(source.PhysicalSectorSize))
+		header.Set("X-Total-Sectors", strconv.FormatInt(source.TotalSectors(), 10))
+		header.Set("X-Sector-Offset", strconv.FormatInt(offset, 10))
+		header.Set("X-Sector-Count", strconv.Itoa((len(data)+source.SectorSize-1)/source.SectorSize))
+		w.WriteHeader(http.StatusOK)
+		_, err := w.Write(data)
+		return err
+	})
+}
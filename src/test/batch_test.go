@@ -0,0 +1,62 @@
+package main
+
+import (
+	"context"
+	"encoding/json"
+	"net/http"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/gin-gonic/gin"
+	"github.com/stretchr/testify/assert"
+)
+
+func TestRunBatch(t *testing.T) {
+	var running, maxRunning atomic.Int64
+
+	r := gin.New()
+	r.GET("/files", func(c *gin.Context) {
+		current := running.Add(1)
+		defer running.Add(-1)
+		for {
+			seen := maxRunning.Load()
+			if current <= seen || maxRunning.CompareAndSwap(seen, current) {
+				break
+			}
+		}
+		time.Sleep(20 * time.Millisecond)
+
+		if c.Query("path") == "" {
+			c.JSON(http.StatusBadRequest, gin.H{"error": "path parameter is required"})
+			return
+		}
+		c.JSON(http.StatusOK, gin.H{"path": c.Query("path")})
+	})
+
+	requests := []BatchRequest{
+		{Path: "/files", Params: map[string]string{"path": "a"}},
+		{Path: "/files", Params: map[string]string{}},
+		{Path: "/search", Params: map[string]string{"path": "a"}},
+		{Path: "/files", Params: map[string]string{"path": "b"}},
+		{Path: "/files", Params: map[string]string{"path": "c"}},
+		{Path: "/blocks", Params: map[string]string{"format": "raw"}},
+	}
+
+	responses := RunBatch(context.Background(), r, requests, 4)
+	assert.Len(t, responses, len(requests))
+
+	expected := []int{200, 400, 404, 200, 200, 400}
+	for i, response := range responses {
+		assert.Equal(t, expected[i], response.Status, "requête %d", i)
+	}
+
+	var body map[string]string
+	assert.NoError(t, json.Unmarshal(responses[3].Body, &body))
+	assert.Equal(t, "b", body["path"])
+	assert.NoError(t, json.Unmarshal(responses[1].Body, &body))
+	assert.Equal(t, "path parameter is required", body["error"])
+
+	assert.Greater(t, maxRunning.Load(), int64(1))
+	assert.LessOrEqual(t, maxRunning.Load(), int64(4))
+}
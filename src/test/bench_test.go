@@ -0,0 +1,193 @@
+package main
+
+import (
+	"encoding/json"
+	"fmt"
+	"os"
+	"strconv"
+	"strings"
+	"testing"
+)
+
+// Benchmarks des chemins chauds du serveur, sur des données générées dont
+// la taille se règle par variables d'environnement :
+//
+//	BENCH_FILES      nombre d'entrées du dossier généré (10000 par défaut)
+//	BENCH_FILE_SIZE  taille du fichier lu par blocs, en octets (1 Mio)
+//
+//	BENCH_FILES=100000 go test -run '^$' -bench . -benchmem ./test/
+
+func benchSetting(b *testing.B, name string, fallback int) int {
+	value := os.Getenv(name)
+	if value == "" {
+		return fallback
+	}
+	n, err := strconv.Atoi(value)
+	if err != nil || n <= 0 {
+		b.Fatalf("%s invalide : %q", name, value)
+	}
+	return n
+}
+
+// createBenchTree crée un dossier de count fichiers de tailles variées et
+// quelques sous-dossiers.
+func createBenchTree(b *testing.B, count int) string {
+	dir, err := os.MkdirTemp("", "benchdir")
+	if err != nil {
+		b.Fatal(err)
+	}
+	for i := 0; i < count; i++ {
+		name := fmt.Sprintf("%s/file%06d.%s", dir, i, []string{"txt", "log", "png", "bin"}[i%4])
+		if err := os.WriteFile(name, make([]byte, i%4096), 0644); err != nil {
+			b.Fatal(err)
+		}
+	}
+	for i := 0; i < count/100; i++ {
+		if err := os.Mkdir(fmt.Sprintf("%s/dir%04d", dir, i), 0755); err != nil {
+			b.Fatal(err)
+		}
+	}
+	return dir + "/"
+}
+
+func BenchmarkListRootFiles(b *testing.B) {
+	count := benchSetting(b, "BENCH_FILES", 10000)
+	dir := createBenchTree(b, count)
+	defer os.RemoveAll(dir)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		if _, err := listRootFiles(dir, ""); err != nil {
+			b.Fatal(err)
+		}
+	}
+	b.ReportMetric(float64(count*b.N)/b.Elapsed().Seconds(), "entries/s")
+}
+
+func BenchmarkGetFileInfo(b *testing.B) {
+	count := benchSetting(b, "BENCH_FILES", 10000)
+	dir := createBenchTree(b, count)
+	defer os.RemoveAll(dir)
+
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		entry := entries[i%len(entries)]
+		if _, err := getFileInfo(dir+entry.Name(), entry); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkFilterFilesByName(b *testing.B) {
+	count := benchSetting(b, "BENCH_FILES", 10000)
+	response := FilesResponse{MountPath: "/media/bench", Files: make([]FileInfo, count)}
+	for i := range response.Files {
+		response.Files[i] = FileInfo{
+			Name:         fmt.Sprintf("file%06d.log", i),
+			Type:         "file",
+			SizeBytes:    int64(i),
+			Permissions:  "-rw-r--r--",
+			Inode:        uint64(i),
+			LastModified: "2025-01-01 00:00:00",
+		}
+	}
+	jsonData, err := json.Marshal(response)
+	if err != nil {
+		b.Fatal(err)
+	}
+
+	// "file0000" garde une entrée sur 100 quand BENCH_FILES vaut 10000.
+	for _, filter := range []string{"file0000", "log"} {
+		b.Run("filter="+filter, func(b *testing.B) {
+			b.SetBytes(int64(len(jsonData)))
+			for i := 0; i < b.N; i++ {
+				if _, err := FilterFilesByName(jsonData, filter); err != nil {
+					b.Fatal(err)
+				}
+			}
+		})
+	}
+}
+
+func BenchmarkGenerateJSON(b *testing.B) {
+	size := benchSetting(b, "BENCH_FILE_SIZE", 1<<20)
+	path := createPatternFile(b, size, BlockSize)
+	defer os.Remove(path)
+
+	b.SetBytes(int64(size))
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		if _, err := GenerateJSON(path); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkReadBlock(b *testing.B) {
+	size := benchSetting(b, "BENCH_FILE_SIZE", 1<<20)
+	path := createPatternFile(b, size, BlockSize)
+	defer os.Remove(path)
+
+	file, err := os.Open(path)
+	if err != nil {
+		b.Fatal(err)
+	}
+	defer file.Close()
+	blocks := (size + BlockSize - 1) / BlockSize
+
+	b.SetBytes(BlockSize)
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		if _, err := ReadBlock(file, i%blocks); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// BenchmarkReadSectors lit des fenêtres de 256 secteurs d'une image par
+// pread dans un tampon du pool, sans encodage : c'est le chemin de
+// /sectors?format=raw.
+func BenchmarkReadSectors(b *testing.B) {
+	size := benchSetting(b, "BENCH_FILE_SIZE", 1<<20)
+	path := createPatternFile(b, size, BlockSize)
+	defer os.Remove(path)
+
+	b.Setenv("DISK_IMAGE_DIR", os.TempDir())
+	source, err := ImageSectorSource(path, 0)
+	if err != nil {
+		b.Fatal(err)
+	}
+	const count = 256
+	windows := max(source.TotalSectors()/count, 1)
+
+	b.SetBytes(count * DefaultImageSectorSize)
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		err := ReadSectors(source, int64(i)%windows*count, count, func(data []byte) error { return nil })
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkRemoveDoubleSlashes(b *testing.B) {
+	paths := map[string]string{
+		"clean":  "/media/sda1/home/user/documents/report.pdf",
+		"double": "/media/sda1//home/user//documents/report.pdf",
+		"runs":   "/media/sda1" + strings.Repeat("/", 64) + "home" + strings.Repeat("/", 64) + "user",
+	}
+	for _, name := range []string{"clean", "double", "runs"} {
+		path := paths[name]
+		b.Run(name, func(b *testing.B) {
+			for i := 0; i < b.N; i++ {
+				RemoveDoubleSlashes(path)
+			}
+		})
+	}
+}
@@ -0,0 +1,113 @@
+package main
+
+import (
+	"encoding/hex"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+// createPatternFile écrit un fichier temporaire de size octets dont chaque
+// octet vaut son numéro de bloc de blockSize octets (modulo 256). Il sert
+// aux tests et aux benchmarks des blocs et des secteurs.
+func createPatternFile(tb testing.TB, size int, blockSize int) string {
+	file, err := os.CreateTemp("", "testblocks")
+	if err != nil {
+		tb.Fatal(err)
+	}
+	defer file.Close()
+
+	data := make([]byte, size)
+	for i := range data {
+		data[i] = byte(i / blockSize)
+	}
+	if _, err := file.Write(data); err != nil {
+		tb.Fatal(err)
+	}
+	return file.Name()
+}
+
+func TestGenerateBlockPage(t *testing.T) {
+	path := createPatternFile(t, 2*BlockSize+276, BlockSize)
+	defer os.Remove(path)
+
+	page, err := GenerateBlockPage(path, 1, 5)
+	assert.NoError(t, err)
+	assert.Equal(t, int64(3), page.TotalBlocks)
+	assert.Equal(t, BlockSize, page.BlockSize)
+	assert.Equal(t, int64(1), page.Offset)
+	assert.Equal(t, 2, page.Count)
+	assert.Len(t, page.Blocks, 2)
+
+	last, err := hex.DecodeString(page.Blocks[2])
+	assert.NoError(t, err)
+	assert.Len(t, last, 276)
+	assert.Equal(t, byte(2), last[0])
+}
+
+func TestGenerateBlockPageOutOfRange(t *testing.T) {
+	path := createPatternFile(t, BlockSize, BlockSize)
+	defer os.Remove(path)
+
+	page, err := GenerateBlockPage(path, 10, 5)
+	assert.NoError(t, err)
+	assert.Equal(t, int64(1), page.TotalBlocks)
+	assert.Equal(t, 0, page.Count)
+	assert.Empty(t, page.Blocks)
+}
+
+func TestGenerateBlockPageMissingFile(t *testing.T) {
+	_, err := GenerateBlockPage("/nonexistent/file", 0, 1)
+	assert.Error(t, err)
+}
+
+func TestServeRawBlocks(t *testing.T) {
+	path := createPatternFile(t, 3*BlockSize, BlockSize)
+	defer os.Remove(path)
+
+	request := httptest.NewRequest("GET", "/blocks?format=raw", nil)
+	recorder := httptest.NewRecorder()
+	err := ServeRawBlocks(recorder, request, path, 1, 1)
+	assert.NoError(t, err)
+	assert.Equal(t, http.StatusOK, recorder.Code)
+	assert.Equal(t, "application/octet-stream", recorder.Header().Get("Content-Type"))
+	assert.Equal(t, "3", recorder.Header().Get("X-Total-Blocks"))
+	assert.Equal(t, "1", recorder.Header().Get("X-Block-Offset"))
+	assert.Len(t, recorder.Body.Bytes(), BlockSize)
+	assert.Equal(t, byte(1), recorder.Body.Bytes()[0])
+}
+
+func TestServeRawBlocksWindow(t *testing.T) {
+	path := createPatternFile(t, (MaxBlockCount+2)*BlockSize, BlockSize)
+	defer os.Remove(path)
+
+	request := httptest.NewRequest("GET", "/blocks?format=raw", nil)
+	recorder := httptest.NewRecorder()
+	assert.NoError(t, ServeRawBlocks(recorder, request, path, 0, MaxBlockCount+10))
+	assert.Len(t, recorder.Body.Bytes(), MaxBlockCount*BlockSize)
+
+	// offset * BlockSize déborde : aucun octet ne doit être renvoyé.
+	for _, offset := range []int64{1<<55 + 1, 1<<54 + 1, 1 << 62} {
+		recorder = httptest.NewRecorder()
+		assert.NoError(t, ServeRawBlocks(recorder, request, path, offset, 2))
+		assert.Equal(t, http.StatusOK, recorder.Code)
+		assert.Equal(t, 0, recorder.Body.Len())
+	}
+}
+
+func TestServeRawBlocksRange(t *testing.T) {
+	path := createPatternFile(t, 3*BlockSize, BlockSize)
+	defer os.Remove(path)
+
+	request := httptest.NewRequest("GET", "/blocks?format=raw", nil)
+	request.Header.Set("Range", "bytes=1020-1029")
+	recorder := httptest.NewRecorder()
+	err := ServeRawBlocks(recorder, request, path, 0, 1)
+	assert.NoError(t, err)
+	assert.Equal(t, http.StatusPartialContent, recorder.Code)
+	assert.Equal(t, "bytes 1020-1029/1536", recorder.Header().Get("Content-Range"))
+	assert.Equal(t, []byte{1, 1, 1, 1, 2, 2, 2, 2, 2, 2}, recorder.Body.Bytes())
+}
@@ -0,0 +1,61 @@
+package main
+
+import (
+	"compress/gzip"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+
+	"github.com/gin-gonic/gin"
+	"github.com/stretchr/testify/assert"
+)
+
+func TestAcceptsGzip(t *testing.T) {
+	assert.True(t, acceptsGzip("gzip, deflate"))
+	assert.True(t, acceptsGzip("br;q=1.0, gzip;q=0.5"))
+	assert.True(t, acceptsGzip("*"))
+	assert.False(t, acceptsGzip("gzip;q=0"))
+	assert.False(t, acceptsGzip("deflate, br"))
+	assert.False(t, acceptsGzip(""))
+}
+
+func TestCompression(t *testing.T) {
+	r := gin.New()
+	r.Use(Compression())
+	body := strings.Repeat(`{"name":"file.txt"}`, 100)
+	r.GET("/json", func(c *gin.Context) {
+		c.Header("Content-Type", "application/json")
+		c.String(http.StatusOK, body)
+	})
+	r.GET("/raw", func(c *gin.Context) {
+		c.Data(http.StatusOK, "application/octet-stream", []byte(body))
+	})
+
+	request := httptest.NewRequest("GET", "/json", nil)
+	request.Header.Set("Accept-Encoding", "gzip")
+	recorder := httptest.NewRecorder()
+	r.ServeHTTP(recorder, request)
+	assert.Equal(t, "gzip", recorder.Header().Get("Content-Encoding"))
+	assert.Less(t, recorder.Body.Len(), len(body))
+
+	reader, err := gzip.NewReader(recorder.Body)
+	assert.NoError(t, err)
+	decoded, err := io.ReadAll(reader)
+	assert.NoError(t, err)
+	assert.Equal(t, body, string(decoded))
+
+	request = httptest.NewRequest("GET", "/raw", nil)
+	request.Header.Set("Accept-Encoding", "gzip")
+	recorder = httptest.NewRecorder()
+	r.ServeHTTP(recorder, request)
+	assert.Empty(t, recorder.Header().Get("Content-Encoding"))
+	assert.Equal(t, body, recorder.Body.String())
+
+	request = httptest.NewRequest("GET", "/json", nil)
+	recorder = httptest.NewRecorder()
+	r.ServeHTTP(recorder, request)
+	assert.Empty(t, recorder.Header().Get("Content-Encoding"))
+	assert.Equal(t, body, recorder.Body.String())
+}
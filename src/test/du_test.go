@@ -0,0 +1,103 @@
+package main
+
+import (
+	"context"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func createDuTree(t *testing.T) string {
+	dir, err := os.MkdirTemp("", "dudir")
+	assert.NoError(t, err)
+
+	files := map[string]int{
+		"root.bin":         100,
+		"a/one.bin":        1000,
+		"a/deep/two.bin":   2000,
+		"a/deep/three.bin": 3000,
+		"b/four.bin":       4,
+	}
+	for name, size := range files {
+		path := filepath.Join(dir, name)
+		assert.NoError(t, os.MkdirAll(filepath.Dir(path), 0755))
+		assert.NoError(t, os.WriteFile(path, make([]byte, size), 0644))
+	}
+	assert.NoError(t, os.Mkdir(filepath.Join(dir, "empty"), 0755))
+	return dir
+}
+
+func TestDiskUsage(t *testing.T) {
+	dir := createDuTree(t)
+	defer os.RemoveAll(dir)
+
+	scan, err := StartDiskUsage(context.Background(), dir, "", DuOptions{MaxDepth: 1})
+	assert.NoError(t, err)
+	result, err := scan.Result()
+	assert.NoError(t, err)
+
+	assert.Equal(t, int64(6104), result.Total.SizeBytes)
+	assert.Equal(t, int64(5), result.Total.Files)
+	assert.Equal(t, int64(4), result.Total.Dirs)
+
+	paths := map[string]DirUsage{}
+	for _, usage := range result.Dirs {
+		paths[usage.Path] = usage
+	}
+	assert.Len(t, paths, 3)
+	assert.Equal(t, int64(6000), paths["a"].SizeBytes)
+	assert.Equal(t, int64(3), paths["a"].Files)
+	assert.Equal(t, int64(1), paths["a"].Dirs)
+	assert.Equal(t, int64(4), paths["b"].SizeBytes)
+	assert.Equal(t, int64(0), paths["empty"].SizeBytes)
+
+	// Le sous-dossier a déjà été lu : il vient du cache.
+	scan, err = StartDiskUsage(context.Background(), dir, "a", DuOptions{MaxDepth: 1})
+	assert.NoError(t, err)
+	result, err = scan.Result()
+	assert.NoError(t, err)
+	assert.Equal(t, int64(6000), result.Total.SizeBytes)
+	assert.Equal(t, "a/deep", result.Dirs[0].Path)
+	progress := scan.Progress()
+	assert.Equal(t, int64(2), progress.Dirs)
+	assert.Equal(t, int64(2), progress.CachedDirs)
+
+	// Un ajout change la date du dossier, qui est relu.
+	assert.NoError(t, os.WriteFile(filepath.Join(dir, "a/deep/new.bin"), make([]byte, 10), 0644))
+	scan, err = StartDiskUsage(context.Background(), dir, "a", DuOptions{})
+	assert.NoError(t, err)
+	result, err = scan.Result()
+	assert.NoError(t, err)
+	assert.Equal(t, int64(6010), result.Total.SizeBytes)
+	assert.Empty(t, result.Dirs)
+	assert.Equal(t, int64(1), scan.Progress().CachedDirs)
+
+	// Un fichier réécrit sur place ne change pas la date du dossier : le
+	// dossier vient du cache, mais la nouvelle taille est comptée.
+	assert.NoError(t, os.WriteFile(filepath.Join(dir, "a/deep/two.bin"), make([]byte, 2500), 0644))
+	scan, err = StartDiskUsage(context.Background(), dir, "a", DuOptions{})
+	assert.NoError(t, err)
+	result, err = scan.Result()
+	assert.NoError(t, err)
+	assert.Equal(t, int64(6510), result.Total.SizeBytes)
+	assert.Equal(t, int64(2), scan.Progress().CachedDirs)
+
+	_, err = StartDiskUsage(context.Background(), dir, "root.bin", DuOptions{})
+	assert.Error(t, err)
+	_, err = StartDiskUsage(context.Background(), dir, "missing", DuOptions{})
+	assert.Error(t, err)
+}
+
+func TestDiskUsageCancel(t *testing.T) {
+	dir := createDuTree(t)
+	defer os.RemoveAll(dir)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	scan, err := StartDiskUsage(ctx, dir, "", DuOptions{Refresh: true})
+	assert.NoError(t, err)
+	_, err = scan.Result()
+	assert.Error(t, err)
+}
@@ -0,0 +1,66 @@
+package main
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"testing"
+	"time"
+
+	"github.com/gin-gonic/gin"
+	"github.com/stretchr/testify/assert"
+)
+
+func TestETagMatches(t *testing.T) {
+	assert.True(t, ETagMatches(`W/"abc"`, `W/"abc"`))
+	assert.True(t, ETagMatches(`"abc"`, `W/"abc"`))
+	assert.True(t, ETagMatches(`"x", W/"abc"`, `W/"abc"`))
+	assert.True(t, ETagMatches(`*`, `W/"abc"`))
+	assert.False(t, ETagMatches(`W/"abd"`, `W/"abc"`))
+	assert.False(t, ETagMatches(``, `W/"abc"`))
+}
+
+func TestNotModified(t *testing.T) {
+	dir, err := os.MkdirTemp("", "testdir")
+	assert.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	r := gin.New()
+	r.GET("/dir", func(c *gin.Context) {
+		if NotModified(c, dir) {
+			return
+		}
+		c.String(http.StatusOK, "listing")
+	})
+
+	request := httptest.NewRequest("GET", "/dir?limit=10", nil)
+	recorder := httptest.NewRecorder()
+	r.ServeHTTP(recorder, request)
+	assert.Equal(t, http.StatusOK, recorder.Code)
+	etag := recorder.Header().Get("ETag")
+	assert.NotEmpty(t, etag)
+
+	request = httptest.NewRequest("GET", "/dir?limit=10", nil)
+	request.Header.Set("If-None-Match", etag)
+	recorder = httptest.NewRecorder()
+	r.ServeHTTP(recorder, request)
+	assert.Equal(t, http.StatusNotModified, recorder.Code)
+	assert.Empty(t, recorder.Body.String())
+
+	// Une autre requête sur le même dossier a son propre ETag.
+	request = httptest.NewRequest("GET", "/dir?limit=20", nil)
+	request.Header.Set("If-None-Match", etag)
+	recorder = httptest.NewRecorder()
+	r.ServeHTTP(recorder, request)
+	assert.Equal(t, http.StatusOK, recorder.Code)
+
+	// Ajouter une entrée change la date du dossier.
+	time.Sleep(10 * time.Millisecond)
+	assert.NoError(t, os.WriteFile(dir+"/new.txt", []byte("data"), 0644))
+	request = httptest.NewRequest("GET", "/dir?limit=10", nil)
+	request.Header.Set("If-None-Match", etag)
+	recorder = httptest.NewRecorder()
+	r.ServeHTTP(recorder, request)
+	assert.Equal(t, http.StatusOK, recorder.Code)
+	assert.NotEqual(t, etag, recorder.Header().Get("ETag"))
+}
@@ -1,8 +1,12 @@
 package main
 
 import (
+	"encoding/json"
+	"fmt"
 	"os"
+	"sort"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/assert"
 )
@@ -42,6 +46,31 @@ func TestListRootFiles(t *testing.T) {
 	assert.Contains(t, jsonData, "testfile")
 }
 
+func TestListFilesWithMatcher(t *testing.T) {
+
+	dir, err := os.MkdirTemp("", "testdir")
+	assert.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	for _, name := range []string{"photo.png", "notes.txt", "Image.PNG"} {
+		assert.NoError(t, os.WriteFile(dir+"/"+name, []byte("data"), 0644))
+	}
+
+	match, err := NewNameMatcher(FilterOptions{Extensions: []string{".png"}})
+	assert.NoError(t, err)
+
+	content, err := listFiles(dir, "", match)
+	assert.NoError(t, err)
+	assert.Equal(t, dir, content.MountPath)
+	assert.Len(t, content.Files, 2)
+	for _, file := range content.Files {
+		assert.NotEqual(t, "notes.txt", file.Name)
+	}
+
+	_, err = listFiles(dir, "missing", nil)
+	assert.Error(t, err)
+}
+
 func TestAddTrailingSlash(t *testing.T) {
 	assert.Equal(t, "/path/", AddTrailingSlash("/path"))
 	assert.Equal(t, "/path/", AddTrailingSlash("/path/"))
@@ -55,3 +84,194 @@ func TestAddSlash(t *testing.T) {
 func TestRemoveDoubleSlashes(t *testing.T) {
 	assert.Equal(t, "/path/to/file", RemoveDoubleSlashes("/path//to///file"))
 }
+
+func TestListFilesPage(t *testing.T) {
+
+	dir, err := os.MkdirTemp("", "testdir")
+	assert.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	for i := 0; i < 25; i++ {
+		name := fmt.Sprintf("file%02d.txt", i)
+		assert.NoError(t, os.WriteFile(dir+"/"+name, []byte("data"), 0644))
+	}
+	assert.NoError(t, os.WriteFile(dir+"/notes.log", []byte("data"), 0644))
+
+	var names []string
+	cursor := ""
+	pages := 0
+	for {
+		content, err := listFilesPage(dir, "", ListOptions{Cursor: cursor, Limit: 10})
+		assert.NoError(t, err)
+		assert.Equal(t, 26, content.Total)
+		assert.LessOrEqual(t, len(content.Files), 10)
+		for _, file := range content.Files {
+			names = append(names, file.Name)
+		}
+		pages++
+		if content.NextCursor == "" {
+			break
+		}
+		cursor = content.NextCursor
+	}
+	assert.Equal(t, 3, pages)
+	assert.Len(t, names, 26)
+	assert.True(t, sort.StringsAreSorted(names))
+
+	match, err := NewNameMatcher(FilterOptions{Extensions: []string{".txt"}})
+	assert.NoError(t, err)
+	content, err := listFilesPage(dir, "", ListOptions{Match: match, Limit: 20})
+	assert.NoError(t, err)
+	assert.Equal(t, 25, content.Total)
+	assert.Len(t, content.Files, 20)
+	assert.NotEmpty(t, content.NextCursor)
+
+	content, err = listFilesPage(dir, "", ListOptions{Match: match, Cursor: content.NextCursor, Limit: 20})
+	assert.NoError(t, err)
+	assert.Len(t, content.Files, 5)
+	assert.Empty(t, content.NextCursor)
+
+	total, err := countFiles(dir, "", match)
+	assert.NoError(t, err)
+	assert.Equal(t, 25, total)
+
+	_, err = listFilesPage(dir, "", ListOptions{Cursor: "%%%", Limit: 10})
+	assert.Error(t, err)
+}
+
+func TestListFilesPageSeesNewEntries(t *testing.T) {
+
+	dir, err := os.MkdirTemp("", "testdir")
+	assert.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	assert.NoError(t, os.WriteFile(dir+"/a", []byte("data"), 0644))
+	content, err := listFilesPage(dir, "", ListOptions{Limit: 1})
+	assert.NoError(t, err)
+	assert.Equal(t, 1, content.Total)
+
+	assert.NoError(t, os.WriteFile(dir+"/b", []byte("data"), 0644))
+	content, err = listFilesPage(dir, "", ListOptions{Cursor: EncodeCursor("a"), Limit: 1})
+	assert.NoError(t, err)
+	assert.Equal(t, 2, content.Total)
+	assert.Len(t, content.Files, 1)
+	assert.Equal(t, "b", content.Files[0].Name)
+}
+
+func TestListFilesFields(t *testing.T) {
+
+	dir, err := os.MkdirTemp("", "testdir")
+	assert.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	assert.NoError(t, os.WriteFile(dir+"/file.txt", []byte("data"), 0644))
+	assert.NoError(t, os.Mkdir(dir+"/folder", 0755))
+	assert.NoError(t, os.Symlink("file.txt", dir+"/link"))
+
+	fields, err := ParseFileFields("type")
+	assert.NoError(t, err)
+	assert.False(t, fields.NeedsStat())
+
+	content, err := listFilesPage(dir, "", ListOptions{Fields: fields})
+	assert.NoError(t, err)
+	types := map[string]string{}
+	for _, file := range content.Files {
+		types[file.Name] = file.Type
+	}
+	assert.Equal(t, map[string]string{"file.txt": "file", "folder": "directory", "link": "symlink"}, types)
+
+	jsonData, err := json.Marshal(content)
+	assert.NoError(t, err)
+	assert.Contains(t, string(jsonData), `{"name":"file.txt","type":"file"}`)
+	assert.NotContains(t, string(jsonData), "size_bytes")
+
+	fields, err = ParseFileFields("size_bytes")
+	assert.NoError(t, err)
+	assert.True(t, fields.NeedsStat())
+	content, err = listFilesPage(dir, "", ListOptions{Fields: fields})
+	assert.NoError(t, err)
+	jsonData, err = json.Marshal(content)
+	assert.NoError(t, err)
+	assert.Contains(t, string(jsonData), `{"name":"file.txt","size_bytes":4}`)
+
+	_, err = ParseFileFields("name,unknown")
+	assert.Error(t, err)
+}
+
+func TestStatFile(t *testing.T) {
+
+	dir, err := os.MkdirTemp("", "testdir")
+	assert.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	assert.NoError(t, os.WriteFile(dir+"/file.txt", []byte("data"), 0644))
+
+	info, err := statFile(dir + "/file.txt")
+	assert.NoError(t, err)
+	assert.Equal(t, "file.txt", info.Name)
+	assert.Equal(t, int64(4), info.SizeBytes)
+	assert.NotEqual(t, uint64(0), info.Inode)
+
+	_, err = statFile(dir + "/missing")
+	assert.Error(t, err)
+}
+
+func createStatTree(b testing.TB, count int) (string, []os.DirEntry) {
+	dir, err := os.MkdirTemp("", "testdir")
+	assert.NoError(b, err)
+	for i := 0; i < count; i++ {
+		assert.NoError(b, os.WriteFile(fmt.Sprintf("%s/file%05d", dir, i), []byte("data"), 0644))
+	}
+	entries, err := os.ReadDir(dir)
+	assert.NoError(b, err)
+	return dir + "/", entries
+}
+
+func TestCollectFileInfos(t *testing.T) {
+
+	dir, entries := createStatTree(t, 200)
+	defer os.RemoveAll(dir)
+
+	assert.NoError(t, os.Remove(dir+"file00100"))
+
+	for _, workers := range []int{1, 8} {
+		infos := collectFileInfos(dir, entries, workers, getFileInfo)
+		assert.Len(t, infos, 199)
+		for i, info := range infos {
+			expected := i
+			if i >= 100 {
+				expected++
+			}
+			assert.Equal(t, fmt.Sprintf("file%05d", expected), info.Name)
+			assert.Equal(t, int64(4), info.SizeBytes)
+		}
+	}
+}
+
+// BenchmarkCollectFileInfos mesure le débit selon le nombre de stat
+// simultanés, sur le disque local puis avec une latence simulée de
+// 200 µs par appel (montage réseau, FUSE, disque froid).
+func BenchmarkCollectFileInfos(b *testing.B) {
+	dir, entries := createStatTree(b, 1000)
+	defer os.RemoveAll(dir)
+
+	slowStat := func(path string, entry os.DirEntry) (FileInfo, error) {
+		time.Sleep(200 * time.Microsecond)
+		return getFileInfo(path, entry)
+	}
+
+	for _, latency := range []string{"local", "200us"} {
+		stat := getFileInfo
+		if latency == "200us" {
+			stat = slowStat
+		}
+		for _, workers := range []int{1, 2, 4, 8, 16, 32, 64} {
+			b.Run(fmt.Sprintf("%s/workers=%d", latency, workers), func(b *testing.B) {
+				for i := 0; i < b.N; i++ {
+					collectFileInfos(dir, entries, workers, stat)
+				}
+				b.ReportMetric(float64(len(entries)*b.N)/b.Elapsed().Seconds(), "stats/s")
+			})
+		}
+	}
+}
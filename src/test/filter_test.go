@@ -3,6 +3,8 @@ package main
 import (
 	"encoding/json"
 	"testing"
+
+	"github.com/stretchr/testify/assert"
 )
 
 func TestFilterFilesByName(t *testing.T) {
@@ -55,3 +57,79 @@ func TestFilterFilesByName(t *testing.T) {
 		})
 	}
 }
+
+func TestNewNameMatcher(t *testing.T) {
+	tests := []struct {
+		name     string
+		opts     FilterOptions
+		accepted []string
+		rejected []string
+	}{
+		{
+			name:     "No criteria",
+			opts:     FilterOptions{},
+			accepted: []string{"anything"},
+		},
+		{
+			name:     "Substring",
+			opts:     FilterOptions{Contains: "Note"},
+			accepted: []string{"notes.txt", "MY_NOTES"},
+			rejected: []string{"report.pdf"},
+		},
+		{
+			name:     "Extension list",
+			opts:     FilterOptions{Extensions: ParseExtensions("png, .JPG,tar.gz")},
+			accepted: []string{"a.png", "b.jpg", "c.TAR.GZ"},
+			rejected: []string{"d.gz", "png"},
+		},
+		{
+			name:     "Glob",
+			opts:     FilterOptions{Glob: "img_??.*"},
+			accepted: []string{"img_01.png", "IMG_42.jpg"},
+			rejected: []string{"img_100.png"},
+		},
+		{
+			name:     "Regex",
+			opts:     FilterOptions{Regex: `^log-\d{4}\.txt$`},
+			accepted: []string{"log-2024.txt", "LOG-2025.TXT"},
+			rejected: []string{"log-24.txt"},
+		},
+		{
+			name:     "Case sensitive",
+			opts:     FilterOptions{Contains: "Note", Extensions: []string{".txt"}, CaseSensitive: true},
+			accepted: []string{"Notes.txt"},
+			rejected: []string{"notes.txt", "Notes.TXT"},
+		},
+		{
+			name:     "Combined criteria",
+			opts:     FilterOptions{Contains: "2024", Glob: "*.log"},
+			accepted: []string{"app-2024.log"},
+			rejected: []string{"app-2024.txt", "app-2023.log"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			match, err := NewNameMatcher(tt.opts)
+			assert.NoError(t, err)
+
+			accepts := func(name string) bool {
+				return match == nil || match(name)
+			}
+			for _, name := range tt.accepted {
+				assert.True(t, accepts(name), name)
+			}
+			for _, name := range tt.rejected {
+				assert.False(t, accepts(name), name)
+			}
+		})
+	}
+}
+
+func TestNewNameMatcherInvalid(t *testing.T) {
+	_, err := NewNameMatcher(FilterOptions{Regex: "("})
+	assert.Error(t, err)
+
+	_, err = NewNameMatcher(FilterOptions{Glob: "["})
+	assert.Error(t, err)
+}
@@ -0,0 +1,87 @@
+package main
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestPartitionIndexRefreshAndQuery(t *testing.T) {
+	dir := createSearchTree(t)
+	defer os.RemoveAll(dir)
+
+	indexFile := filepath.Join(t.TempDir(), "test.gob")
+	idx := NewPartitionIndex("/dev/test", indexFile)
+	assert.Equal(t, "empty", idx.Status().State)
+
+	_, err := idx.Query(IndexQuery{})
+	assert.Error(t, err)
+
+	assert.NoError(t, idx.Refresh(dir))
+	status := idx.Status()
+	assert.Equal(t, "ready", status.State)
+	assert.Equal(t, 4, status.Dirs)
+	assert.Equal(t, 8, status.Files)
+	assert.Equal(t, 4, status.RescannedDirs)
+
+	result, err := idx.Query(IndexQuery{
+		Options:    SearchOptions{Type: "file", MinSize: 10, MaxSize: -1},
+		Sort:       "size",
+		Descending: true,
+	})
+	assert.NoError(t, err)
+	assert.Equal(t, 3, result.Total)
+	assert.Equal(t, "docs/guide.txt", result.Files[0].Path)
+	assert.Equal(t, "readme.txt", result.Files[2].Path)
+
+	result, err = idx.Query(IndexQuery{Options: SearchOptions{MinSize: -1, MaxSize: -1}, Path: "docs/deep", Limit: 2})
+	assert.NoError(t, err)
+	assert.Equal(t, 3, result.Total)
+	assert.Len(t, result.Files, 2)
+	assert.Equal(t, "docs/deep/deeper", result.Files[0].Path)
+}
+
+func TestPartitionIndexIncrementalRefresh(t *testing.T) {
+	dir := createSearchTree(t)
+	defer os.RemoveAll(dir)
+
+	indexFile := filepath.Join(t.TempDir(), "test.gob")
+	idx := NewPartitionIndex("/dev/test", indexFile)
+	assert.NoError(t, idx.Refresh(dir))
+
+	// La date de modification d'un dossier a une précision limitée selon
+	// le système de fichiers : on la force pour garantir le changement.
+	assert.NoError(t, os.WriteFile(filepath.Join(dir, "docs/deep/new.txt"), []byte("new"), 0644))
+	later := time.Now().Add(time.Hour)
+	assert.NoError(t, os.Chtimes(filepath.Join(dir, "docs/deep"), later, later))
+
+	assert.NoError(t, idx.Refresh(dir))
+	status := idx.Status()
+	assert.Equal(t, 1, status.RescannedDirs)
+	assert.Equal(t, 3, status.ReusedDirs)
+	assert.Equal(t, 9, status.Files)
+
+	// Un fichier réécrit sur place ne change pas la date de son dossier,
+	// qui n'est pas relu : sa nouvelle taille est tout de même indexée.
+	assert.NoError(t, os.WriteFile(filepath.Join(dir, "readme.txt"), make([]byte, 5000), 0644))
+	assert.NoError(t, idx.Refresh(dir))
+	assert.Equal(t, 4, idx.Status().ReusedDirs)
+	result, err := idx.Query(IndexQuery{Options: SearchOptions{Type: "file", MinSize: 4000, MaxSize: -1}})
+	assert.NoError(t, err)
+	assert.Equal(t, 1, result.Total)
+	assert.Equal(t, "readme.txt", result.Files[0].Path)
+
+	// L'index est relu depuis le disque par une nouvelle instance.
+	reloaded := NewPartitionIndex("/dev/test", indexFile)
+	assert.Equal(t, "ready", reloaded.Status().State)
+
+	match, err := NewNameMatcher(FilterOptions{Contains: "new"})
+	assert.NoError(t, err)
+	result, err = reloaded.Query(IndexQuery{Options: SearchOptions{Match: match, MinSize: -1, MaxSize: -1}})
+	assert.NoError(t, err)
+	assert.Equal(t, 1, result.Total)
+	assert.Equal(t, "docs/deep/new.txt", result.Files[0].Path)
+}
@@ -0,0 +1,126 @@
+package main
+
+import (
+	"bytes"
+	"math"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"os/exec"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/gin-gonic/gin"
+	"github.com/stretchr/testify/assert"
+)
+
+func metricsText() string {
+	var buffer bytes.Buffer
+	WriteMetrics(&buffer)
+	return buffer.String()
+}
+
+func TestHistogram(t *testing.T) {
+	h := NewHistogram([]float64{0.001, 0.01})
+	h.Observe(500 * time.Microsecond)
+	h.Observe(time.Millisecond)
+	h.Observe(5 * time.Millisecond)
+	h.Observe(time.Second)
+
+	counts, sum := h.Snapshot()
+	assert.Equal(t, []uint64{2, 3, 4}, counts)
+	assert.True(t, math.Abs(sum-1.0065) < 1e-9)
+}
+
+func TestInstrument(t *testing.T) {
+	r := gin.New()
+	r.Use(Instrument())
+	r.GET("/metrics-test/ok", func(c *gin.Context) {
+		c.String(http.StatusOK, "hello")
+	})
+	r.GET("/metrics-test/missing", func(c *gin.Context) {
+		c.JSON(http.StatusNotFound, gin.H{"error": "missing"})
+	})
+	r.GET("/metrics", MetricsHandler)
+
+	for _, path := range []string{"/metrics-test/ok", "/metrics-test/ok", "/metrics-test/missing"} {
+		r.ServeHTTP(httptest.NewRecorder(), httptest.NewRequest("GET", path, nil))
+	}
+
+	recorder := httptest.NewRecorder()
+	r.ServeHTTP(recorder, httptest.NewRequest("GET", "/metrics", nil))
+	assert.Equal(t, http.StatusOK, recorder.Code)
+	assert.True(t, strings.HasPrefix(recorder.Header().Get("Content-Type"), "text/plain; version=0.0.4"))
+
+	body := recorder.Body.String()
+	assert.Contains(t, body, `partition_api_http_requests_total{method="GET",route="/metrics-test/ok",code="2xx"} 2`+"\n")
+	assert.Contains(t, body, `partition_api_http_requests_total{method="GET",route="/metrics-test/missing",code="4xx"} 1`+"\n")
+	assert.Contains(t, body, `partition_api_http_response_bytes_total{method="GET",route="/metrics-test/ok"} 10`+"\n")
+	assert.Contains(t, body, `partition_api_http_request_duration_seconds_count{method="GET",route="/metrics-test/ok"} 2`+"\n")
+	assert.Contains(t, body, `partition_api_http_request_duration_seconds_bucket{method="GET",route="/metrics-test/ok",le="+Inf"} 2`+"\n")
+	// La requête /metrics est encore en cours pendant son export.
+	assert.Contains(t, body, "partition_api_http_requests_in_flight 1\n")
+	assert.Contains(t, body, "# TYPE partition_api_http_request_duration_seconds histogram\n")
+}
+
+func TestFsMetrics(t *testing.T) {
+	dir, err := os.MkdirTemp("", "testdir")
+	assert.NoError(t, err)
+	defer os.RemoveAll(dir)
+	assert.NoError(t, os.WriteFile(dir+"/a.txt", []byte("a"), 0644))
+
+	readDirs := fsRead.Duration
+	before, _ := readDirs.Snapshot()
+	errorsBefore := fsLstat.Errors.Load()
+
+	_, err = listFiles(dir, "", nil)
+	assert.NoError(t, err)
+	_, err = statFile(dir + "/missing")
+	assert.Error(t, err)
+
+	after, _ := readDirs.Snapshot()
+	assert.Equal(t, before[len(before)-1]+1, after[len(after)-1])
+	assert.Equal(t, errorsBefore+1, fsLstat.Errors.Load())
+	assert.Contains(t, metricsText(), `partition_api_fs_operation_duration_seconds_count{op="readdir"}`)
+}
+
+func TestCacheMetrics(t *testing.T) {
+	dir, err := os.MkdirTemp("", "testdir")
+	assert.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	hits, misses := dirCacheStats.hits.Load(), dirCacheStats.misses.Load()
+	_, err = readDirCached(dir)
+	assert.NoError(t, err)
+	_, err = readDirCached(dir)
+	assert.NoError(t, err)
+	assert.Equal(t, hits+1, dirCacheStats.hits.Load())
+	assert.Equal(t, misses+1, dirCacheStats.misses.Load())
+
+	text := metricsText()
+	assert.Contains(t, text, `partition_api_cache_requests_total{cache="dir",result="hit"}`)
+	assert.Contains(t, text, `partition_api_cache_hit_ratio{cache="dir"}`)
+}
+
+func TestCommandOutput(t *testing.T) {
+	if _, err := exec.LookPath("false"); err != nil {
+		t.Skip("commande false absente")
+	}
+
+	out, err := commandOutput(exec.Command("echo", "ok"), false)
+	assert.NoError(t, err)
+	assert.Equal(t, "ok\n", string(out))
+
+	_, err = commandOutput(exec.Command("false"), true)
+	assert.Error(t, err)
+
+	text := metricsText()
+	assert.Contains(t, text, `partition_api_subprocess_duration_seconds_count{command="echo"} 1`+"\n")
+	assert.Contains(t, text, `partition_api_subprocess_errors_total{command="false"} 1`+"\n")
+}
+
+func TestLabels(t *testing.T) {
+	assert.Equal(t, `{op="stat"}`, labels("op", "stat"))
+	assert.Equal(t, `{a="x\"y",b="1\\2\n"}`, labels("a", `x"y`, "b", "1\\2\n"))
+}
@@ -0,0 +1,69 @@
+package main
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+const testMountInfo = `22 1 8:2 / / rw,relatime shared:1 - ext4 /dev/sda2 rw
+25 22 8:1 / /boot/efi rw,relatime shared:2 - vfat /dev/sda1 rw
+26 22 8:17 / /media/USB\040KEY rw,nosuid master:3 - exfat /dev/sdb1 rw
+27 22 8:17 /sub /mnt/again rw - exfat /dev/sdb1 rw
+28 22 0:23 / /sys rw,nosuid - sysfs sysfs rw
+malformed line
+`
+
+func TestParseMountInfo(t *testing.T) {
+	entries := ParseMountInfo([]byte(testMountInfo))
+	assert.Len(t, entries, 5)
+
+	assert.Equal(t, MountEntry{Device: "/dev/sda2", MountPoint: "/", FSType: "ext4", Options: "rw,relatime"}, entries[0])
+	assert.Equal(t, "/media/USB KEY", entries[2].MountPoint)
+	assert.Equal(t, "exfat", entries[2].FSType)
+	assert.Equal(t, "sysfs", entries[4].Device)
+}
+
+func TestMountTableLookup(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "mountinfo")
+	assert.NoError(t, os.WriteFile(path, []byte(testMountInfo), 0644))
+
+	table := NewMountTable(path)
+	entry, ok, err := table.Lookup("/dev/sdb1")
+	assert.NoError(t, err)
+	assert.True(t, ok)
+	assert.Equal(t, "/media/USB KEY", entry.MountPoint)
+
+	_, ok, err = table.Lookup("/dev/sdc1")
+	assert.NoError(t, err)
+	assert.False(t, ok)
+
+	// Sans surveillance, chaque accès relit la table.
+	version := table.Version()
+	assert.NoError(t, os.WriteFile(path, []byte("30 1 8:33 / /data rw - ext4 /dev/sdc1 rw\n"), 0644))
+	entry, ok, err = table.Lookup("/dev/sdc1")
+	assert.NoError(t, err)
+	assert.True(t, ok)
+	assert.Equal(t, "/data", entry.MountPoint)
+	assert.Greater(t, table.Version(), version)
+
+	assert.True(t, table.Accessible(t.TempDir()))
+	assert.False(t, table.Accessible("/does/not/exist"))
+}
+
+func TestMountTableWatch(t *testing.T) {
+	table := NewMountTable(MountInfoPath)
+	assert.NoError(t, table.Watch())
+
+	version := table.Version()
+	entries, err := table.Entries()
+	assert.NoError(t, err)
+	assert.NotEmpty(t, entries)
+
+	// La table surveillée n'est pas relue tant que rien ne change.
+	_, _, err = table.Lookup("/dev/none")
+	assert.NoError(t, err)
+	assert.Equal(t, version, table.Version())
+}
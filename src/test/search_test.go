@@ -0,0 +1,96 @@
+package main
+
+import (
+	"context"
+	"os"
+	"path/filepath"
+	"sort"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func createSearchTree(t *testing.T) string {
+	dir, err := os.MkdirTemp("", "searchdir")
+	assert.NoError(t, err)
+
+	files := map[string]int{
+		"readme.txt":            10,
+		"docs/guide.txt":        2048,
+		"docs/image.png":        100,
+		"docs/deep/notes.txt":   5,
+		"docs/deep/deeper/a.go": 1,
+	}
+	for name, size := range files {
+		path := filepath.Join(dir, name)
+		assert.NoError(t, os.MkdirAll(filepath.Dir(path), 0755))
+		assert.NoError(t, os.WriteFile(path, make([]byte, size), 0644))
+	}
+	return dir
+}
+
+func collectSearch(t *testing.T, dir string, path string, opts SearchOptions) []string {
+	results, err := SearchFiles(context.Background(), dir, path, opts)
+	assert.NoError(t, err)
+
+	var paths []string
+	for result := range results {
+		paths = append(paths, result.Path)
+	}
+	sort.Strings(paths)
+	return paths
+}
+
+func TestSearchFiles(t *testing.T) {
+	dir := createSearchTree(t)
+	defer os.RemoveAll(dir)
+
+	match, err := NewNameMatcher(FilterOptions{Extensions: []string{".txt"}})
+	assert.NoError(t, err)
+
+	all := SearchOptions{MinSize: -1, MaxSize: -1, Workers: 2}
+
+	opts := all
+	opts.Match = match
+	assert.Equal(t, []string{"docs/deep/notes.txt", "docs/guide.txt", "readme.txt"}, collectSearch(t, dir, "", opts))
+
+	opts.MinSize = 1000
+	assert.Equal(t, []string{"docs/guide.txt"}, collectSearch(t, dir, "", opts))
+
+	opts = all
+	opts.Type = "directory"
+	assert.Equal(t, []string{"docs/deep", "docs/deep/deeper"}, collectSearch(t, dir, "docs", opts))
+
+	opts = all
+	opts.MaxDepth = 1
+	assert.Equal(t, []string{"docs/deep", "docs/guide.txt", "docs/image.png"}, collectSearch(t, dir, "docs", opts))
+}
+
+func TestSearchFilesCancel(t *testing.T) {
+	dir := createSearchTree(t)
+	defer os.RemoveAll(dir)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	results, err := SearchFiles(ctx, dir, "", SearchOptions{MinSize: -1, MaxSize: -1})
+	assert.NoError(t, err)
+	for range results {
+	}
+
+	_, err = SearchFiles(context.Background(), dir, "missing", SearchOptions{})
+	assert.Error(t, err)
+}
+
+func TestParseSearchDate(t *testing.T) {
+	date, err := ParseSearchDate("2024-01-02")
+	assert.NoError(t, err)
+	assert.Equal(t, "2024-01-02 00:00:00", date)
+
+	date, err = ParseSearchDate("2024-01-02 10:11:12")
+	assert.NoError(t, err)
+	assert.Equal(t, "2024-01-02 10:11:12", date)
+
+	_, err = ParseSearchDate("02/01/2024")
+	assert.Error(t, err)
+}
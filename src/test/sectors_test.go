@@ -0,0 +1,152 @@
+package main
+
+import (
+	"encoding/hex"
+	"net/http/httptest"
+	"os"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+// createImage écrit une image de size octets dont chaque octet vaut son
+// numéro de secteur de 512 octets (modulo 256), dans un dossier d'images
+// autorisé.
+func createImage(t *testing.T, size int) string {
+	t.Setenv("DISK_IMAGE_DIR", os.TempDir())
+	return createPatternFile(t, size, DefaultImageSectorSize)
+}
+
+func TestValidSectorSize(t *testing.T) {
+	assert.True(t, ValidSectorSize(512))
+	assert.True(t, ValidSectorSize(4096))
+	assert.False(t, ValidSectorSize(256))
+	assert.False(t, ValidSectorSize(1000))
+	assert.False(t, ValidSectorSize(128*1024))
+}
+
+func TestImageSectorSource(t *testing.T) {
+	path := createImage(t, 3*512+100)
+	defer os.Remove(path)
+
+	source, err := ImageSectorSource(path, 0)
+	assert.NoError(t, err)
+	assert.Equal(t, DefaultImageSectorSize, source.SectorSize)
+	assert.Equal(t, int64(4), source.TotalSectors())
+
+	source, err = ImageSectorSource(path, 4096)
+	assert.NoError(t, err)
+	assert.Equal(t, 4096, source.PhysicalSectorSize)
+	assert.Equal(t, int64(1), source.TotalSectors())
+
+	_, err = ImageSectorSource("relative.img", 0)
+	assert.Error(t, err)
+	_, err = ImageSectorSource(os.TempDir(), 0)
+	assert.Error(t, err)
+	_, err = ImageSectorSource(path+".missing", 0)
+	assert.Error(t, err)
+}
+
+func TestImageSectorSourceOutsideImageDir(t *testing.T) {
+	path := createImage(t, 512)
+	defer os.Remove(path)
+
+	// Les fichiers hors du dossier des images sont refusés, y compris par
+	// un lien symbolique placé dans ce dossier.
+	_, err := ImageSectorSource("/etc/passwd", 0)
+	assert.Error(t, err)
+
+	link := path + ".link"
+	assert.NoError(t, os.Symlink("/etc/passwd", link))
+	defer os.Remove(link)
+	_, err = ImageSectorSource(link, 0)
+	assert.Error(t, err)
+
+	t.Setenv("DISK_IMAGE_DIR", "")
+	_, err = ImageSectorSource(path, 0)
+	assert.Error(t, err)
+}
+
+func TestGenerateSectorPage(t *testing.T) {
+	path := createImage(t, 3*512+100)
+	defer os.Remove(path)
+	source, err := ImageSectorSource(path, 0)
+	assert.NoError(t, err)
+
+	page, err := GenerateSectorPage(source, 1, 2)
+	assert.NoError(t, err)
+	assert.Equal(t, 2, page.Count)
+	assert.Equal(t, int64(4), page.TotalSectors)
+	assert.Equal(t, strings.Repeat("01", 512), page.Sectors[1])
+	assert.Equal(t, strings.Repeat("02", 512), page.Sectors[2])
+
+	// Le dernier secteur est incomplet ; au-delà de la fin, rien n'est lu.
+	page, err = GenerateSectorPage(source, 3, 10)
+	assert.NoError(t, err)
+	assert.Equal(t, 1, page.Count)
+	assert.Equal(t, 200, len(page.Sectors[3]))
+
+	page, err = GenerateSectorPage(source, 4, 1)
+	assert.NoError(t, err)
+	assert.Equal(t, 0, page.Count)
+	assert.Empty(t, page.Sectors)
+}
+
+func TestGenerateSectorPageHugeOffset(t *testing.T) {
+	path := createImage(t, 3*512)
+	defer os.Remove(path)
+	source, err := ImageSectorSource(path, 0)
+	assert.NoError(t, err)
+
+	// offset * 512 déborde : ni le secteur 1 (2^55 + 1) ni une erreur de
+	// lecture (2^54, position négative) ne doivent en sortir.
+	for _, offset := range []int64{1<<55 + 1, 1<<54 + 1, 1 << 62} {
+		page, err := GenerateSectorPage(source, offset, 2)
+		assert.NoError(t, err)
+		assert.Equal(t, 0, page.Count)
+		assert.Empty(t, page.Sectors)
+
+		recorder := httptest.NewRecorder()
+		assert.NoError(t, ServeRawSectors(recorder, source, offset, 2))
+		assert.Equal(t, "0", recorder.Header().Get("X-Sector-Count"))
+		assert.Equal(t, 0, recorder.Body.Len())
+	}
+}
+
+func TestReadSectorsLimit(t *testing.T) {
+	path := createImage(t, 2*MaxSectorBytes)
+	defer os.Remove(path)
+	source, err := ImageSectorSource(path, 0)
+	assert.NoError(t, err)
+
+	err = ReadSectors(source, 0, 1<<20, func(data []byte) error {
+		assert.Equal(t, MaxSectorBytes, len(data))
+		return nil
+	})
+	assert.NoError(t, err)
+}
+
+func TestServeRawSectors(t *testing.T) {
+	path := createImage(t, 16*512)
+	defer os.Remove(path)
+	source, err := ImageSectorSource(path, 4096)
+	assert.NoError(t, err)
+
+	recorder := httptest.NewRecorder()
+	assert.NoError(t, ServeRawSectors(recorder, source, 1, 1))
+	assert.Equal(t, "application/octet-stream", recorder.Header().Get("Content-Type"))
+	assert.Equal(t, "4096", recorder.Header().Get("X-Sector-Size"))
+	assert.Equal(t, "2", recorder.Header().Get("X-Total-Sectors"))
+	assert.Equal(t, "1", recorder.Header().Get("X-Sector-Count"))
+
+	body := recorder.Body.Bytes()
+	assert.Equal(t, 4096, len(body))
+	assert.Equal(t, "08", hex.EncodeToString(body[:1]))
+	assert.Equal(t, "0f", hex.EncodeToString(body[4095:]))
+}
+
+func TestDeviceSectorSource(t *testing.T) {
+	_, err := DeviceSectorSource("not-a-device", 0)
+	assert.Error(t, err)
+}
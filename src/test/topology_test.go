@@ -0,0 +1,118 @@
+package main
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func writeSysFile(t *testing.T, root string, path string, content string) {
+	full := filepath.Join(root, path)
+	assert.NoError(t, os.MkdirAll(filepath.Dir(full), 0755))
+	assert.NoError(t, os.WriteFile(full, []byte(content+"\n"), 0644))
+}
+
+func createFakeSysfs(t *testing.T) (string, string) {
+	root := t.TempDir()
+	sys := filepath.Join(root, "sys")
+	udev := filepath.Join(root, "udev")
+
+	writeSysFile(t, sys, "block/sda/dev", "8:0")
+	writeSysFile(t, sys, "block/sda/size", "2097152")
+	writeSysFile(t, sys, "block/sda/removable", "1")
+	writeSysFile(t, sys, "block/sda/queue/logical_block_size", "512")
+	writeSysFile(t, sys, "block/sda/queue/physical_block_size", "4096")
+	assert.NoError(t, os.MkdirAll(filepath.Join(sys, "block/sda/device"), 0755))
+
+	writeSysFile(t, sys, "block/sda/sda1/dev", "8:1")
+	writeSysFile(t, sys, "block/sda/sda1/size", "1024000")
+	writeSysFile(t, sys, "block/sda/sda1/partition", "1")
+	writeSysFile(t, sys, "block/sda/sda2/dev", "8:2")
+	writeSysFile(t, sys, "block/sda/sda2/size", "1071104")
+	writeSysFile(t, sys, "block/sda/sda2/partition", "2")
+
+	writeSysFile(t, sys, "block/loop0/dev", "7:0")
+	writeSysFile(t, sys, "block/loop0/size", "2048")
+	writeSysFile(t, sys, "block/loop0/queue/logical_block_size", "512")
+
+	writeSysFile(t, udev, "b8:1", "S:disk/by-uuid/1234-ABCD\nE:ID_FS_TYPE=vfat\nE:ID_FS_UUID=1234-ABCD\nE:ID_PART_ENTRY_TYPE=C12A7328-F81F-11D2-BA4B-00A0C93EC93B")
+	writeSysFile(t, udev, "b8:2", "E:ID_FS_TYPE=ext4\nE:ID_PART_ENTRY_TYPE=0x83")
+
+	return sys, udev
+}
+
+func TestTopologyProvider(t *testing.T) {
+	sys, udev := createFakeSysfs(t)
+	provider := NewTopologyProvider(sys, udev)
+
+	topo, err := provider.Get()
+	assert.NoError(t, err)
+	assert.Len(t, topo.Disks, 2)
+
+	disk, ok := topo.Device("/dev/sda")
+	assert.True(t, ok)
+	assert.True(t, disk.Physical)
+	assert.True(t, disk.Removable)
+	assert.Equal(t, uint64(1073741824), disk.SizeBytes)
+	assert.Equal(t, 4096, disk.PhysicalSectorSize)
+	assert.Len(t, disk.Partitions, 2)
+
+	part, ok := topo.Device("sda1")
+	assert.True(t, ok)
+	assert.Equal(t, 1, part.PartNumber)
+	assert.Equal(t, uint64(524288000), part.SizeBytes)
+	assert.Equal(t, "vfat", part.FSType)
+	assert.Equal(t, "1234-ABCD", part.UUID)
+	assert.Equal(t, "EFI System", part.PartTypeName)
+	assert.Equal(t, 512, part.LogicalSectorSize)
+
+	part, _ = topo.Device("sda2")
+	assert.Equal(t, "Linux", part.PartTypeName)
+
+	loop, ok := topo.Device("loop0")
+	assert.True(t, ok)
+	assert.False(t, loop.Physical)
+	assert.Empty(t, loop.Partitions)
+
+	_, ok = topo.Device("sdb")
+	assert.False(t, ok)
+}
+
+func TestTopologyProviderInvalidate(t *testing.T) {
+	sys, udev := createFakeSysfs(t)
+	provider := NewTopologyProvider(sys, udev)
+
+	first, err := provider.Get()
+	assert.NoError(t, err)
+
+	writeSysFile(t, sys, "block/sda/sda3/dev", "8:3")
+	writeSysFile(t, sys, "block/sda/sda3/size", "2048")
+	writeSysFile(t, sys, "block/sda/sda3/partition", "3")
+
+	cached, err := provider.Get()
+	assert.NoError(t, err)
+	assert.True(t, first == cached)
+
+	provider.Invalidate()
+	topo, err := provider.Get()
+	assert.NoError(t, err)
+	disk, _ := topo.Device("sda")
+	assert.Len(t, disk.Partitions, 3)
+}
+
+func TestIsBlockUevent(t *testing.T) {
+	assert.True(t, isBlockUevent([]byte("add@/devices/virtual/block/loop1\x00ACTION=add\x00SUBSYSTEM=block\x00DEVNAME=loop1")))
+	assert.False(t, isBlockUevent([]byte("change@/devices/system/cpu\x00ACTION=change\x00SUBSYSTEM=cpu")))
+}
+
+func TestHumanSize(t *testing.T) {
+	assert.Equal(t, "0B", HumanSize(0))
+	assert.Equal(t, "512B", HumanSize(512))
+	assert.Equal(t, "1K", HumanSize(1024))
+	assert.Equal(t, "1.5K", HumanSize(1536))
+	assert.Equal(t, "500M", HumanSize(524288000))
+	assert.Equal(t, "256G", HumanSize(274877906944))
+	assert.Equal(t, "476.9G", HumanSize(512110190592))
+}
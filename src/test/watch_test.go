@@ -0,0 +1,94 @@
+package main
+
+import (
+	"bytes"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+)
+
+// nextDeltas attend le prochain lot de changements.
+func nextDeltas(t *testing.T, sub *WatchSubscription) map[string]FileDelta {
+	select {
+	case deltas, ok := <-sub.Deltas():
+		if !ok {
+			return nil
+		}
+		byName := map[string]FileDelta{}
+		for _, delta := range deltas {
+			byName[delta.Name] = delta
+		}
+		return byName
+	case <-time.After(5 * time.Second):
+		t.Fatal("aucun changement reçu")
+		return nil
+	}
+}
+
+func TestWatchDir(t *testing.T) {
+	dir, err := os.MkdirTemp("", "watchdir")
+	assert.NoError(t, err)
+	defer os.RemoveAll(dir)
+	assert.NoError(t, os.WriteFile(filepath.Join(dir, "old.txt"), []byte("old"), 0644))
+
+	sub, err := WatchDir(dir)
+	assert.NoError(t, err)
+	defer sub.Close()
+
+	other, err := WatchDir(dir + "/")
+	assert.NoError(t, err)
+	other.Close()
+
+	assert.NoError(t, os.WriteFile(filepath.Join(dir, "new.txt"), []byte("hello"), 0644))
+	assert.NoError(t, os.WriteFile(filepath.Join(dir, "old.txt"), []byte("changed"), 0644))
+	deltas := nextDeltas(t, sub)
+	assert.Equal(t, "add", deltas["new.txt"].Op)
+	assert.Equal(t, int64(5), deltas["new.txt"].File.SizeBytes)
+	assert.Equal(t, "modify", deltas["old.txt"].Op)
+	assert.Equal(t, int64(7), deltas["old.txt"].File.SizeBytes)
+
+	// Un fichier créé puis supprimé dans le même intervalle n'est envoyé
+	// qu'une fois, comme supprimé.
+	assert.NoError(t, os.WriteFile(filepath.Join(dir, "tmp.txt"), nil, 0644))
+	assert.NoError(t, os.Remove(filepath.Join(dir, "tmp.txt")))
+	assert.NoError(t, os.Rename(filepath.Join(dir, "new.txt"), filepath.Join(dir, "renamed.txt")))
+	deltas = nextDeltas(t, sub)
+	assert.Equal(t, "remove", deltas["tmp.txt"].Op)
+	assert.Nil(t, deltas["tmp.txt"].File)
+	assert.Equal(t, "remove", deltas["new.txt"].Op)
+	assert.Equal(t, "add", deltas["renamed.txt"].Op)
+
+	// Les changements des sous-dossiers ne sont pas suivis.
+	assert.NoError(t, os.Mkdir(filepath.Join(dir, "sub"), 0755))
+	deltas = nextDeltas(t, sub)
+	assert.Equal(t, "directory", deltas["sub"].File.Type)
+	assert.NoError(t, os.WriteFile(filepath.Join(dir, "sub", "inner.txt"), nil, 0644))
+
+	assert.NoError(t, os.RemoveAll(dir))
+	for deltas != nil {
+		assert.NotContains(t, deltas, "inner.txt")
+		deltas = nextDeltas(t, sub)
+	}
+}
+
+func TestWatchDirErrors(t *testing.T) {
+	_, err := WatchDir("/nonexistent/watch")
+	assert.Error(t, err)
+
+	file, err := os.CreateTemp("", "watchfile")
+	assert.NoError(t, err)
+	file.Close()
+	defer os.Remove(file.Name())
+
+	_, err = WatchDir(file.Name())
+	assert.Error(t, err)
+}
+
+func TestWriteWatchEvent(t *testing.T) {
+	var buf bytes.Buffer
+	assert.NoError(t, WriteWatchEvent(&buf, "deltas", []FileDelta{{Op: "remove", Name: "a\nb"}}))
+	assert.Equal(t, "event: deltas\ndata: [{\"op\":\"remove\",\"name\":\"a\\nb\"}]\n\n", buf.String())
+}
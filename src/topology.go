@@ -0,0 +1,326 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"bufio"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strconv"
+	"strings"
+	"sync"
+	"syscall"
+	"time"
+)
+
+const (
+	SysRoot      = "/sys"
+	UdevDataRoot = "/run/udev/data"
+
+	// Durée de validité du cache lorsque les événements uevent ne peuvent
+	// pas être écoutés.
+	TopologyFallbackTTL = 2 * time.Second
+)
+
+// Noms des types de partition GPT et MBR les plus courants, tels
+// qu'affichés par lsblk (PARTTYPENAME).
+var partTypeNames = map[string]string{
+	"c12a7328-f81f-11d2-ba4b-00a0c93ec93b": "EFI System",
+	"21686148-6449-6e6f-744e-656564454649": "BIOS boot",
+	"0fc63daf-8483-4772-8e79-3d69d8477de4": "Linux filesystem",
+	"0657fd6d-a4ab-43c4-84e5-0933c84b4f4f": "Linux swap",
+	"e6d6d379-f507-44c2-a23c-238f2a3df928": "Linux LVM",
+	"a19d880f-05fc-4d3b-a006-743f0f84911e": "Linux RAID",
+	"4f68bce3-e8cd-4db1-96e7-fbcaf984b709": "Linux root (x86-64)",
+	"933ac7e1-2eb4-4f13-b844-0e14e2aef915": "Linux home",
+	"ebd0a0a2-b9e5-4433-87c0-68b6b72699c7": "Microsoft basic data",
+	"e3c9e316-0b5c-4db8-817d-f92df00215ae": "Microsoft reserved",
+	"de94bba4-06d1-4d40-a16a-bfd50179d6ac": "Windows recovery environment",
+	"48465300-0000-11aa-aa11-00306543ecac": "Apple HFS/HFS+",
+	"7c3457ef-0000-11aa-aa11-00306543ecac": "Apple APFS",
+	"0x83": "Linux",
+	"0x82": "Linux swap / Solaris",
+	"0x8e": "Linux LVM",
+	"0xfd": "Linux raid autodetect",
+	"0x7":  "HPFS/NTFS/exFAT",
+	"0xb":  "W95 FAT32",
+	"0xc":  "W95 FAT32 (LBA)",
+	"0xe":  "W95 FAT16 (LBA)",
+	"0xef": "EFI (FAT-12/16/32)",
+	"0x5":  "Extended",
+	"0xf":  "W95 Ext'd (LBA)",
+	"0xee": "GPT",
+}
+
+type BlockDevice struct {
+	Name               string
+	Major              int
+	Minor              int
+	SizeBytes          uint64
+	LogicalSectorSize  int
+	PhysicalSectorSize int
+	Removable          bool
+	Physical           bool
+	PartNumber         int
+	FSType             string
+	UUID               string
+	PartTypeName       string
+	Partitions         []*BlockDevice
+}
+
+type Topology struct {
+	Disks   []*BlockDevice
+	devices map[string]*BlockDevice
+}
+
+// Device retourne un disque ou une partition par son nom, avec ou sans
+// préfixe /dev/.
+func (topo *Topology) Device(name string) (*BlockDevice, bool) {
+	device, ok := topo.devices[strings.TrimPrefix(name, "/dev/")]
+	return device, ok
+}
+
+// TopologyProvider lit les disques et partitions dans sysfs et la base
+// udev au lieu d'appeler lsblk. Le résultat est gardé en cache jusqu'au
+// prochain événement uevent du sous-système block.
+type TopologyProvider struct {
+	SysRoot  string
+	UdevRoot string
+
+	mu       sync.Mutex
+	cached   *Topology
+	loadedAt time.Time
+	watching bool
+}
+
+var (
+	topologyOnce sync.Once
+	topology     *TopologyProvider
+)
+
+// Topologies retourne le fournisseur partagé, à l'écoute des uevents dès
+// le premier appel.
+func Topologies() *TopologyProvider {
+	topologyOnce.Do(func() {
+		topology = NewTopologyProvider(SysRoot, UdevDataRoot)
+		if err := topology.Watch(); err != nil {
+			fmt.Println(err)
+		}
+	})
+	return topology
+}
+
+func NewTopologyProvider(sysRoot string, udevRoot string) *TopologyProvider {
+	return &TopologyProvider{SysRoot: sysRoot, UdevRoot: udevRoot}
+}
+
+func (p *TopologyProvider) Invalidate() {
+	p.mu.Lock()
+	p.cached = nil
+	p.mu.Unlock()
+}
+
+// Get retourne la topologie en cache, relue si elle a été invalidée.
+func (p *TopologyProvider) Get() (*Topology, error) {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	if p.cached != nil && (p.watching || time.Since(p.loadedAt) < TopologyFallbackTTL) {
+		topologyCacheStats.Hit()
+		return p.cached, nil
+	}
+	topologyCacheStats.Miss()
+
+	topo, err := p.load()
+	if err != nil {
+		return nil, err
+	}
+	p.cached = topo
+	p.loadedAt = time.Now()
+	return topo, nil
+}
+
+func readSysString(path string) string {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return ""
+	}
+	return strings.TrimSpace(string(data))
+}
+
+func readSysInt(path string) int64 {
+	value, _ := strconv.ParseInt(readSysString(path), 10, 64)
+	return value
+}
+
+func (p *TopologyProvider) load() (*Topology, error) {
+	blockDir := filepath.Join(p.SysRoot, "block")
+	entries, err := os.ReadDir(blockDir)
+	if err != nil {
+		return nil, fmt.Errorf("Erreur lors de la lecture de %s : %v", blockDir, err)
+	}
+
+	topo := &Topology{devices: make(map[string]*BlockDevice)}
+	for _, entry := range entries {
+		diskDir := filepath.Join(blockDir, entry.Name())
+		disk := p.readDevice(entry.Name(), diskDir)
+		disk.LogicalSectorSize = int(readSysInt(filepath.Join(diskDir, "queue", "logical_block_size")))
+		disk.PhysicalSectorSize = int(readSysInt(filepath.Join(diskDir, "queue", "physical_block_size")))
+		disk.Removable = readSysString(filepath.Join(diskDir, "removable")) == "1"
+
+		// Seuls les disques rattachés à un matériel ont un lien "device" ;
+		// loop, zram, ram et dm n'en ont pas.
+		_, err := os.Stat(filepath.Join(diskDir, "device"))
+		disk.Physical = err == nil
+
+		children, _ := os.ReadDir(diskDir)
+		for _, child := range children {
+			partDir := filepath.Join(diskDir, child.Name())
+			if _, err := os.Stat(filepath.Join(partDir, "partition")); err != nil {
+				continue
+			}
+
+			part := p.readDevice(child.Name(), partDir)
+			part.PartNumber = int(readSysInt(filepath.Join(partDir, "partition")))
+			part.LogicalSectorSize = disk.LogicalSectorSize
+			part.PhysicalSectorSize = disk.PhysicalSectorSize
+			part.Removable = disk.Removable
+			part.Physical = disk.Physical
+
+			disk.Partitions = append(disk.Partitions, part)
+			topo.devices[part.Name] = part
+		}
+
+		topo.Disks = append(topo.Disks, disk)
+		topo.devices[disk.Name] = disk
+	}
+
+	return topo, nil
+}
+
+func (p *TopologyProvider) readDevice(name string, dir string) *BlockDevice {
+	device := &BlockDevice{
+		Name: name,
+		// La taille est toujours exprimée en secteurs de 512 octets.
+		SizeBytes: uint64(readSysInt(filepath.Join(dir, "size"))) * 512,
+	}
+
+	if dev := readSysString(filepath.Join(dir, "dev")); dev != "" {
+		fmt.Sscanf(dev, "%d:%d", &device.Major, &device.Minor)
+		p.readUdev(device)
+	}
+	return device
+}
+
+// readUdev complète le périphérique avec la base udev
+// (/run/udev/data/b<majeur>:<mineur>, lignes "E:CLE=valeur").
+func (p *TopologyProvider) readUdev(device *BlockDevice) {
+	file, err := os.Open(filepath.Join(p.UdevRoot, fmt.Sprintf("b%d:%d", device.Major, device.Minor)))
+	if err != nil {
+		return
+	}
+	defer file.Close()
+
+	scanner := bufio.NewScanner(file)
+	for scanner.Scan() {
+		line, isProperty := strings.CutPrefix(scanner.Text(), "E:")
+		key, value, ok := strings.Cut(line, "=")
+		if !isProperty || !ok {
+			continue
+		}
+		switch key {
+		case "ID_FS_TYPE":
+			device.FSType = value
+		case "ID_FS_UUID":
+			device.UUID = value
+		case "ID_PART_ENTRY_TYPE":
+			device.PartTypeName = partTypeNames[strings.ToLower(value)]
+		}
+	}
+}
+
+// Watch invalide le cache à chaque uevent du sous-système block (ajout,
+// retrait ou modification d'un disque ou d'une partition). Les messages du
+// noyau et ceux d'udev, émis une fois sa base mise à jour, sont écoutés.
+func (p *TopologyProvider) Watch() error {
+	fd, err := syscall.Socket(syscall.AF_NETLINK, syscall.SOCK_DGRAM|syscall.SOCK_CLOEXEC, syscall.NETLINK_KOBJECT_UEVENT)
+	if err != nil {
+		return fmt.Errorf("Impossible d'écouter les uevents : %v", err)
+	}
+
+	addr := &syscall.SockaddrNetlink{Family: syscall.AF_NETLINK, Groups: 1 | 2}
+	if err := syscall.Bind(fd, addr); err != nil {
+		syscall.Close(fd)
+		return fmt.Errorf("Impossible d'écouter les uevents : %v", err)
+	}
+
+	p.mu.Lock()
+	p.watching = true
+	p.mu.Unlock()
+
+	go func() {
+		buf := make([]byte, 64*1024)
+		for {
+			n, _, err := syscall.Recvfrom(fd, buf, 0)
+			if err == syscall.EINTR {
+				continue
+			}
+			if err != nil {
+				fmt.Println("Écoute des uevents interrompue :", err)
+				p.mu.Lock()
+				p.watching = false
+				p.mu.Unlock()
+				return
+			}
+			if isBlockUevent(buf[:n]) {
+				p.Invalidate()
+			}
+		}
+	}()
+
+	return nil
+}
+
+func isBlockUevent(message []byte) bool {
+	for _, field := range strings.Split(string(message), "\x00") {
+		if field == "SUBSYSTEM=block" {
+			return true
+		}
+	}
+	return false
+}
+
+// HumanSize formate une taille comme lsblk : 1024 -> "1K", 1536 -> "1.5K".
+func HumanSize(bytes uint64) string {
+	const units = "BKMGTPE"
+
+	exp := 0
+	for exp < len(units)-1 && bytes >= uint64(1)<<(10*(exp+1)) {
+		exp++
+	}
+	if exp == 0 {
+		return fmt.Sprintf("%dB", bytes)
+	}
+
+	value := float64(bytes) / float64(uint64(1)<<(10*exp))
+	text := strings.TrimSuffix(strconv.FormatFloat(value, 'f', 1, 64), ".0")
+	return text + string(units[exp])
+}
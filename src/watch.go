@@ -0,0 +1,334 @@
+// ============================================================================
+// ENSICAEN
+// 6 Boulevard Maréchal Juin
+// F-14050 Caen Cedex
+//
+// Projet 2A
+// Investigation de Partition HFS+ et Ext4 en Go
+//
+// 2025
+//
+// Auteurs :
+//   - Kalash Abdulaziz (abdulaziz.kalash@ecole.ensicaen.fr)
+//   - Yahya Chikar      (yahya.chikar@ecole.ensicaen.fr)
+//   - Antony Huynh      (antony.huynh@ecole.ensicaen.fr)
+//   - Maelys Sable      (maelys.sable@ecole.ensicaen.fr)
+//   - Yam Pakzad        (yam.pakzad@ecole.ensicaen.fr)
+// ============================================================================
+
+
+package main
+
+import (
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"sort"
+	"sync"
+	"syscall"
+	"time"
+	"unsafe"
+)
+
+// WatchCoalesceDelay regroupe les événements reçus pour un dossier : un
+// fichier écrit en continu ne produit qu'un changement par intervalle.
+const WatchCoalesceDelay = 200 * time.Millisecond
+
+// WatchHeartbeatInterval est l'intervalle des commentaires envoyés sur un
+// flux /watch inactif, qui permettent de détecter une connexion coupée.
+const WatchHeartbeatInterval = 5 * time.Second
+
+// WatchQueueSize est le nombre de lots de changements en attente pour un
+// abonné ; au-delà, l'abonné reçoit "reset" et doit relire le dossier.
+const WatchQueueSize = 64
+
+const watchMask = syscall.IN_CREATE | syscall.IN_DELETE | syscall.IN_MOVED_FROM |
+	syscall.IN_MOVED_TO | syscall.IN_MODIFY | syscall.IN_CLOSE_WRITE | syscall.IN_ATTRIB |
+	syscall.IN_DELETE_SELF | syscall.IN_MOVE_SELF | syscall.IN_ONLYDIR
+
+// watchGoneMask signale que le dossier surveillé n'existe plus à cet
+// emplacement (supprimé, déplacé ou démonté).
+const watchGoneMask = syscall.IN_DELETE_SELF | syscall.IN_MOVE_SELF |
+	syscall.IN_IGNORED | syscall.IN_UNMOUNT
+
+// FileDelta est un changement d'une entrée d'un dossier surveillé : "add",
+// "modify" ou "remove". File est la fiche à jour, absente pour "remove".
+type FileDelta struct {
+	Op   string    `json:"op"`
+	Name string    `json:"name"`
+	File *FileInfo `json:"file,omitempty"`
+}
+
+// WatchSubscription reçoit les changements d'un dossier.
+type WatchSubscription struct {
+	deltas chan []FileDelta
+	reset  chan struct{}
+	dir    *watchedDir
+}
+
+// Deltas reçoit les changements par lots. Le canal est fermé si le dossier
+// disparaît.
+func (sub *WatchSubscription) Deltas() <-chan []FileDelta {
+	return sub.deltas
+}
+
+// Reset est signalé quand des changements ont été perdus : le dossier doit
+// être relu.
+func (sub *WatchSubscription) Reset() <-chan struct{} {
+	return sub.reset
+}
+
+func (sub *WatchSubscription) signalReset() {
+	select {
+	case sub.reset <- struct{}{}:
+	default:
+	}
+}
+
+// watchedDir est un watch inotify, partagé par tous les abonnés du dossier.
+type watchedDir struct {
+	wd   int32
+	path string
+	subs map[*WatchSubscription]struct{}
+
+	// pending associe le nom d'une entrée aux événements reçus depuis le
+	// dernier envoi ; scheduled indique qu'un envoi est programmé.
+	pending   map[string]uint32
+	scheduled bool
+}
+
+type watchHub struct {
+	mu   sync.Mutex
+	fd   int
+	dirs map[string]*watchedDir
+	byWd map[int32]*watchedDir
+}
+
+var (
+	watchHubOnce     sync.Once
+	watchHubInstance *watchHub
+	watchHubErr      error
+)
+
+// getWatchHub ouvre l'instance inotify du serveur au premier abonnement.
+func getWatchHub() (*watchHub, error) {
+	watchHubOnce.Do(func() {
+		fd, err := syscall.InotifyInit1(syscall.IN_CLOEXEC)
+		if err != nil {
+			watchHubErr = fmt.Errorf("inotify indisponible : %v", err)
+			return
+		}
+		watchHubInstance = &watchHub{
+			fd:   fd,
+			dirs: make(map[string]*watchedDir),
+			byWd: make(map[int32]*watchedDir),
+		}
+		go watchHubInstance.read()
+	})
+	return watchHubInstance, watchHubErr
+}
+
+// WatchDir s'abonne aux changements des entrées du dossier dirPath, sans
+// ses sous-dossiers. Un seul watch inotify est posé par dossier quel que
+// soit le nombre d'abonnés ; il est retiré avec le dernier.
+func WatchDir(dirPath string) (*WatchSubscription, error) {
+	hub, err := getWatchHub()
+	if err != nil {
+		return nil, err
+	}
+	dirPath = filepath.Clean(dirPath)
+
+	hub.mu.Lock()
+	defer hub.mu.Unlock()
+
+	dir := hub.dirs[dirPath]
+	if dir == nil {
+		wd, err := syscall.InotifyAddWatch(hub.fd, dirPath, watchMask)
+		switch {
+		case err == syscall.ENOENT:
+			return nil, fmt.Errorf("Le dossier %s n'existe pas", dirPath)
+		case err == syscall.ENOTDIR:
+			return nil, fmt.Errorf("%s n'est pas un dossier", dirPath)
+		case err == syscall.ENOSPC:
+			return nil, fmt.Errorf("Trop de dossiers surveillés (fs.inotify.max_user_watches)")
+		case err != nil:
+			return nil, fmt.Errorf("Impossible de surveiller %s : %v", dirPath, err)
+		}
+
+		// Un même dossier atteint par deux chemins (montage bind) partage
+		// son watch.
+		if dir = hub.byWd[int32(wd)]; dir == nil {
+			dir = &watchedDir{
+				wd:      int32(wd),
+				path:    dirPath,
+				subs:    make(map[*WatchSubscription]struct{}),
+				pending: make(map[string]uint32),
+			}
+			hub.byWd[dir.wd] = dir
+			hub.dirs[dirPath] = dir
+		}
+	}
+
+	sub := &WatchSubscription{
+		deltas: make(chan []FileDelta, WatchQueueSize),
+		reset:  make(chan struct{}, 1),
+		dir:    dir,
+	}
+	dir.subs[sub] = struct{}{}
+	return sub, nil
+}
+
+// Close met fin à l'abonnement.
+func (sub *WatchSubscription) Close() {
+	hub := watchHubInstance
+	hub.mu.Lock()
+	defer hub.mu.Unlock()
+
+	dir := sub.dir
+	if _, ok := dir.subs[sub]; !ok {
+		return
+	}
+	delete(dir.subs, sub)
+	if len(dir.subs) == 0 {
+		hub.forget(dir)
+		syscall.InotifyRmWatch(hub.fd, uint32(dir.wd))
+	}
+}
+
+func (hub *watchHub) forget(dir *watchedDir) {
+	delete(hub.byWd, dir.wd)
+	if hub.dirs[dir.path] == dir {
+		delete(hub.dirs, dir.path)
+	}
+}
+
+// read lit les événements inotify pendant toute la vie du serveur.
+func (hub *watchHub) read() {
+	buf := make([]byte, 64*1024)
+	for {
+		n, err := syscall.Read(hub.fd, buf)
+		if err == syscall.EINTR {
+			continue
+		}
+		if err != nil || n <= 0 {
+			return
+		}
+
+		hub.mu.Lock()
+		for offset := 0; offset+syscall.SizeofInotifyEvent <= n; {
+			event := (*syscall.InotifyEvent)(unsafe.Pointer(&buf[offset]))
+			start := offset + syscall.SizeofInotifyEvent
+			offset = start + int(event.Len)
+			name := string(buf[start:offset])
+			for len(name) > 0 && name[len(name)-1] == 0 {
+				name = name[:len(name)-1]
+			}
+			hub.handle(event.Wd, event.Mask, name)
+		}
+		hub.mu.Unlock()
+	}
+}
+
+// handle est appelé avec hub.mu verrouillé.
+func (hub *watchHub) handle(wd int32, mask uint32, name string) {
+	if mask&syscall.IN_Q_OVERFLOW != 0 {
+		for _, dir := range hub.byWd {
+			for sub := range dir.subs {
+				sub.signalReset()
+			}
+		}
+		return
+	}
+
+	dir := hub.byWd[wd]
+	if dir == nil {
+		return
+	}
+
+	if mask&watchGoneMask != 0 {
+		hub.forget(dir)
+		if mask&syscall.IN_IGNORED == 0 {
+			syscall.InotifyRmWatch(hub.fd, uint32(wd))
+		}
+		for sub := range dir.subs {
+			close(sub.deltas)
+		}
+		dir.subs = make(map[*WatchSubscription]struct{})
+		return
+	}
+
+	// Les événements sans nom concernent le dossier lui-même.
+	if name == "" {
+		return
+	}
+	dir.pending[name] |= mask
+	if !dir.scheduled {
+		dir.scheduled = true
+		time.AfterFunc(WatchCoalesceDelay, func() { hub.flush(dir) })
+	}
+}
+
+// flush envoie les changements accumulés d'un dossier. Chaque entrée est
+// stat'ée une seule fois : son état actuel décide de l'opération, ce qui
+// absorbe les suites création/suppression rapides.
+func (hub *watchHub) flush(dir *watchedDir) {
+	hub.mu.Lock()
+	pending := dir.pending
+	dir.pending = make(map[string]uint32)
+	hub.mu.Unlock()
+
+	deltas := make([]FileDelta, 0, len(pending))
+	for name, mask := range pending {
+		info, err := lstatInfo(filepath.Join(dir.path, name))
+		if os.IsNotExist(err) {
+			deltas = append(deltas, FileDelta{Op: "remove", Name: name})
+			continue
+		}
+		if err != nil {
+			continue
+		}
+		file, err := buildFileInfo(filepath.Join(dir.path, name), info)
+		if err != nil {
+			continue
+		}
+
+		op := "modify"
+		if mask&(syscall.IN_CREATE|syscall.IN_MOVED_TO) != 0 {
+			op = "add"
+		}
+		deltas = append(deltas, FileDelta{Op: op, Name: name, File: &file})
+	}
+	sort.Slice(deltas, func(i, j int) bool { return deltas[i].Name < deltas[j].Name })
+
+	hub.mu.Lock()
+	defer hub.mu.Unlock()
+	if len(deltas) > 0 {
+		for sub := range dir.subs {
+			select {
+			case sub.deltas <- deltas:
+			default:
+				sub.signalReset()
+			}
+		}
+	}
+
+	// Les événements arrivés pendant l'envoi partent au tour suivant : un
+	// seul envoi à la fois par dossier garde les lots dans l'ordre.
+	if len(dir.pending) > 0 {
+		time.AfterFunc(WatchCoalesceDelay, func() { hub.flush(dir) })
+	} else {
+		dir.scheduled = false
+	}
+}
+
+// WriteWatchEvent écrit un événement server-sent events.
+func WriteWatchEvent(w io.Writer, event string, data interface{}) error {
+	payload, err := json.Marshal(data)
+	if err != nil {
+		return err
+	}
+	_, err = fmt.Fprintf(w, "event: %s\ndata: %s\n\n", event, payload)
+	return err
+}